@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCHMARKS_DIR)
+DEFAULT_BASELINE = os.path.join(
+    BENCHMARKS_DIR, "baselines", "hot_paths.json"
+)
+DEFAULT_SUITE = os.path.join(BENCHMARKS_DIR, "test_hot_paths.py")
+DEFAULT_THRESHOLD = float(
+    os.environ.get("BENCHMARK_REGRESSION_THRESHOLD", "0.10")
+)
+DEFAULT_STAT = "median"
+
+
+def run_suite(suite: str, sizes: Optional[str]) -> Dict[str, Any]:
+    env = dict(os.environ)
+    if sizes:
+        env["BENCHMARK_SIZES"] = sizes
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output = os.path.join(tmp_dir, "benchmark.json")
+        command = [
+            sys.executable,
+            "-m",
+            "pytest",
+            suite,
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "-p",
+            "no:warnings",
+            f"--benchmark-json={output}",
+        ]
+        completed = subprocess.run(command, env=env, cwd=PROJECT_ROOT)
+        if completed.returncode != 0:
+            raise SystemExit(completed.returncode)
+
+        with open(output, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+def summarize(raw: Dict[str, Any]) -> Dict[str, Any]:
+    benchmarks = {}
+    for bench in raw.get("benchmarks", []):
+        stats = bench["stats"]
+        benchmarks[bench["name"]] = {
+            "min": stats["min"],
+            "median": stats["median"],
+            "mean": stats["mean"],
+            "rounds": stats["rounds"],
+        }
+
+    machine = raw.get("machine_info", {})
+    return {
+        "machine_info": {
+            "python_version": machine.get("python_version"),
+            "cpu": machine.get("cpu", {}).get("brand_raw"),
+            "system": machine.get("system"),
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+    stat: str,
+) -> List[str]:
+    regressions = []
+    baseline_benchmarks = baseline.get("benchmarks", {})
+
+    print(
+        f"{'benchmark':<55} {'baseline':>10} {'current':>10} {'change':>8}"
+    )
+    for name, stats in sorted(current["benchmarks"].items()):
+        reference = baseline_benchmarks.get(name)
+        if reference is None:
+            print(
+                f"{name:<55} {'-':>10} {stats[stat]:>10.4f} "
+                f"{'-':>8} NO BASELINE"
+            )
+            regressions.append(name)
+            continue
+
+        change = stats[stat] / reference[stat] - 1
+        marker = ""
+        if change > threshold:
+            marker = " REGRESSION"
+            regressions.append(name)
+        print(
+            f"{name:<55} {reference[stat]:>10.4f} {stats[stat]:>10.4f} "
+            f"{change:>+7.1%}{marker}"
+        )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run the hot path benchmarks and compare to baseline"
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--suite", default=DEFAULT_SUITE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown as a fraction, e.g. 0.10 for 10%%",
+    )
+    parser.add_argument(
+        "--stat", default=DEFAULT_STAT, choices=["min", "median", "mean"]
+    )
+    parser.add_argument(
+        "--sizes", help="Comma separated dataset sizes, e.g. 1000,100000"
+    )
+    parser.add_argument(
+        "--json", help="Compare an existing pytest-benchmark JSON file"
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Write the current results as the new baseline",
+    )
+    args = parser.parse_args(argv)
+
+    if args.json:
+        with open(args.json, "r", encoding="utf-8") as f:
+            current = summarize(json.load(f))
+    else:
+        current = summarize(run_suite(args.suite, args.sizes))
+
+    if args.update:
+        baseline = {"benchmarks": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline["machine_info"] = current["machine_info"]
+        baseline["benchmarks"].update(current["benchmarks"])
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare(baseline, current, args.threshold, args.stat)
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) regressed by more than "
+            f"{args.threshold:.0%} or have no baseline (refresh it with "
+            f"--update): {regressions}"
+        )
+        return 1
+
+    print(f"No regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+DEFAULT_SIZES = "1000,100000,1000000"
+
+
+def benchmark_sizes():
+    raw = os.environ.get("BENCHMARK_SIZES", DEFAULT_SIZES)
+    return [int(size) for size in raw.split(",") if size.strip()]
+
+
+def rounds_for(size: int) -> int:
+    if size <= 1000:
+        return 20
+    if size <= 100000:
+        return 3
+    return 1
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = benchmark_sizes()
+        metafunc.parametrize(
+            "size", sizes, ids=[f"n{size}" for size in sizes]
+        )
+
+
+@pytest.fixture
+def run_benchmark(benchmark, size):
+    def run(func, *args):
+        return benchmark.pedantic(
+            func,
+            args=args,
+            rounds=rounds_for(size),
+            iterations=1,
+            warmup_rounds=1 if size <= 1000 else 0,
+        )
+
+    return run
@@ -0,0 +1,267 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from airflow.listeners import hookimpl
+from compare import PROJECT_ROOT
+
+sys.path.insert(0, PROJECT_ROOT)
+
+from mock_api.server import MockAnimalsAPI
+
+DAG_ID = "animal_etl_pipeline_v3"
+DAG_FILE = os.path.join(PROJECT_ROOT, "dags", "animal_etl_dag.py")
+
+
+def _dir_bytes(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class ResourceSampler:
+    def __init__(self, temp_dir: str, interval: float = 0.5):
+        import psutil
+
+        self.temp_dir = temp_dir
+        self.interval = interval
+        self.samples: List[Dict[str, float]] = []
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def sample(self) -> None:
+        self.samples.append(
+            {
+                "time": time.time(),
+                "rss_bytes": self._process.memory_info().rss,
+                "temp_bytes": _dir_bytes(self.temp_dir),
+            }
+        )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self) -> "ResourceSampler":
+        self.sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+    def peaks(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Dict[str, float]:
+        window = [
+            sample
+            for sample in self.samples
+            if (start is None or sample["time"] >= start)
+            and (end is None or sample["time"] <= end)
+        ]
+        if not window:
+            return {"peak_rss_mb": 0.0, "peak_temp_mb": 0.0}
+        return {
+            "peak_rss_mb": round(
+                max(s["rss_bytes"] for s in window) / 1024 / 1024, 1
+            ),
+            "peak_temp_mb": round(
+                max(s["temp_bytes"] for s in window) / 1024 / 1024, 1
+            ),
+        }
+
+
+class TaskTimer:
+    def __init__(self, sampler: ResourceSampler):
+        self.sampler = sampler
+        self.spans: Dict[Tuple[str, int], List[float]] = {}
+
+    def _key(self, task_instance) -> Tuple[str, int]:
+        return task_instance.task_id, task_instance.map_index
+
+    @hookimpl
+    def on_task_instance_running(self, previous_state, task_instance):
+        self.spans[self._key(task_instance)] = [time.time(), 0.0]
+        self.sampler.sample()
+
+    @hookimpl
+    def on_task_instance_success(self, previous_state, task_instance):
+        self.sampler.sample()
+        self.spans[self._key(task_instance)][1] = time.time()
+
+    @hookimpl
+    def on_task_instance_failed(self, previous_state, task_instance):
+        self.sampler.sample()
+        self.spans[self._key(task_instance)][1] = time.time()
+
+
+def _task_report(
+    dag_run, timer: TaskTimer, sampler: ResourceSampler
+) -> List[Dict[str, Any]]:
+    tasks = []
+    for ti in dag_run.get_task_instances():
+        start, end = timer.spans.get((ti.task_id, ti.map_index), (0, 0))
+        tasks.append(
+            {
+                "task_id": ti.task_id,
+                "map_index": ti.map_index,
+                "state": ti.state,
+                "duration_seconds": round(max(end - start, 0.0), 3),
+                **sampler.peaks(start, end),
+                "started_at": start,
+            }
+        )
+    tasks.sort(key=lambda task: task.pop("started_at"))
+    return tasks
+
+
+def _xcom_report(dag_run) -> List[Dict[str, Any]]:
+    from airflow.models import XCom
+    from airflow.utils.session import create_session
+    from sqlalchemy import func
+
+    with create_session() as session:
+        rows = (
+            session.query(
+                XCom.task_id,
+                XCom.map_index,
+                XCom.key,
+                func.length(XCom.value),
+            )
+            .filter(XCom.dag_id == dag_run.dag_id)
+            .filter(XCom.run_id == dag_run.run_id)
+            .all()
+        )
+    return sorted(
+        (
+            {
+                "task_id": task_id,
+                "map_index": map_index,
+                "key": key,
+                "bytes": size or 0,
+            }
+            for task_id, map_index, key, size in rows
+        ),
+        key=lambda row: -row["bytes"],
+    )
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    temp_dir = tempfile.mkdtemp(prefix="animal_etl_load_test_")
+    os.environ["TMPDIR"] = temp_dir
+    tempfile.tempdir = None
+    for override in args.set:
+        key, _, value = override.partition("=")
+        os.environ[key] = value
+
+    with MockAnimalsAPI(
+        total_animals=args.animals,
+        page_size=args.page_size,
+        bulk_enabled=args.bulk,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        tail_rate=args.tail_rate,
+        tail_latency=args.tail_latency,
+    ) as api:
+        os.environ["ANIMALS_API_BASE_URL"] = api.url
+
+        from airflow.listeners.listener import get_listener_manager
+        from airflow.models.dagbag import DagBag
+
+        if args.migrate:
+            from airflow.utils.db import upgradedb
+
+            upgradedb()
+
+        dagbag = DagBag(dag_folder=DAG_FILE, include_examples=False)
+        if dagbag.import_errors:
+            raise SystemExit(f"DAG import failed: {dagbag.import_errors}")
+        dag = dagbag.get_dag(DAG_ID)
+
+        with ResourceSampler(temp_dir, args.sample_interval) as sampler:
+            timer = TaskTimer(sampler)
+            get_listener_manager().add_listener(timer)
+            started = time.perf_counter()
+            dag_run = dag.test()
+            elapsed = time.perf_counter() - started
+
+        tasks = _task_report(dag_run, timer, sampler)
+        xcoms = _xcom_report(dag_run)
+        requests = dict(api.requests)
+        home_animals = api.home_animals
+
+    return {
+        "dag_id": DAG_ID,
+        "run_id": dag_run.run_id,
+        "state": dag_run.state,
+        "scale": {
+            "animals": args.animals,
+            "page_size": args.page_size,
+            "bulk": args.bulk,
+            "latency": args.latency,
+            "error_rate": args.error_rate,
+            "overrides": args.set,
+        },
+        "duration_seconds": round(elapsed, 3),
+        "animals_per_second": round(home_animals / elapsed, 1),
+        "home_animals": home_animals,
+        "api_requests": requests,
+        **sampler.peaks(),
+        "xcom_total_bytes": sum(row["bytes"] for row in xcoms),
+        "xcoms": xcoms,
+        "tasks": tasks,
+        "temp_dir": temp_dir,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run the ETL DAG end to end against the local Animals API"
+    )
+    parser.add_argument("--animals", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--bulk", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--tail-rate", type=float, default=0.0)
+    parser.add_argument("--tail-latency", type=float, default=0.0)
+    parser.add_argument("--sample-interval", type=float, default=0.5)
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="settings override, e.g. --set ASYNC_OPERATORS_ENABLED=true",
+    )
+    parser.add_argument("--migrate", action="store_true")
+    parser.add_argument("--output", default="dag_load_test.json")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+        f.write("\n")
+    print(
+        f"{report['state']}: {report['home_animals']} animals in "
+        f"{report['duration_seconds']}s, peak RSS {report['peak_rss_mb']} MB, "
+        f"peak temp {report['peak_temp_mb']} MB, "
+        f"XCom {report['xcom_total_bytes']} bytes; report in {args.output}"
+    )
+    return 0 if report["state"] == "success" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
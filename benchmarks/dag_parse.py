@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+from compare import PROJECT_ROOT, compare
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(
+    BENCHMARKS_DIR, "baselines", "dag_parse.json"
+)
+DEFAULT_THRESHOLD = float(
+    os.environ.get("BENCHMARK_REGRESSION_THRESHOLD", "0.10")
+)
+DAG_FILE = os.path.join(PROJECT_ROOT, "dags", "animal_etl_dag.py")
+
+IMPORT_SNIPPET = """
+import importlib.util, time
+import airflow.models
+import airflow.operators.python
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("animal_etl_dag", {dag_file!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(time.perf_counter() - start)
+"""
+
+DAGBAG_SNIPPET = """
+import time
+from airflow.models.dagbag import DagBag
+start = time.perf_counter()
+dagbag = DagBag(dag_folder={dag_file!r}, include_examples=False)
+elapsed = time.perf_counter() - start
+assert not dagbag.import_errors, dagbag.import_errors
+print(elapsed)
+"""
+
+
+def _run_snippet(snippet: str) -> float:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")])
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", snippet.format(dag_file=DAG_FILE)],
+        env=env,
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise SystemExit(completed.stderr)
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def _stats(samples: List[float]) -> Dict[str, Any]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "rounds": len(samples),
+    }
+
+
+def measure(rounds: int) -> Dict[str, Any]:
+    import_samples = [_run_snippet(IMPORT_SNIPPET) for _ in range(rounds)]
+    dagbag_samples = [_run_snippet(DAGBAG_SNIPPET) for _ in range(rounds)]
+    return {
+        "machine_info": {
+            "python_version": sys.version.split()[0],
+            "system": sys.platform,
+        },
+        "benchmarks": {
+            "dag_module_import": _stats(import_samples),
+            "dagbag_load": _stats(dagbag_samples),
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure DAG import and DagBag load time"
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD
+    )
+    parser.add_argument(
+        "--stat", default="median", choices=["min", "median", "mean"]
+    )
+    parser.add_argument("--update", action="store_true")
+    args = parser.parse_args(argv)
+
+    current = measure(args.rounds)
+
+    if args.update:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare(baseline, current, args.threshold, args.stat)
+    if regressions:
+        print(
+            f"DAG parse time regressed or has no baseline: {regressions}"
+        )
+        return 1
+
+    print(f"No regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from compare import PROJECT_ROOT
+from synthetic import animal_details
+
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.models import AnimalDetail, AnimalListItem
+from utils.records import AnimalRecord
+from utils.transformers import AnimalDataTransformer
+
+
+def _pydantic_pipeline(payloads: List[Dict[str, Any]]) -> List[Any]:
+    items = [AnimalListItem(**payload).dict() for payload in payloads]
+    details = [AnimalDetail(**payload) for payload in payloads]
+    api_animals = AnimalDataTransformer.to_api_format(
+        AnimalDataTransformer.transform_animals_batch(details)
+    )
+    return [items, details, api_animals]
+
+
+def _record_pipeline(payloads: List[Dict[str, Any]]) -> List[Any]:
+    records = [AnimalRecord.from_payload(payload) for payload in payloads]
+    api_animals = AnimalDataTransformer.transform_records_batch(records)
+    return [records, api_animals]
+
+
+def _measure(
+    func: Callable[[List[Dict[str, Any]]], Any],
+    payloads: List[Dict[str, Any]],
+) -> Dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func(payloads)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    retained = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del result
+    size = len(payloads)
+    return {
+        "retained_bytes_per_record": round(retained / size, 1),
+        "peak_bytes_per_record": round(peak / size, 1),
+        "live_blocks_per_record": round(blocks / size, 2),
+    }
+
+
+def measure(size: int) -> Dict[str, Any]:
+    payloads = animal_details(size)
+    return {
+        "size": size,
+        "record_instance_bytes": sys.getsizeof(AnimalRecord(1, "Lion")),
+        "pydantic": _measure(_pydantic_pipeline, payloads),
+        "records": _measure(_record_pipeline, payloads),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare per-record memory of pydantic and slotted records"
+    )
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    print(json.dumps(measure(args.size), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
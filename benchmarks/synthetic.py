@@ -0,0 +1,116 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+
+FIRST_NAMES = [
+    "Lion",
+    "Tiger",
+    "Bear",
+    "Wolf",
+    "Fox",
+    "Eagle",
+    "Otter",
+    "Badger",
+    "Heron",
+    "Lynx",
+    "Moose",
+    "Bison",
+    "Koala",
+    "Panda",
+    "Zebra",
+    "Gecko",
+    "Raven",
+    "Cobra",
+    "Hyena",
+    "Walrus",
+]
+SUFFIXES = ["", " Jr", " II", " the Great", " of the North"]
+
+EPOCH_START = datetime(1990, 1, 1, tzinfo=timezone.utc)
+EPOCH_SPAN_DAYS = 35 * 365
+
+
+def _weighted_names(rng: random.Random, count: int) -> List[str]:
+    weights = [1.0 / (rank + 1) for rank in range(len(FIRST_NAMES))]
+    return rng.choices(FIRST_NAMES, weights=weights, k=count)
+
+
+def _born_at(rng: random.Random) -> Any:
+    roll = rng.random()
+    moment = EPOCH_START + timedelta(
+        days=rng.randrange(EPOCH_SPAN_DAYS),
+        seconds=rng.randrange(86400),
+    )
+    if roll < 0.60:
+        return int(moment.timestamp() * 1000)
+    if roll < 0.85:
+        return moment.isoformat()
+    if roll < 0.95:
+        return None
+    return rng.choice(["not-a-date", "", "null", "31/31/2020"])
+
+
+def _name(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.005:
+        return rng.choice(["", "   "])
+    base = _weighted_names(rng, 1)[0] + rng.choice(SUFFIXES)
+    if roll < 0.02:
+        return f"  {base} "
+    return base
+
+
+def _friends(rng: random.Random) -> str:
+    count = min(int(rng.expovariate(0.6)), 8)
+    return ",".join(_weighted_names(rng, count))
+
+
+def iter_animal_details(
+    size: int, seed: int = 42
+) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(seed)
+    for animal_id in range(1, size + 1):
+        yield {
+            "id": animal_id,
+            "name": _name(rng),
+            "friends": _friends(rng),
+            "born_at": _born_at(rng),
+        }
+
+
+def animal_details(size: int, seed: int = 42) -> List[Dict[str, Any]]:
+    return list(iter_animal_details(size, seed))
+
+
+def list_pages(
+    details: List[Dict[str, Any]], page_size: int = 100
+) -> List[Dict[str, Any]]:
+    total_pages = max(1, -(-len(details) // page_size))
+    pages = []
+    for page in range(total_pages):
+        chunk = details[page * page_size : (page + 1) * page_size]
+        pages.append(
+            {
+                "page": page + 1,
+                "total_pages": total_pages,
+                "items": [
+                    {
+                        "id": item["id"],
+                        "name": item["name"],
+                        "born_at": item["born_at"],
+                    }
+                    for item in chunk
+                ],
+            }
+        )
+    return pages
+
+
+def animal_detail(animal_id: int, seed: int = 42) -> Dict[str, Any]:
+    rng = random.Random(seed * 1_000_003 + animal_id)
+    return {
+        "id": animal_id,
+        "name": _name(rng),
+        "friends": _friends(rng),
+        "born_at": _born_at(rng),
+    }
@@ -0,0 +1,67 @@
+from benchmarks.synthetic import animal_details, list_pages
+from utils.models import AnimalDetail, PaginatedResponse, TransformedAnimal
+from utils.records import AnimalRecord
+from utils.transformers import AnimalDataTransformer
+
+
+def _build_pages(pages):
+    return [PaginatedResponse(**page) for page in pages]
+
+
+def _validate_transformed(details):
+    validated = []
+    for detail in details:
+        try:
+            validated.append(TransformedAnimal(**detail))
+        except ValueError:
+            continue
+    return validated
+
+
+def test_paginated_response(run_benchmark, size):
+    pages = list_pages(animal_details(size))
+
+    result = run_benchmark(_build_pages, pages)
+
+    assert sum(len(page.items) for page in result) == size
+
+
+def test_transformed_animal_validation(run_benchmark, size):
+    details = animal_details(size)
+
+    result = run_benchmark(_validate_transformed, details)
+
+    assert 0 < len(result) <= size
+
+
+def test_transform_animals_batch(run_benchmark, size):
+    details = [AnimalDetail(**detail) for detail in animal_details(size)]
+
+    result = run_benchmark(
+        AnimalDataTransformer.transform_animals_batch, details
+    )
+
+    assert 0 < len(result) <= size
+
+
+def test_to_api_format(run_benchmark, size):
+    transformed = _validate_transformed(animal_details(size))
+
+    result = run_benchmark(
+        AnimalDataTransformer.to_api_format, transformed
+    )
+
+    assert len(result) == len(transformed)
+
+
+def test_transform_records_batch(run_benchmark, size):
+    records = [
+        AnimalRecord.from_payload(detail)
+        for detail in animal_details(size)
+    ]
+
+    result = run_benchmark(
+        AnimalDataTransformer.transform_records_batch, records
+    )
+
+    assert 0 < len(result) <= size
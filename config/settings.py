@@ -1,5 +1,7 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -9,8 +11,56 @@ class Settings(BaseSettings):
 
     BATCH_SIZE: int = 100
     MAX_CONCURRENT_REQUESTS: int = 10
+    BULK_DETAILS_ENABLED: bool = True
+    BULK_DETAILS_MAX_IDS: int = 100
+    ASYNC_OPERATORS_ENABLED: bool = False
+    ASYNC_MAX_CONCURRENCY: int = 100
+    DETAIL_OPTIONAL_FIELDS: list = []
+    HEDGE_REQUESTS_ENABLED: bool = False
+    HEDGE_QUANTILE: float = 0.95
+    HEDGE_MIN_SAMPLES: int = 20
+    HEDGE_MIN_DELAY: float = 0.05
+    HEDGE_BUDGET_RATIO: float = 0.05
     MAX_RETRIES: int = 3
     RETRY_DELAY: float = 1.0
+    API_POLICIES: dict = {}
+    RUN_DEADLINE_SECONDS: int = 0
+    RUN_DEADLINE_RESERVE: float = 60.0
+    RUN_DEADLINE_LOW_FRACTION: float = 0.2
+
+    MEMORY_BUDGET_MB: int = 64
+    PREFILTER_RULES: list = ["valid_id", "non_empty_name"]
+    QUARANTINE_DIR: str = ""
+    RESULTS_DB_PATH: str = ""
+    LOAD_CHANGES_ONLY: bool = False
+    FRIENDS_GRAPH_ENABLED: bool = False
+    FRIENDS_RESOLVE_IDS: bool = True
+
+    REDIS_URL: str = "redis://redis:6379/1"
+    WORK_QUEUE_ENABLED: bool = False
+    QUEUE_WORKERS: int = 4
+    QUEUE_VISIBILITY_TIMEOUT: float = 300.0
+    QUEUE_MAX_ATTEMPTS: int = 3
+    QUEUE_POLL_INTERVAL: float = 2.0
+    SHARED_RATE_LIMIT: float = 0.0
+    SHARED_RATE_LIMIT_BURST: int = 0
+    SHARED_DETAIL_CACHE_ENABLED: bool = False
+    DETAIL_CACHE_TTL: int = 900
+    DETAIL_CACHE_MAX_MB: int = 64
+    AUTOTUNE_ENABLED: bool = False
+    AUTOTUNE_STATE_PATH: str = ""
+    AUTOTUNE_MIN_BATCH_SIZE: int = 25
+    AUTOTUNE_MAX_BATCH_SIZE: int = 1000
+    AUTOTUNE_MAX_CONCURRENCY: int = 50
+    AUTOTUNE_TRIAL_BATCHES: int = 2
+    AUTOTUNE_MAX_ERROR_RATE: float = 0.05
+    AUTOTUNE_MIN_GAIN: float = 0.05
+    PREFETCH_ENABLED: bool = False
+    PREFETCH_DEPTH: int = 4
+
+    TRANSFORM_POOL_ENABLED: bool = False
+    TRANSFORM_PROCESSES: int = 0
+    TRANSFORM_CHUNK_SIZE: int = 250
 
     DAG_OWNER: str = "Sarim Sikander"
     DAG_EMAIL: list = ["sarimsikander24@gmail.com"]
@@ -18,10 +68,45 @@ class Settings(BaseSettings):
     DAG_CATCHUP: bool = False
 
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "kv"
+    LOG_SAMPLE_LIMIT: int = 10
+    LOG_SAMPLE_WINDOW: float = 60.0
+
+    METRICS_ENABLED: bool = True
+    METRICS_PREFIX: str = "animal_etl"
+    OTEL_TRACING_ENABLED: bool = False
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    OTEL_SERVICE_NAME: str = "animal-etl"
+
+    PROFILE_TASKS: bool = False
+    PROFILE_TOP_N: int = 25
+    PROFILE_TRACEMALLOC_FRAMES: int = 10
 
     class Config:
         env_file = ".env"
         case_sensitive = True
 
+    @model_validator(mode="after")
+    def check_work_queue(self) -> "Settings":
+        if self.WORK_QUEUE_ENABLED and (
+            self.LOAD_CHANGES_ONLY or self.RESULTS_DB_PATH
+        ):
+            raise ValueError(
+                "WORK_QUEUE_ENABLED cannot be combined with RESULTS_DB_PATH "
+                "or LOAD_CHANGES_ONLY: queue workers do not write the "
+                "results database, diff or promote the load baseline"
+            )
+        return self
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    return Settings()
+
+
+class LazySettings:
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
 
-settings = Settings()
+settings = LazySettings()
@@ -1,8 +1,6 @@
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
 
 from airflow import DAG
-from airflow.operators.bash import BashOperator
 from airflow.operators.python import PythonOperator
 from airflow.utils.trigger_rule import TriggerRule
 
@@ -10,6 +8,7 @@ from config.settings import settings
 from plugins.operators.animal_etl_operators import (
     ExtractAnimalsOperator,
     HealthCheckOperator,
+    PrefetchTransformAnimalsOperator,
     TransformAnimalsOperator,
 )
 
@@ -32,150 +31,313 @@ dag = DAG(
     schedule_interval=settings.DAG_SCHEDULE,
     catchup=settings.DAG_CATCHUP,
     max_active_runs=1,
+    params={"run_deadline_seconds": settings.RUN_DEADLINE_SECONDS},
     tags=["etl", "animals", "data-pipeline", "v3-fixed"],
 )
 
-extract_animals = ExtractAnimalsOperator(
-    task_id="extract_animals",
-    dag=dag,
-)
+if settings.ASYNC_OPERATORS_ENABLED:
+    from plugins.operators.async_animal_etl_operators import (
+        AsyncExtractAnimalsOperator as ExtractAnimalsOperator,
+    )
+    from plugins.operators.async_animal_etl_operators import (
+        AsyncPrefetchTransformAnimalsOperator as PrefetchTransformAnimalsOperator,
+    )
+    from plugins.operators.async_animal_etl_operators import (
+        AsyncTransformAnimalsOperator as TransformAnimalsOperator,
+    )
 
-transform_animals = TransformAnimalsOperator(
-    task_id="transform_animals",
-    batch_size=settings.BATCH_SIZE,
-    dag=dag,
+prefetch_enabled = (
+    settings.PREFETCH_ENABLED and not settings.WORK_QUEUE_ENABLED
 )
 
+if not prefetch_enabled:
+    extract_animals = ExtractAnimalsOperator(
+        task_id="extract_animals",
+        dag=dag,
+    )
+
+if settings.WORK_QUEUE_ENABLED:
+    from plugins.operators.queue_operators import (
+        EnqueueBatchesOperator,
+        QueueWorkerOperator,
+    )
+
+    enqueue_batches = EnqueueBatchesOperator(
+        task_id="enqueue_batches",
+        batch_size=settings.BATCH_SIZE,
+        dag=dag,
+    )
+    queue_workers = QueueWorkerOperator.partial(
+        task_id="queue_worker",
+        dag=dag,
+    ).expand(worker_index=list(range(settings.QUEUE_WORKERS)))
+elif prefetch_enabled:
+    transform_animals = PrefetchTransformAnimalsOperator(
+        task_id="transform_animals",
+        batch_size=settings.BATCH_SIZE,
+        dag=dag,
+    )
+else:
+    transform_animals = TransformAnimalsOperator(
+        task_id="transform_animals",
+        batch_size=settings.BATCH_SIZE,
+        dag=dag,
+    )
+
 
 def load_all_batches_fixed(**context):
+    from utils.profiling import profile_task
+
+    with profile_task(context, "load_animals"):
+        return _load_all_batches(context)
+
+
+def _load_all_batches(context):
     import json
+    import os
 
     from plugins.hooks.animals_api_hook import AnimalsAPIHook
+    from utils import metrics
+    from utils.deadline import Checkpoint, RunDeadline
+    from utils.diff import promote_baseline
+    from utils.log import (
+        SampledLogger,
+        get_logger,
+        summarize_sampled_warnings,
+        truncate,
+    )
+    from utils.manifest import iter_manifest, manifest_reference
+    from utils.quarantine import QuarantineWriter, quarantine_path
+
+    logger = get_logger("dags.load")
+    sampled_logger = SampledLogger(logger)
 
     transform_result = context["task_instance"].xcom_pull(
         task_ids="transform_animals"
     )
 
-    if not transform_result or "batch_info" not in transform_result:
-        print("No batch info received from transform task")
+    manifest = manifest_reference(transform_result)
+    if manifest is None:
+        logger.warning("No manifest received from transform task")
         return {"status": "no_data", "batches_processed": 0}
 
-    batch_info_list = transform_result["batch_info"]
     hook = AnimalsAPIHook()
+    deadline = RunDeadline.from_context(context)
+    hook.deadline = deadline
+    checkpoint = Checkpoint(
+        os.path.join(
+            os.path.dirname(manifest["manifest_path"]),
+            f"load_checkpoint_{context['run_id']}.jsonl",
+        )
+    )
 
     successful_batches = 0
     failed_batches = 0
+    skipped_batches = 0
     total_animals = 0
 
-    print(f"DEBUG: Processing {len(batch_info_list)} batches")
-    print(
-        f"DEBUG: Batch info structure: {batch_info_list[0] if batch_info_list else 'No batches'}"
+    logger.info(
+        "Loading batches",
+        total_batches=manifest["total_batches"],
+        manifest_path=manifest["manifest_path"],
     )
 
-    for i, batch_info in enumerate(batch_info_list):
-        batch_file = batch_info["file"]
-        expected_count = batch_info["count"]
+    quarantine = QuarantineWriter(quarantine_path(context["run_id"]))
 
-        try:
-            print(f"DEBUG: Loading batch {i+1} from {batch_file}")
-
-            with open(batch_file, "r", encoding="utf-8") as f:
-                batch_content = f.read()
-                print(
-                    f"DEBUG: Raw file content (first 200 chars): {batch_content[:200]}"
-                )
-
-                batch_animals = json.loads(batch_content)
-                print(f"DEBUG: Parsed JSON type: {type(batch_animals)}")
-                print(
-                    f"DEBUG: Batch size: {len(batch_animals) if isinstance(batch_animals, list) else 'Not a list'}"
+    def quarantine_batch(category, animals, error):
+        for animal in animals:
+            if isinstance(animal, dict):
+                quarantine.write(
+                    "load", category, animal.get("id"), animal, error
                 )
 
-                if (
-                    isinstance(batch_animals, list)
-                    and len(batch_animals) > 0
-                ):
-                    print(f"DEBUG: First animal: {batch_animals[0]}")
+    with metrics.stage(
+        "load", run_id=context["run_id"]
+    ) as stats, quarantine:
+        for i, batch_info in enumerate(iter_manifest(manifest)):
+            batch_file = batch_info["file"]
 
-            if not isinstance(batch_animals, list):
-                print(
-                    f"ERROR: Batch data is not a list: {type(batch_animals)}"
-                )
-                failed_batches += 1
+            if batch_info["batch_index"] in checkpoint:
+                successful_batches += 1
+                total_animals += batch_info["count"]
                 continue
 
-            if not batch_animals:
-                print(f"ERROR: Batch is empty")
-                failed_batches += 1
-                continue
+            if deadline is not None and deadline.expired(
+                settings.RUN_DEADLINE_RESERVE
+            ):
+                skipped_batches = manifest["total_batches"] - i
+                logger.warning(
+                    "Run deadline near, leaving batches unloaded",
+                    skipped_batches=skipped_batches,
+                )
+                break
 
-            first_animal = batch_animals[0]
-            if not isinstance(first_animal, dict):
-                print(f"ERROR: Animal is not a dict: {type(first_animal)}")
-                failed_batches += 1
-                continue
+            batch_animals = None
+            try:
+                logger.debug(
+                    "Loading batch", batch=i + 1, batch_file=batch_file
+                )
 
-            required_fields = ["id", "name", "friends", "born_at"]
-            missing_fields = [
-                field
-                for field in required_fields
-                if field not in first_animal
-            ]
-            if missing_fields:
-                print(f"ERROR: Missing fields: {missing_fields}")
+                with open(batch_file, "r", encoding="utf-8") as f:
+                    batch_animals = json.load(f)
+
+                if not isinstance(batch_animals, list):
+                    sampled_logger.error(
+                        "batch_not_list",
+                        "Batch data is not a list",
+                        batch=i + 1,
+                        data_type=type(batch_animals).__name__,
+                    )
+                    failed_batches += 1
+                    continue
+
+                if not batch_animals:
+                    sampled_logger.error(
+                        "batch_empty", "Batch is empty", batch=i + 1
+                    )
+                    failed_batches += 1
+                    continue
+
+                first_animal = batch_animals[0]
+                if not isinstance(first_animal, dict):
+                    sampled_logger.error(
+                        "animal_not_dict",
+                        "Animal is not a dict",
+                        batch=i + 1,
+                        data_type=type(first_animal).__name__,
+                    )
+                    failed_batches += 1
+                    continue
+
+                required_fields = ["id", "name", "friends", "born_at"]
+                missing_fields = [
+                    field
+                    for field in required_fields
+                    if field not in first_animal
+                ]
+                if missing_fields:
+                    sampled_logger.error(
+                        "missing_fields",
+                        "Missing fields",
+                        batch=i + 1,
+                        missing_fields=missing_fields,
+                    )
+                    quarantine_batch(
+                        "missing_fields",
+                        batch_animals,
+                        f"Missing fields: {missing_fields}",
+                    )
+                    failed_batches += 1
+                    continue
+
+                success = hook.send_animals_to_home(batch_animals)
+
+                if success:
+                    checkpoint.mark(batch_info["batch_index"])
+                    try:
+                        os.remove(batch_file)
+                    except OSError as e:
+                        sampled_logger.warning(
+                            "cleanup",
+                            "Could not remove batch file",
+                            batch_file=batch_file,
+                            error=str(e),
+                        )
+                    successful_batches += 1
+                    total_animals += len(batch_animals)
+                    stats.records = total_animals
+                    stats.batches = successful_batches
+                    logger.debug(
+                        "Batch loaded",
+                        batch=i + 1,
+                        animals=len(batch_animals),
+                    )
+                else:
+                    failed_batches += 1
+                    sampled_logger.error(
+                        "load_failed", "Batch failed to load", batch=i + 1
+                    )
+                    quarantine_batch(
+                        "load_failed",
+                        batch_animals,
+                        "Batch failed to load",
+                    )
+
+            except json.JSONDecodeError as e:
                 failed_batches += 1
-                continue
-
-            print(
-                f"Batch {i+1} validation passed - sending {len(batch_animals)} animals"
-            )
-
-            success = hook.send_animals_to_home(batch_animals)
+                sampled_logger.error(
+                    "json_decode",
+                    "JSON decode error in batch",
+                    batch=i + 1,
+                    batch_file=batch_file,
+                    error=str(e),
+                )
 
-            if success:
-                successful_batches += 1
-                total_animals += len(batch_animals)
-                print(f"Batch {i+1} loaded successfully")
-            else:
+            except Exception as e:
                 failed_batches += 1
-                print(f"Batch {i+1} failed to load")
-
-        except json.JSONDecodeError as e:
-            failed_batches += 1
-            print(f"JSON decode error in batch {i+1}: {str(e)}")
-            print(f"   File: {batch_file}")
-
-        except Exception as e:
-            failed_batches += 1
-            print(f"Batch {i+1} failed with error: {str(e)}")
-            print(f"   File: {batch_file}")
-
-        finally:
-            try:
-                import os
+                if isinstance(batch_animals, list):
+                    quarantine_batch(
+                        "load_error", batch_animals, truncate(e)
+                    )
+                sampled_logger.error(
+                    "load_error",
+                    "Batch failed with error",
+                    batch=i + 1,
+                    batch_file=batch_file,
+                    error=truncate(e),
+                )
 
-                os.remove(batch_file)
-                print(f"🧹 Cleaned up {batch_file}")
-            except OSError as e:
-                print(f"⚠️ Could not remove {batch_file}: {e}")
+    summarize_sampled_warnings()
 
+    partial = (
+        skipped_batches or transform_result.get("status") == "partial"
+    )
     result = {
-        "status": "completed",
-        "total_batches": len(batch_info_list),
+        "status": "partial" if partial else "completed",
+        "total_batches": manifest["total_batches"],
         "successful_batches": successful_batches,
         "failed_batches": failed_batches,
+        "skipped_batches": skipped_batches,
         "total_animals": total_animals,
+        **quarantine.summary(),
+        "metrics": stats.as_dict(),
     }
 
-    print(f"Load Summary: {result}")
+    promoted = (
+        result["status"] == "completed"
+        and not failed_batches
+        and promote_baseline(transform_result)
+    )
+    if promoted:
+        result["baseline_run_id"] = context["run_id"]
+
+    logger.info("Load summary", **result)
     return result
 
 
-load_animals = PythonOperator(
-    task_id="load_animals",
-    python_callable=load_all_batches_fixed,
-    dag=dag,
-)
+if settings.WORK_QUEUE_ENABLED:
+    from plugins.operators.queue_operators import QueueSummaryOperator
+
+    load_animals = QueueSummaryOperator(
+        task_id="load_animals",
+        trigger_rule=TriggerRule.ALL_DONE,
+        dag=dag,
+    )
+elif settings.ASYNC_OPERATORS_ENABLED:
+    from plugins.operators.async_animal_etl_operators import (
+        AsyncLoadAnimalsOperator,
+    )
+
+    load_animals = AsyncLoadAnimalsOperator(
+        task_id="load_animals",
+        dag=dag,
+    )
+else:
+    load_animals = PythonOperator(
+        task_id="load_animals",
+        python_callable=load_all_batches_fixed,
+        dag=dag,
+    )
 
 
 def send_success_notification(**context):
@@ -190,6 +352,7 @@ def send_success_notification(**context):
             f"Successful batches: {load_result.get('successful_batches', 0)}"
         )
         print(f"Failed batches: {load_result.get('failed_batches', 0)}")
+        print(f"Skipped batches: {load_result.get('skipped_batches', 0)}")
     else:
         print("Pipeline completed (no load results)")
 
@@ -238,10 +401,11 @@ cleanup = PythonOperator(
     dag=dag,
 )
 
-(
-    extract_animals
-    >> transform_animals
-    >> load_animals
-    >> success_notification
-    >> cleanup
-)
+if settings.WORK_QUEUE_ENABLED:
+    extract_animals >> enqueue_batches >> queue_workers >> load_animals
+elif prefetch_enabled:
+    transform_animals >> load_animals
+else:
+    extract_animals >> transform_animals >> load_animals
+
+load_animals >> success_notification >> cleanup
@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta
+
+from airflow import DAG
+
+from config.settings import settings
+from plugins.operators.animal_etl_operators import ReplayQuarantineOperator
+
+dag = DAG(
+    "animal_etl_replay",
+    default_args={
+        "owner": settings.DAG_OWNER,
+        "depends_on_past": False,
+        "start_date": datetime(2025, 1, 1),
+        "email_on_failure": True,
+        "email": settings.DAG_EMAIL,
+        "retries": 1,
+        "retry_delay": timedelta(minutes=1),
+        "execution_timeout": timedelta(minutes=30),
+    },
+    description="Re-fetch, re-transform and load quarantined animals",
+    schedule_interval=None,
+    catchup=False,
+    max_active_runs=1,
+    params={"source_run_id": ""},
+    tags=["etl", "animals", "replay"],
+)
+
+replay_quarantine = ReplayQuarantineOperator(
+    task_id="replay_quarantine",
+    source_run_id="{{ params.source_run_id }}",
+    dag=dag,
+)
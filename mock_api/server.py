@@ -0,0 +1,237 @@
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import animal_detail
+
+LIST_PATH = "/animals/v1/animals"
+BULK_PATH = "/animals/v1/animals/bulk"
+HOME_PATH = "/animals/v1/home"
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class MockAnimalsAPI:
+    def __init__(
+        self,
+        total_animals: int = 1000,
+        page_size: int = 100,
+        bulk_enabled: bool = False,
+        bulk_max_ids: int = 100,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        tail_rate: float = 0.0,
+        tail_latency: float = 0.0,
+        seed: int = 42,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.total_animals = total_animals
+        self.page_size = page_size
+        self.bulk_enabled = bulk_enabled
+        self.bulk_max_ids = bulk_max_ids
+        self.latency = latency
+        self.error_rate = error_rate
+        self.tail_rate = tail_rate
+        self.tail_latency = tail_latency
+        self.seed = seed
+        self.requests: Counter = Counter()
+        self.home_animals = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._server = _Server((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def total_pages(self) -> int:
+        return max(1, -(-self.total_animals // self.page_size))
+
+    def start(self) -> "MockAnimalsAPI":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockAnimalsAPI":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def detail(self, animal_id: int) -> Dict[str, Any]:
+        return animal_detail(animal_id, self.seed)
+
+    def page(self, page: int) -> Dict[str, Any]:
+        first_id = (page - 1) * self.page_size + 1
+        last_id = min(first_id + self.page_size - 1, self.total_animals)
+        items = []
+        for animal_id in range(first_id, last_id + 1):
+            detail = self.detail(animal_id)
+            items.append(
+                {
+                    "id": detail["id"],
+                    "name": detail["name"],
+                    "born_at": detail["born_at"],
+                }
+            )
+        return {
+            "page": page,
+            "total_pages": self.total_pages,
+            "items": items,
+        }
+
+    def _record(self, endpoint: str) -> bool:
+        with self._lock:
+            self.requests[endpoint] += 1
+            failed = self._rng.random() < self.error_rate
+            slow = self._rng.random() < self.tail_rate
+        delay = self.latency + (self.tail_latency if slow else 0.0)
+        if delay:
+            time.sleep(delay)
+        return failed
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, body: Any) -> None:
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                try:
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def _read_body(self) -> bytes:
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length)
+
+            def _read_json(self) -> Any:
+                return json.loads(self._read_body() or b"null")
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+
+                if parsed.path == LIST_PATH:
+                    if api._record("list"):
+                        return self._send(503, {"message": "unavailable"})
+                    query = parse_qs(parsed.query)
+                    page = int(query.get("page", ["1"])[0])
+                    return self._send(200, api.page(page))
+
+                if parsed.path.startswith(f"{LIST_PATH}/"):
+                    if api._record("detail"):
+                        return self._send(503, {"message": "unavailable"})
+                    try:
+                        animal_id = int(parsed.path.rsplit("/", 1)[1])
+                    except ValueError:
+                        return self._send(404, {"message": "not found"})
+                    if not 1 <= animal_id <= api.total_animals:
+                        return self._send(404, {"message": "not found"})
+                    return self._send(200, api.detail(animal_id))
+
+                self._send(404, {"message": "not found"})
+
+            def do_POST(self) -> None:
+                path = urlparse(self.path).path
+
+                if path == BULK_PATH and api.bulk_enabled:
+                    if api._record("bulk"):
+                        return self._send(503, {"message": "unavailable"})
+                    ids = (self._read_json() or {}).get("ids", [])
+                    if len(ids) > api.bulk_max_ids:
+                        return self._send(400, {"message": "too many ids"})
+                    return self._send(
+                        200,
+                        {
+                            "items": [
+                                api.detail(int(animal_id))
+                                for animal_id in ids
+                                if 1 <= int(animal_id) <= api.total_animals
+                            ]
+                        },
+                    )
+
+                if path == HOME_PATH:
+                    if api._record("home"):
+                        return self._send(503, {"message": "unavailable"})
+                    animals = self._read_json()
+                    if not isinstance(animals, list) or len(animals) > 100:
+                        return self._send(
+                            400, {"message": "invalid batch"}
+                        )
+                    with api._lock:
+                        api.home_animals += len(animals)
+                    return self._send(
+                        200,
+                        {"message": f"Helped {len(animals)} find home"},
+                    )
+
+                self._read_body()
+                api._record("not_found")
+                self._send(404, {"message": "not found"})
+
+        return Handler
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local Animals API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3123)
+    parser.add_argument("--animals", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--bulk", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--tail-rate", type=float, default=0.0)
+    parser.add_argument("--tail-latency", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    api = MockAnimalsAPI(
+        total_animals=args.animals,
+        page_size=args.page_size,
+        bulk_enabled=args.bulk,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        tail_rate=args.tail_rate,
+        tail_latency=args.tail_latency,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving {args.animals} animals on {api.url}")
+    try:
+        api._server.serve_forever()
+    except KeyboardInterrupt:
+        api.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,29 @@
 import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
 
 import httpx
 from airflow.exceptions import AirflowException
 from airflow.hooks.base import BaseHook
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from config.settings import settings
+from utils import metrics
+from utils.deadline import RunDeadline
+from utils.detail_cache import shared_detail_cache
 from utils.exceptions import ExternalAPIException
-from utils.models import AnimalDetail, PaginatedResponse
+from utils.hedging import HedgeBudget, LatencyTracker, hedged_call
+from utils.log import SampledLogger, get_logger, truncate
+from utils.models import AnimalDetail, AnimalListItem, PaginatedResponse
+from utils.policies import EndpointPolicy, build_policies, with_policy
+from utils.rate_limit import shared_rate_limiter
+from utils.records import AnimalRecord
+
+sampled_logger = SampledLogger(get_logger("hooks.animals_api"))
+
+BULK_DETAILS_PATH = "/animals/v1/animals/bulk"
+BULK_UNSUPPORTED_STATUS_CODES = (404, 405, 501)
 
 
 class AnimalsAPIHook(BaseHook):
@@ -23,69 +37,137 @@ class AnimalsAPIHook(BaseHook):
         self.animals_api_conn_id = animals_api_conn_id
         self.base_url = settings.ANIMALS_API_BASE_URL
         self.timeout = settings.ANIMALS_API_TIMEOUT
+        self.concurrency = settings.MAX_CONCURRENT_REQUESTS
+        self._client: Optional[httpx.Client] = None
+        self._client_connections = 0
+        self._bulk_supported: Optional[bool] = None
+        self.hedging_enabled = settings.HEDGE_REQUESTS_ENABLED
+        self.latency_tracker = LatencyTracker(
+            quantile=settings.HEDGE_QUANTILE,
+            min_samples=settings.HEDGE_MIN_SAMPLES,
+        )
+        self.hedge_budget = HedgeBudget(settings.HEDGE_BUDGET_RATIO)
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._policies: Optional[Dict[str, EndpointPolicy]] = None
+        self.deadline: Optional[RunDeadline] = None
+        self.failed_list_items: List[Dict[str, Any]] = []
+        self.rate_limiter = shared_rate_limiter(animals_api_conn_id)
+        self.detail_cache = shared_detail_cache(animals_api_conn_id)
+
+    def _connection_policies(self) -> Optional[Dict[str, Any]]:
+        try:
+            connection = self.get_connection(self.animals_api_conn_id)
+        except Exception as e:
+            self.log.debug(
+                f"No connection {self.animals_api_conn_id} for policies: {e}"
+            )
+            return None
+        return connection.extra_dejson.get("policies")
+
+    @property
+    def policies(self) -> Dict[str, EndpointPolicy]:
+        if self._policies is None:
+            self._policies = build_policies(
+                settings.API_POLICIES, self._connection_policies()
+            )
+        return self._policies
+
+    def policy(self, endpoint: str) -> EndpointPolicy:
+        policy = self.policies.get(endpoint) or EndpointPolicy()
+        if self.deadline is not None:
+            return self.deadline.constrain(policy)
+        return policy
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            connections = self.concurrency * (
+                2 if self.hedging_enabled else 1
+            )
+            self._client_connections = connections
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=connections,
+                    max_keepalive_connections=connections,
+                ),
+            )
+        return self._client
+
+    def set_concurrency(self, concurrency: int) -> None:
+        if (
+            self._client is not None
+            and concurrency * (2 if self.hedging_enabled else 1)
+            > self._client_connections
+        ):
+            self._client.close()
+            self._client = None
+        self.concurrency = concurrency
+
+    def close(self) -> None:
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = None
+            self.log.info(
+                f"Hedged detail requests: {self.hedge_budget.as_dict()}"
+            )
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _throttle(self) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
 
-    @retry(
-        stop=stop_after_attempt(settings.MAX_RETRIES),
-        wait=wait_exponential(multiplier=settings.RETRY_DELAY, max=60),
-    )
+    @with_policy("list")
     def get_animals_page(self, page: int = 1) -> PaginatedResponse:
         self.log.info(f"Fetching animals page {page}")
+        self._throttle()
 
         try:
             with httpx.Client(
-                base_url=self.base_url, timeout=self.timeout
+                base_url=self.base_url,
+                timeout=self.policy("list").timeout(),
             ) as client:
-                response = client.get(
-                    "/animals/v1/animals", params={"page": page}
-                )
+                with metrics.timed("api.list.latency", page=page):
+                    response = client.get(
+                        "/animals/v1/animals", params={"page": page}
+                    )
                 response.raise_for_status()
 
                 data = response.json()
                 return PaginatedResponse(**data)
 
         except httpx.HTTPStatusError as e:
+            metrics.incr("api.list.errors")
+            details = {"status_code": e.response.status_code}
             if e.response.status_code in [500, 502, 503, 504]:
                 raise ExternalAPIException(
-                    f"Server error: {e.response.status_code}"
-                )
+                    f"Server error: {e.response.status_code}",
+                    details=details,
+                ) from e
             elif e.response.status_code == 429:
-                raise ExternalAPIException("Rate limit exceeded")
+                raise ExternalAPIException(
+                    "Rate limit exceeded", details=details
+                ) from e
             else:
                 raise ExternalAPIException(
-                    f"HTTP error: {e.response.status_code}"
-                )
+                    f"HTTP error: {e.response.status_code}",
+                    details=details,
+                ) from e
         except Exception as e:
-            raise ExternalAPIException(f"Unexpected error: {str(e)}")
+            metrics.incr("api.list.errors")
+            raise ExternalAPIException(
+                f"Unexpected error: {str(e)}"
+            ) from e
 
-    def get_all_animals(self) -> List[Dict[str, Any]]:
-        self.log.info("Starting to fetch all animals")
-        all_animals = []
+    def iter_animal_pages(self) -> Iterator[List[AnimalListItem]]:
         page = 1
 
         while True:
             try:
                 paginated_response = self.get_animals_page(page)
-                page_animals = [
-                    animal.dict() for animal in paginated_response.items
-                ]
-                all_animals.extend(page_animals)
-
-                self.log.info(
-                    f"Fetched page {page}: {len(page_animals)} animals"
-                )
-
-                if (
-                    not paginated_response.has_next
-                    or len(page_animals) == 0
-                ):
-                    break
-
-                page += 1
-
-                if page > 1000:
-                    self.log.warning("Reached maximum page limit (1000)")
-                    break
-
             except Exception as e:
                 self.log.error(
                     f"Failed to fetch animals page {page}: {str(e)}"
@@ -94,60 +176,264 @@ class AnimalsAPIHook(BaseHook):
                     f"Failed to fetch animals: {str(e)}"
                 )
 
+            self.log.info(
+                f"Fetched page {page}: {len(paginated_response.items)} animals"
+            )
+            self.failed_list_items.extend(paginated_response.failed_items)
+            yield paginated_response.items
+
+            if (
+                not paginated_response.has_next
+                or len(paginated_response.items) == 0
+            ):
+                break
+
+            page += 1
+
+            if page > 1000:
+                self.log.warning("Reached maximum page limit (1000)")
+                break
+
+    def get_all_animals(self) -> List[Dict[str, Any]]:
+        self.log.info("Starting to fetch all animals")
+        all_animals = [
+            animal.dict()
+            for items in self.iter_animal_pages()
+            for animal in items
+        ]
+
         self.log.info(
             f"Completed fetching all animals: {len(all_animals)} total"
         )
         return all_animals
 
-    @retry(
-        stop=stop_after_attempt(settings.MAX_RETRIES),
-        wait=wait_exponential(multiplier=settings.RETRY_DELAY, max=60),
-    )
-    def get_animal_detail(self, animal_id: int) -> AnimalDetail:
+    @with_policy("detail")
+    def _get_detail_payload(self, animal_id: int) -> Dict[str, Any]:
+        self._throttle()
         try:
-            with httpx.Client(
-                base_url=self.base_url, timeout=self.timeout
-            ) as client:
-                response = client.get(f"/animals/v1/animals/{animal_id}")
-                response.raise_for_status()
+            started = time.perf_counter()
+            with metrics.timed("api.detail.latency", animal_id=animal_id):
+                response = self.client.get(
+                    f"/animals/v1/animals/{animal_id}",
+                    timeout=self.policy("detail").timeout(),
+                )
+            response.raise_for_status()
+            self.latency_tracker.record(time.perf_counter() - started)
 
-                data = response.json()
-                return AnimalDetail(**data)
+            return response.json()
 
         except Exception as e:
+            metrics.incr("api.detail.errors")
             raise ExternalAPIException(
                 f"Failed to fetch animal {animal_id}: {str(e)}"
+            ) from e
+
+    def get_animal_detail(self, animal_id: int) -> AnimalDetail:
+        data = self._get_detail_payload(animal_id)
+        try:
+            return AnimalDetail(**data)
+        except Exception as e:
+            metrics.incr("api.detail.errors")
+            raise ExternalAPIException(
+                f"Failed to parse animal {animal_id}: {str(e)}"
+            ) from e
+
+    def get_animal_record(self, animal_id: int) -> AnimalRecord:
+        data = self._get_detail_payload(animal_id)
+        try:
+            return AnimalRecord.from_payload(data)
+        except Exception as e:
+            metrics.incr("api.detail.errors")
+            raise ExternalAPIException(
+                f"Failed to parse animal {animal_id}: {str(e)}"
+            ) from e
+
+    def supports_bulk_details(self) -> bool:
+        if self._bulk_supported is None:
+            self._bulk_supported = False
+            if settings.BULK_DETAILS_ENABLED:
+                try:
+                    response = self.client.post(
+                        BULK_DETAILS_PATH,
+                        json={"ids": []},
+                        timeout=self.policy("health").timeout(),
+                    )
+                    self._bulk_supported = response.status_code == 200
+                except httpx.HTTPError as e:
+                    self.log.warning(f"Bulk detail probe failed: {e}")
+
+            self.log.info(
+                f"Bulk detail endpoint available: {self._bulk_supported}"
             )
+        return self._bulk_supported
 
-    def get_animals_details_batch(
+    @with_policy("bulk_detail")
+    def get_animals_details_bulk(
         self, animal_ids: List[int]
-    ) -> List[AnimalDetail]:
-        self.log.info(f"Fetching details for {len(animal_ids)} animals")
+    ) -> Optional[List[AnimalRecord]]:
+        self._throttle()
+        try:
+            with metrics.timed(
+                "api.bulk_detail.latency", batch_size=len(animal_ids)
+            ):
+                response = self.client.post(
+                    BULK_DETAILS_PATH,
+                    json={"ids": animal_ids},
+                    timeout=self.policy("bulk_detail").timeout(),
+                )
+            if response.status_code in BULK_UNSUPPORTED_STATUS_CODES:
+                self.log.warning(
+                    f"Bulk detail endpoint returned {response.status_code}, falling back to per-ID fetches"
+                )
+                self._bulk_supported = False
+                return None
+            response.raise_for_status()
 
-        results = []
-        failed_ids = []
+            data = response.json()
+        except Exception as e:
+            metrics.incr("api.bulk_detail.errors")
+            raise ExternalAPIException(
+                f"Failed to fetch {len(animal_ids)} animals in bulk: {str(e)}"
+            ) from e
 
-        for animal_id in animal_ids:
+        items = data.get("items", []) if isinstance(data, dict) else data
+        details = []
+        for item in items:
             try:
-                animal_detail = self.get_animal_detail(animal_id)
-                results.append(animal_detail)
+                details.append(AnimalRecord.from_payload(item))
             except Exception as e:
-                failed_ids.append(animal_id)
-                self.log.error(
-                    f"Failed to fetch animal {animal_id}: {str(e)}"
+                sampled_logger.warning(
+                    "bulk_item_parse",
+                    "Failed to parse bulk detail item",
+                    animal_id=(
+                        item.get("id") if isinstance(item, dict) else None
+                    ),
+                    error=truncate(e),
                 )
+        metrics.incr("api.bulk_detail.ids", len(details))
+        return details
+
+    def _fetch_details_bulk(
+        self, animal_ids: List[int]
+    ) -> Dict[int, AnimalRecord]:
+        details: Dict[int, AnimalRecord] = {}
+        chunk_size = settings.BULK_DETAILS_MAX_IDS
+
+        for i in range(0, len(animal_ids), chunk_size):
+            chunk = animal_ids[i : i + chunk_size]
+            try:
+                fetched = self.get_animals_details_bulk(chunk)
+            except Exception as e:
+                sampled_logger.error(
+                    "bulk_fetch_failed",
+                    "Bulk detail fetch failed, retrying per ID",
+                    batch_size=len(chunk),
+                    error=truncate(e),
+                )
+                continue
+            if fetched is None:
+                break
+            details.update((detail.id, detail) for detail in fetched)
+
+        return details
+
+    def _get_animal_record_hedged(self, animal_id: int) -> AnimalRecord:
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=self.concurrency * 2,
+                thread_name_prefix="hedge",
+            )
+        return hedged_call(
+            self._hedge_executor,
+            self.get_animal_record,
+            animal_id,
+            tracker=self.latency_tracker,
+            budget=self.hedge_budget,
+            min_delay=settings.HEDGE_MIN_DELAY,
+        )
+
+    def _fetch_details_concurrently(
+        self, animal_ids: List[int], failed_ids: List[int]
+    ) -> Dict[int, AnimalRecord]:
+        details: Dict[int, AnimalRecord] = {}
+        workers = max(1, min(self.concurrency, len(animal_ids)))
+
+        fetch = (
+            self._get_animal_record_hedged
+            if self.hedging_enabled
+            else self.get_animal_record
+        )
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (animal_id, executor.submit(fetch, animal_id))
+                for animal_id in animal_ids
+            ]
+            for animal_id, future in futures:
+                try:
+                    details[animal_id] = future.result()
+                except Exception as e:
+                    failed_ids.append(animal_id)
+                    sampled_logger.error(
+                        "detail_fetch_failed",
+                        "Failed to fetch animal",
+                        animal_id=animal_id,
+                        error=truncate(e),
+                    )
+
+        return details
+
+    def get_animals_details_batch(
+        self, animal_ids: List[int]
+    ) -> List[AnimalRecord]:
+        self.log.info(f"Fetching details for {len(animal_ids)} animals")
+        metrics.gauge("api.detail.batch_size", len(animal_ids))
+
+        failed_ids: List[int] = []
+        details: Dict[int, AnimalRecord] = {}
+
+        if animal_ids and self.detail_cache is not None:
+            details = self.detail_cache.get_many(animal_ids)
+        fetch_ids = [
+            animal_id
+            for animal_id in animal_ids
+            if animal_id not in details
+        ]
+
+        if fetch_ids and self.supports_bulk_details():
+            details.update(self._fetch_details_bulk(fetch_ids))
+
+        missing_ids = [
+            animal_id
+            for animal_id in animal_ids
+            if animal_id not in details
+        ]
+        if missing_ids:
+            details.update(
+                self._fetch_details_concurrently(missing_ids, failed_ids)
+            )
 
         if failed_ids:
+            metrics.incr("api.detail.failed_ids", len(failed_ids))
             self.log.warning(
-                f"Failed to fetch {len(failed_ids)} animals: {failed_ids}"
+                f"Failed to fetch {len(failed_ids)} animals: {failed_ids[:10]}"
+                + (" ..." if len(failed_ids) > 10 else "")
             )
 
-        return results
+        if self.detail_cache is not None:
+            self.detail_cache.put_many(
+                details[animal_id]
+                for animal_id in fetch_ids
+                if animal_id in details
+            )
+
+        return [
+            details[animal_id]
+            for animal_id in animal_ids
+            if animal_id in details
+        ]
 
-    @retry(
-        stop=stop_after_attempt(settings.MAX_RETRIES),
-        wait=wait_exponential(multiplier=settings.RETRY_DELAY, max=60),
-    )
+    @with_policy("home")
     def send_animals_to_home(self, animals: List[Dict[str, Any]]) -> bool:
         if len(animals) > 100:
             raise AirflowException(
@@ -161,10 +447,9 @@ class AnimalsAPIHook(BaseHook):
                 if isinstance(animals, list) and isinstance(
                     animals[0], dict
                 ):
-                    sample_data = json.dumps(
-                        animals[0], indent=2, default=str
+                    self.log.debug(
+                        f"Sample animal (first): {truncate(animals[0])}"
                     )
-                    self.log.info(f"Sample animal (first): {sample_data}")
                 else:
                     self.log.error(
                         f"Invalid data type: {type(animals)} containing {type(animals[0]) if animals else 'empty'}"
@@ -173,40 +458,40 @@ class AnimalsAPIHook(BaseHook):
             except Exception as e:
                 self.log.error(f"Error logging sample data: {e}")
                 self.log.info(f"Raw animals data type: {type(animals)}")
-                self.log.info(f"Raw animals content: {str(animals)[:500]}")
+                self.log.debug(f"Raw animals content: {truncate(animals)}")
                 return False
 
         try:
             payload_json = json.dumps(animals, default=str)
-            self.log.info(f"Payload size: {len(payload_json)} characters")
+            self.log.debug(f"Payload size: {len(payload_json)} characters")
         except Exception as e:
             self.log.error(f"Cannot serialize animals to JSON: {e}")
             return False
 
+        self._throttle()
         try:
             with httpx.Client(
-                base_url=self.base_url, timeout=self.timeout
+                base_url=self.base_url,
+                timeout=self.policy("home").timeout(),
             ) as client:
-                response = client.post("/animals/v1/home", json=animals)
+                with metrics.timed(
+                    "api.home.latency", batch_size=len(animals)
+                ):
+                    response = client.post(
+                        "/animals/v1/home", json=animals
+                    )
 
-                self.log.info(
+                self.log.debug(
                     f"POST response status: {response.status_code}"
                 )
-                self.log.info(
-                    f"POST response headers: {dict(response.headers)}"
-                )
 
                 if response.status_code >= 400:
                     self.log.error(
-                        f"HTTP Error {response.status_code}: {response.text}"
+                        f"HTTP Error {response.status_code}: {truncate(response.text)}"
                     )
                     response.raise_for_status()
 
-                try:
-                    response_data = response.json()
-                    self.log.info(f"Response data: {response_data}")
-                except:
-                    self.log.info(f"Response text: {response.text}")
+                self.log.debug(f"Response text: {truncate(response.text)}")
 
                 self.log.info(
                     f"Successfully sent {len(animals)} animals to home"
@@ -214,9 +499,10 @@ class AnimalsAPIHook(BaseHook):
                 return True
 
         except httpx.HTTPStatusError as e:
+            metrics.incr("api.home.errors")
             error_details = {
                 "status_code": e.response.status_code,
-                "response_text": e.response.text,
+                "response_text": truncate(e.response.text, 1000),
                 "request_url": str(e.request.url),
                 "request_method": e.request.method,
             }
@@ -228,6 +514,7 @@ class AnimalsAPIHook(BaseHook):
             ) from e
 
         except Exception as e:
+            metrics.incr("api.home.errors")
             self.log.error(f"Unexpected error: {str(e)}")
             raise ExternalAPIException(
                 f"Unexpected error while sending animals to home: {str(e)}",
@@ -238,9 +525,11 @@ class AnimalsAPIHook(BaseHook):
     def health_check(self) -> bool:
         try:
             with httpx.Client(
-                base_url=self.base_url, timeout=10
+                base_url=self.base_url,
+                timeout=self.policy("health").timeout(),
             ) as client:
-                response = client.get("/animals/v1/animals?page=1")
+                with metrics.timed("api.health.latency"):
+                    response = client.get("/animals/v1/animals?page=1")
                 return response.status_code == 200
         except Exception:
             return False
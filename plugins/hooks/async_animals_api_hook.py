@@ -0,0 +1,311 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from config.settings import settings
+from plugins.hooks.animals_api_hook import (
+    BULK_DETAILS_PATH,
+    BULK_UNSUPPORTED_STATUS_CODES,
+    AnimalsAPIHook,
+)
+from utils import metrics
+from utils.exceptions import ExternalAPIException
+from utils.log import SampledLogger, get_logger, truncate
+from utils.models import AnimalListItem, PaginatedResponse
+from utils.policies import with_async_policy
+from utils.records import AnimalRecord
+
+sampled_logger = SampledLogger(get_logger("hooks.async_animals_api"))
+
+
+class AsyncAnimalsAPIHook(AnimalsAPIHook):
+    hook_name = "Animals API (async)"
+
+    def __init__(
+        self,
+        animals_api_conn_id: str = AnimalsAPIHook.default_conn_name,
+        concurrency: Optional[int] = None,
+    ):
+        super().__init__(animals_api_conn_id=animals_api_conn_id)
+        self.concurrency = concurrency or settings.ASYNC_MAX_CONCURRENCY
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_connections = 0
+        self._retired_clients: List[httpx.AsyncClient] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_connections = self.concurrency
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                ),
+            )
+        return self._async_client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    def set_concurrency(self, concurrency: int) -> None:
+        if (
+            self._async_client is not None
+            and concurrency > self._async_connections
+        ):
+            self._retired_clients.append(self._async_client)
+            self._async_client = None
+        self.concurrency = concurrency
+        self._semaphore = None
+
+    async def aclose(self) -> None:
+        while self._retired_clients:
+            await self._retired_clients.pop().aclose()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self._semaphore = None
+        self.close()
+
+    async def _request(
+        self, endpoint: str, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+        async with self.semaphore:
+            with metrics.timed(f"api.{endpoint}.latency"):
+                return await self.async_client.request(
+                    method,
+                    url,
+                    timeout=self.policy(endpoint).timeout(),
+                    **kwargs,
+                )
+
+    @with_async_policy("list")
+    async def aget_animals_page(self, page: int = 1) -> PaginatedResponse:
+        try:
+            response = await self._request(
+                "list", "GET", "/animals/v1/animals", params={"page": page}
+            )
+            response.raise_for_status()
+            return PaginatedResponse(**response.json())
+        except Exception as e:
+            metrics.incr("api.list.errors")
+            raise ExternalAPIException(
+                f"Failed to fetch animals page {page}: {str(e)}"
+            ) from e
+
+    async def aiter_animal_pages(
+        self,
+    ) -> AsyncIterator[List[AnimalListItem]]:
+        first = await self.aget_animals_page(1)
+        self.log.info(
+            f"Fetched page 1/{first.total_pages}: {len(first.items)} animals"
+        )
+        self.failed_list_items.extend(first.failed_items)
+        yield first.items
+
+        last_page = min(first.total_pages, 1000)
+        window = max(1, self.concurrency)
+        for start in range(2, last_page + 1, window):
+            pages = range(start, min(start + window, last_page + 1))
+            responses = await asyncio.gather(
+                *(self.aget_animals_page(page) for page in pages)
+            )
+            for page, response in zip(pages, responses):
+                self.log.info(
+                    f"Fetched page {page}: {len(response.items)} animals"
+                )
+                self.failed_list_items.extend(response.failed_items)
+                yield response.items
+
+    @with_async_policy("detail")
+    async def aget_animal_record(self, animal_id: int) -> AnimalRecord:
+        try:
+            response = await self._request(
+                "detail", "GET", f"/animals/v1/animals/{animal_id}"
+            )
+            response.raise_for_status()
+            return AnimalRecord.from_payload(response.json())
+        except Exception as e:
+            metrics.incr("api.detail.errors")
+            raise ExternalAPIException(
+                f"Failed to fetch animal {animal_id}: {str(e)}"
+            ) from e
+
+    @with_async_policy("bulk_detail")
+    async def aget_animals_details_bulk(
+        self, animal_ids: List[int]
+    ) -> Optional[List[AnimalRecord]]:
+        try:
+            response = await self._request(
+                "bulk_detail",
+                "POST",
+                BULK_DETAILS_PATH,
+                json={"ids": animal_ids},
+            )
+            if response.status_code in BULK_UNSUPPORTED_STATUS_CODES:
+                self._bulk_supported = False
+                return None
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            metrics.incr("api.bulk_detail.errors")
+            raise ExternalAPIException(
+                f"Failed to fetch {len(animal_ids)} animals in bulk: {str(e)}"
+            ) from e
+
+        items = data.get("items", []) if isinstance(data, dict) else data
+        records = []
+        for item in items:
+            try:
+                records.append(AnimalRecord.from_payload(item))
+            except Exception as e:
+                sampled_logger.warning(
+                    "bulk_item_parse",
+                    "Failed to parse bulk detail item",
+                    error=truncate(e),
+                )
+        metrics.incr("api.bulk_detail.ids", len(records))
+        return records
+
+    async def asupports_bulk_details(self) -> bool:
+        if self._bulk_supported is None:
+            self._bulk_supported = False
+            if settings.BULK_DETAILS_ENABLED:
+                try:
+                    response = await self._request(
+                        "health",
+                        "POST",
+                        BULK_DETAILS_PATH,
+                        json={"ids": []},
+                    )
+                    self._bulk_supported = response.status_code == 200
+                except httpx.HTTPError as e:
+                    self.log.warning(f"Bulk detail probe failed: {e}")
+        return self._bulk_supported
+
+    async def aget_animals_details_batch(
+        self, animal_ids: List[int]
+    ) -> List[AnimalRecord]:
+        metrics.gauge("api.detail.batch_size", len(animal_ids))
+        details: Dict[int, AnimalRecord] = {}
+
+        if animal_ids and self.detail_cache is not None:
+            details = self.detail_cache.get_many(animal_ids)
+        fetch_ids = [
+            animal_id
+            for animal_id in animal_ids
+            if animal_id not in details
+        ]
+
+        if fetch_ids and await self.asupports_bulk_details():
+            chunk_size = settings.BULK_DETAILS_MAX_IDS
+            chunks = [
+                fetch_ids[i : i + chunk_size]
+                for i in range(0, len(fetch_ids), chunk_size)
+            ]
+            results = await asyncio.gather(
+                *(
+                    self.aget_animals_details_bulk(chunk)
+                    for chunk in chunks
+                ),
+                return_exceptions=True,
+            )
+            for chunk, result in zip(chunks, results):
+                if isinstance(result, BaseException):
+                    sampled_logger.error(
+                        "bulk_fetch_failed",
+                        "Bulk detail fetch failed, retrying per ID",
+                        batch_size=len(chunk),
+                        error=truncate(result),
+                    )
+                elif result:
+                    details.update(
+                        (record.id, record) for record in result
+                    )
+
+        missing_ids = [
+            animal_id
+            for animal_id in fetch_ids
+            if animal_id not in details
+        ]
+        results = await asyncio.gather(
+            *(
+                self.aget_animal_record(animal_id)
+                for animal_id in missing_ids
+            ),
+            return_exceptions=True,
+        )
+
+        failed_ids = []
+        for animal_id, result in zip(missing_ids, results):
+            if isinstance(result, BaseException):
+                failed_ids.append(animal_id)
+                sampled_logger.error(
+                    "detail_fetch_failed",
+                    "Failed to fetch animal",
+                    animal_id=animal_id,
+                    error=truncate(result),
+                )
+            else:
+                details[animal_id] = result
+
+        if failed_ids:
+            metrics.incr("api.detail.failed_ids", len(failed_ids))
+            self.log.warning(
+                f"Failed to fetch {len(failed_ids)} animals: {failed_ids[:10]}"
+                + (" ..." if len(failed_ids) > 10 else "")
+            )
+
+        if self.detail_cache is not None:
+            self.detail_cache.put_many(
+                details[animal_id]
+                for animal_id in fetch_ids
+                if animal_id in details
+            )
+
+        return [
+            details[animal_id]
+            for animal_id in animal_ids
+            if animal_id in details
+        ]
+
+    @with_async_policy("home")
+    async def asend_animals_to_home(
+        self, animals: List[Dict[str, Any]]
+    ) -> bool:
+        if len(animals) > 100:
+            raise ExternalAPIException(
+                f"Batch size too large: {len(animals)} > 100"
+            )
+
+        try:
+            response = await self._request(
+                "home", "POST", "/animals/v1/home", json=animals
+            )
+            response.raise_for_status()
+            return True
+        except httpx.HTTPStatusError as e:
+            metrics.incr("api.home.errors")
+            raise ExternalAPIException(
+                f"HTTP {e.response.status_code} error sending animals to home",
+                error_code="HTTP_ERROR",
+                details={
+                    "status_code": e.response.status_code,
+                    "response_text": truncate(e.response.text, 1000),
+                },
+            ) from e
+        except Exception as e:
+            metrics.incr("api.home.errors")
+            raise ExternalAPIException(
+                f"Unexpected error while sending animals to home: {str(e)}",
+                error_code="UNEXPECTED_ERROR",
+                details={"error": str(e)},
+            ) from e
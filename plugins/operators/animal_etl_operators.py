@@ -1,59 +1,482 @@
 import json
 import os
 import tempfile
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from contextlib import nullcontext
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from airflow.exceptions import AirflowException
 from airflow.models import BaseOperator
 from airflow.utils.context import Context
 
 from config.settings import settings
-from plugins.hooks.animals_api_hook import AnimalsAPIHook
-from utils.models import AnimalDetail
-from utils.transformers import AnimalDataTransformer
+from utils import metrics
+from utils.exceptions import ValidationException
+from utils.manifest import (
+    ManifestWriter,
+    get_manifest_entry,
+    manifest_reference,
+)
+from utils.profiling import profile_task
+
+
+def page_rows(
+    items: List[Any],
+    failed_items: List[Dict[str, Any]],
+    prefilter,
+    quarantine,
+) -> List[List[Any]]:
+    from utils.spill import to_row
+
+    rows = []
+    for animal in items:
+        item = animal.dict()
+        if "born_at" not in animal.model_fields_set:
+            del item["born_at"]
+        rejected = prefilter.check(item) if prefilter else None
+        if rejected is not None:
+            quarantine.write(
+                "prefilter", rejected[0], item["id"], item, rejected[1]
+            )
+            continue
+        rows.append(to_row(item))
+    for failed in failed_items:
+        item = failed["item"]
+        quarantine.write(
+            "list",
+            "parse_error",
+            item.get("id") if isinstance(item, dict) else None,
+            item,
+            failed["error"],
+        )
+    return rows
 
 
 class ExtractAnimalsOperator(BaseOperator):
     template_fields = ("animals_api_conn_id",)
 
     def __init__(
-        self, animals_api_conn_id: str = "animals_api_default", **kwargs
+        self,
+        animals_api_conn_id: str = "animals_api_default",
+        profile: Optional[bool] = None,
+        prefilter_rules: Optional[List[str]] = None,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self.animals_api_conn_id = animals_api_conn_id
-
-    def execute(self, context: Context) -> Dict[str, Any]:
-        hook = AnimalsAPIHook(animals_api_conn_id=self.animals_api_conn_id)
-        animals = hook.get_all_animals()
-
-        temp_dir = tempfile.gettempdir()
-        temp_file = os.path.join(
-            temp_dir, f"animals_data_{context['run_id']}.json"
+        self.profile = profile
+        self.prefilter_rules = (
+            prefilter_rules
+            if prefilter_rules is not None
+            else settings.PREFILTER_RULES
         )
 
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(animals, f, ensure_ascii=False, indent=2)
+    def execute(self, context: Context) -> Dict[str, Any]:
+        with profile_task(
+            context, self.task_id, enabled=self.profile, log=self.log
+        ):
+            return self._extract(context)
+
+    def _extract(self, context: Context) -> Dict[str, Any]:
+        from utils.log import summarize_sampled_warnings
+        from utils.prefilter import PreFilter
+        from utils.quarantine import QuarantineWriter, quarantine_path
+        from utils.spill import SpillWriter
+
+        prefilter = PreFilter(self.prefilter_rules)
+        quarantine = QuarantineWriter(quarantine_path(context["run_id"]))
+
+        with metrics.stage(
+            "extract", run_id=context["run_id"]
+        ) as stats, quarantine:
+            hook = self._create_hook()
+
+            temp_dir = tempfile.gettempdir()
+            temp_file = os.path.join(
+                temp_dir, f"animals_data_{context['run_id']}.jsonl"
+            )
 
+            with SpillWriter(temp_file) as writer:
+                for items in self._iter_pages(hook):
+                    for row in page_rows(
+                        items,
+                        hook.failed_list_items,
+                        prefilter,
+                        quarantine,
+                    ):
+                        writer.append(row)
+                    hook.failed_list_items.clear()
+
+            self._close_hook(hook)
+            stats.records = writer.count
+            stats.bytes_written = writer.bytes_written
+
+        for rule, count in prefilter.counts.items():
+            metrics.incr(f"extract.prefilter.{rule}", count)
+
+        summarize_sampled_warnings()
         self.log.info(
-            f"Extracted {len(animals)} animals, stored in {temp_file}"
+            f"Extracted {writer.count} animals, stored in {temp_file} ({writer.spills} spills, peak RSS {stats.peak_rss_mb:.1f} MB)"
         )
+        if quarantine.total:
+            self.log.warning(
+                f"Quarantined {quarantine.total} animals in {quarantine.path}: {dict(quarantine.counts)}"
+            )
 
         return {
-            "total_animals": len(animals),
+            "total_animals": writer.count,
             "temp_file": temp_file,
             "status": "completed",
+            "prefilter": prefilter.summary(),
+            **quarantine.summary(),
+            "metrics": stats.as_dict(),
         }
 
+    def _create_hook(self):
+        from plugins.hooks.animals_api_hook import AnimalsAPIHook
+
+        return AnimalsAPIHook(animals_api_conn_id=self.animals_api_conn_id)
+
+    def _iter_pages(self, hook) -> Iterator[List[Any]]:
+        return hook.iter_animal_pages()
+
+    def _close_hook(self, hook) -> None:
+        hook.close()
+
 
 class TransformAnimalsOperator(BaseOperator):
     template_fields = ("batch_size",)
 
-    def __init__(self, batch_size: int = settings.BATCH_SIZE, **kwargs):
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        profile: Optional[bool] = None,
+        use_process_pool: Optional[bool] = None,
+        transform_processes: Optional[int] = None,
+        optional_detail_fields: Optional[List[str]] = None,
+        results_db_path: Optional[str] = None,
+        load_changes_only: Optional[bool] = None,
+        friends_graph: Optional[bool] = None,
+        autotune: Optional[bool] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
-        self.batch_size = batch_size
-        self.transformer = AnimalDataTransformer()
+        self.batch_size = (
+            batch_size if batch_size is not None else settings.BATCH_SIZE
+        )
+        self.profile = profile
+        self.use_process_pool = use_process_pool
+        self.transform_processes = transform_processes
+        self.optional_detail_fields = (
+            optional_detail_fields
+            if optional_detail_fields is not None
+            else settings.DETAIL_OPTIONAL_FIELDS
+        )
+        self.results_db_path = (
+            results_db_path
+            if results_db_path is not None
+            else settings.RESULTS_DB_PATH
+        )
+        self.load_changes_only = (
+            load_changes_only
+            if load_changes_only is not None
+            else settings.LOAD_CHANGES_ONLY
+        )
+        self.friends_graph = (
+            friends_graph
+            if friends_graph is not None
+            else settings.FRIENDS_GRAPH_ENABLED
+        )
+        self.autotune = (
+            autotune if autotune is not None else settings.AUTOTUNE_ENABLED
+        )
+
+    @cached_property
+    def transformer(self):
+        from utils.transformers import AnimalDataTransformer
+
+        return AnimalDataTransformer()
 
     def execute(self, context: Context) -> Dict[str, Any]:
+        with profile_task(
+            context, self.task_id, enabled=self.profile, log=self.log
+        ):
+            return self._transform(context)
+
+    def _transform(self, context: Context) -> Dict[str, Any]:
+        temp_file, total_animals = self._load_input(context)
+
+        from utils.autotune import AutoTuner, save_tuning
+        from utils.deadline import RunDeadline
+        from utils.diff import RunDiff
+        from utils.friends import FriendInterner, FriendsGraph
+        from utils.log import summarize_sampled_warnings
+        from utils.projection import plan_detail_fetches
+        from utils.quarantine import (
+            QuarantineWriter,
+            quarantine_path,
+            quarantine_transform_failures,
+        )
+        from utils.results_db import ResultStore
+        from utils.spill import from_row
+        from utils.transformers import ProcessPoolTransformer
+
+        hook = self._create_hook()
+        deadline = RunDeadline.from_context(context)
+        hook.deadline = deadline
+        tuner = (
+            AutoTuner.for_connection(
+                hook.animals_api_conn_id,
+                self.batch_size,
+                hook.concurrency,
+            )
+            if self.autotune
+            else None
+        )
+
+        interner = graph = name_index = None
+        if self.friends_graph:
+            interner = FriendInterner()
+            graph = FriendsGraph(interner)
+            if settings.FRIENDS_RESOLVE_IDS:
+                name_index = self._name_index(temp_file, interner)
+        quarantine = QuarantineWriter(quarantine_path(context["run_id"]))
+
+        batches = self._batches(
+            temp_file, deadline, tuner, quarantine, name_index
+        )
+        pending_count: Optional[int] = None
+
+        total_processed = 0
+        requests_avoided = 0
+        manifest_path = os.path.join(
+            tempfile.gettempdir(),
+            f"load_manifest_{context['run_id']}.jsonl",
+        )
+
+        use_process_pool = (
+            self.use_process_pool
+            if self.use_process_pool is not None
+            else settings.TRANSFORM_POOL_ENABLED
+        )
+        pool = (
+            ProcessPoolTransformer(processes=self.transform_processes)
+            if use_process_pool
+            else nullcontext()
+        )
+        store = (
+            ResultStore(self.results_db_path)
+            if self.results_db_path
+            else None
+        )
+        if self.load_changes_only and store is None:
+            self.log.warning(
+                "load_changes_only needs a results database, loading everything"
+            )
+        differ = (
+            RunDiff.for_run(store, context["run_id"])
+            if self.load_changes_only and store is not None
+            else None
+        )
+        pending = deque()
+
+        with metrics.stage(
+            "transform", run_id=context["run_id"]
+        ) as stats, ManifestWriter(
+            manifest_path
+        ) as manifest, pool, store or nullcontext(), quarantine:
+            if use_process_pool:
+                self.log.info(
+                    f"Transforming with a pool of {pool.processes} processes"
+                )
+
+            for position, (_, rows) in enumerate(batches):
+                if deadline is not None and deadline.expired(
+                    settings.RUN_DEADLINE_RESERVE
+                ):
+                    pending_count = 0
+                    for row in self._pending_rows(rows, batches):
+                        quarantine.write(
+                            "deadline",
+                            "pending",
+                            row[0],
+                            from_row(row),
+                            "Run deadline reached",
+                        )
+                        pending_count += 1
+                    self.log.warning(
+                        f"Run deadline near, stopped before batch {position + 1} with {pending_count} animals pending"
+                    )
+                    break
+
+                if tuner is not None:
+                    hook.set_concurrency(tuner.concurrency)
+                batch_started = time.perf_counter()
+
+                self.log.info(
+                    f"Processing batch {position + 1}: IDs {rows[0][0]} to {rows[-1][0]}"
+                )
+                metrics.gauge("transform.batch_size", len(rows))
+
+                plan = plan_detail_fetches(
+                    [from_row(row) for row in rows],
+                    self.optional_detail_fields,
+                )
+                requests_avoided += plan.requests_avoided
+                metrics.incr(
+                    "transform.detail_requests_avoided",
+                    plan.requests_avoided,
+                )
+                batch_details = plan.merge(
+                    self._fetch_details(hook, plan.fetch_ids)
+                    if plan.fetch_ids
+                    else []
+                )
+                if len(batch_details) < len(rows):
+                    fetched_ids = {record.id for record in batch_details}
+                    for row in rows:
+                        if row[0] not in fetched_ids:
+                            quarantine.write(
+                                "detail",
+                                "fetch_failed",
+                                row[0],
+                                from_row(row),
+                                "Detail fetch failed",
+                            )
+
+                if use_process_pool:
+                    pending.append(
+                        (pool.submit(batch_details), batch_details)
+                    )
+                    while len(pending) > pool.max_pending:
+                        future, records = pending.popleft()
+                        animals = pool.result(future)
+                        quarantine_transform_failures(
+                            quarantine, records, animals
+                        )
+                        total_processed += self._write_load_batches(
+                            animals,
+                            manifest,
+                            stats,
+                            context["run_id"],
+                            store,
+                            differ,
+                            graph,
+                        )
+                else:
+                    animals = self.transformer.transform_records_batch(
+                        batch_details, interner
+                    )
+                    quarantine_transform_failures(
+                        quarantine, batch_details, animals
+                    )
+                    total_processed += self._write_load_batches(
+                        animals,
+                        manifest,
+                        stats,
+                        context["run_id"],
+                        store,
+                        differ,
+                        graph,
+                    )
+
+                if tuner is not None:
+                    tuner.record(
+                        len(rows),
+                        time.perf_counter() - batch_started,
+                        len(rows) - len(batch_details),
+                    )
+                self.log.info(
+                    f"Processed {total_processed}/{total_animals or '?'} animals so far"
+                )
+
+            while pending:
+                future, records = pending.popleft()
+                animals = pool.result(future)
+                quarantine_transform_failures(quarantine, records, animals)
+                total_processed += self._write_load_batches(
+                    animals,
+                    manifest,
+                    stats,
+                    context["run_id"],
+                    store,
+                    differ,
+                    graph,
+                )
+
+            if differ is not None and pending_count is None:
+                differ.finish()
+
+        self._close_hook(hook)
+
+        checkpoint = {}
+        if pending_count is not None:
+            metrics.incr("transform.deadline_pending", pending_count)
+            checkpoint["pending_animals"] = pending_count
+        if temp_file:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                self.log.warning(
+                    f"Could not remove temp file: {temp_file}"
+                )
+
+        if self.load_changes_only and store is not None:
+            checkpoint["diff"] = {
+                "results_db_path": self.results_db_path,
+                "run_id": context["run_id"],
+                **(differ.as_dict() if differ is not None else {}),
+            }
+            if differ is not None:
+                for key in ("inserted", "updated", "unchanged", "deleted"):
+                    metrics.incr(
+                        f"transform.diff.{key}", getattr(differ, key)
+                    )
+                self.log.info(f"Load diff: {differ.as_dict()}")
+
+        if tuner is not None:
+            checkpoint["autotune"] = tuner.report()
+            if tuner.best is not None:
+                save_tuning(
+                    hook.animals_api_conn_id, checkpoint["autotune"]
+                )
+            self.log.info(f"Autotune: {checkpoint['autotune']['reason']}")
+
+        if graph is not None:
+            checkpoint["friends_graph"] = graph.validate(name_index)
+            for key, value in checkpoint["friends_graph"].items():
+                metrics.gauge(f"transform.friends_graph.{key}", value)
+            self.log.info(
+                f"Friends graph: {checkpoint['friends_graph']} ({interner.cache_hits} cached parses)"
+            )
+
+        if quarantine.total:
+            self.log.warning(
+                f"Quarantined {quarantine.total} animals in {quarantine.path}: {dict(quarantine.counts)}"
+            )
+
+        summarize_sampled_warnings()
+        self.log.info(
+            f"Transformed {total_processed} animals into {manifest.total_batches} load batches, manifest {manifest_path}, peak RSS {stats.peak_rss_mb:.1f} MB"
+        )
+        self.log.info(
+            f"Skipped {requests_avoided}/{total_animals or total_processed} detail fetches using list data"
+        )
+
+        return {
+            **manifest.reference(),
+            "status": "partial"
+            if pending_count is not None
+            else "completed",
+            "detail_requests_avoided": requests_avoided,
+            **quarantine.summary(),
+            **checkpoint,
+            "metrics": stats.as_dict(),
+        }
+
+    def _load_input(self, context: Context) -> Tuple[Optional[str], int]:
         extract_result = context["task_instance"].xcom_pull(
             task_ids="extract_animals"
         )
@@ -65,85 +488,230 @@ class TransformAnimalsOperator(BaseOperator):
 
         temp_file = extract_result["temp_file"]
 
-        try:
-            with open(temp_file, "r", encoding="utf-8") as f:
-                animals_data = json.load(f)
-        except FileNotFoundError:
+        if not os.path.exists(temp_file):
             raise AirflowException(
                 f"Animals data file not found: {temp_file}"
             )
-        except json.JSONDecodeError as e:
-            raise AirflowException(
-                f"Invalid JSON in animals data file: {e}"
-            )
-
-        self.log.info(
-            f"Loaded {len(animals_data)} animals from {temp_file}"
-        )
+        return temp_file, extract_result.get("total_animals", 0)
 
-        hook = AnimalsAPIHook()
-        animal_ids = [animal["id"] for animal in animals_data]
+    def _name_index(self, temp_file: Optional[str], interner):
+        from utils.friends import NameIndex
+        from utils.spill import iter_rows
 
-        all_transformed_batches = []
-        total_processed = 0
+        return NameIndex.from_rows(iter_rows(temp_file), interner)
 
-        for i in range(0, len(animal_ids), self.batch_size):
-            batch_ids = animal_ids[i : i + self.batch_size]
-            self.log.info(
-                f"Processing batch {i//self.batch_size + 1}: IDs {batch_ids[0]} to {batch_ids[-1]}"
+    def _batches(
+        self,
+        temp_file: Optional[str],
+        deadline,
+        tuner,
+        quarantine,
+        name_index,
+    ) -> Iterator[Tuple[Any, List[List[Any]]]]:
+        from utils.spill import iter_row_batches, iter_rows, read_row_batch
+
+        if deadline is None and tuner is not None:
+            return tuner.batches(iter_rows(temp_file))
+        if deadline is None:
+            return iter_row_batches(temp_file, self.batch_size)
+        batches = (
+            (offset, read_row_batch(temp_file, offset, self.batch_size))
+            for offset in self._prioritize_batches(temp_file)
+        )
+        if tuner is not None:
+            return tuner.batches(
+                row for _, rows in batches for row in rows
             )
+        return batches
 
-            batch_details = hook.get_animals_details_batch(batch_ids)
-            transformed_animals = self.transformer.transform_animals_batch(
-                batch_details
+    def _pending_rows(
+        self,
+        rows: List[List[Any]],
+        batches: Iterator[Tuple[Any, List[List[Any]]]],
+    ) -> Iterator[List[Any]]:
+        yield from rows
+        for _, batch in batches:
+            yield from batch
+
+    def _create_hook(self):
+        from plugins.hooks.animals_api_hook import AnimalsAPIHook
+
+        return AnimalsAPIHook()
+
+    def _fetch_details(self, hook, animal_ids: List[int]) -> List[Any]:
+        return hook.get_animals_details_batch(animal_ids)
+
+    def _close_hook(self, hook) -> None:
+        hook.close()
+
+    def _prioritize_batches(self, temp_file: str) -> List[int]:
+        from utils.projection import missing_fields
+        from utils.spill import from_row, iter_row_batches
+
+        fetches_needed = {
+            offset: sum(
+                1
+                for row in rows
+                if missing_fields(
+                    from_row(row),
+                    optional_fields=self.optional_detail_fields,
+                )
             )
-            animals_api_format = self.transformer.to_api_format(
-                transformed_animals
+            for offset, rows in iter_row_batches(
+                temp_file, self.batch_size
             )
+        }
+        return sorted(fetches_needed, key=fetches_needed.get)
 
-            for j in range(0, len(animals_api_format), 100):
-                load_batch = animals_api_format[j : j + 100]
+    def _write_load_batches(
+        self,
+        animals_api_format: List[Dict[str, Any]],
+        manifest: ManifestWriter,
+        stats: metrics.StageStats,
+        run_id: str,
+        store=None,
+        differ=None,
+        graph=None,
+    ) -> int:
+        to_load = (
+            animals_api_format
+            if differ is None
+            else differ.changed(animals_api_format)
+        )
+        for j in range(0, len(to_load), 100):
+            load_batch = to_load[j : j + 100]
 
-                batch_file = os.path.join(
-                    tempfile.gettempdir(),
-                    f"load_batch_{len(all_transformed_batches)}_{context['run_id']}.json",
-                )
+            batch_file = os.path.join(
+                tempfile.gettempdir(),
+                f"load_batch_{manifest.total_batches}_{run_id}.json",
+            )
 
-                with open(batch_file, "w", encoding="utf-8") as f:
-                    json.dump(load_batch, f, ensure_ascii=False, indent=2)
+            with open(batch_file, "w", encoding="utf-8") as f:
+                json.dump(load_batch, f, ensure_ascii=False, indent=2)
 
-                all_transformed_batches.append(
-                    {
-                        "file": batch_file,
-                        "count": len(load_batch),
-                        "batch_index": len(all_transformed_batches),
-                    }
-                )
+            stats.bytes_written += os.path.getsize(batch_file)
+            manifest.add(batch_file, len(load_batch))
 
-            total_processed += len(transformed_animals)
-            self.log.info(
-                f"Processed {total_processed}/{len(animal_ids)} animals so far"
-            )
+        if store is not None:
+            store.write(run_id, animals_api_format)
+        if graph is not None:
+            for animal in animals_api_format:
+                graph.add(animal["id"], animal["friends"])
 
-        try:
-            os.remove(temp_file)
-        except OSError:
-            self.log.warning(f"Could not remove temp file: {temp_file}")
+        stats.records += len(animals_api_format)
+        stats.batches = manifest.total_batches
+        return len(animals_api_format)
 
-        self.log.info(
-            f"Transformed {total_processed} animals into {len(all_transformed_batches)} load batches"
+
+class PrefetchTransformAnimalsOperator(TransformAnimalsOperator):
+    template_fields = ("animals_api_conn_id", "batch_size")
+
+    def __init__(
+        self,
+        animals_api_conn_id: str = "animals_api_default",
+        prefilter_rules: Optional[List[str]] = None,
+        prefetch_depth: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.animals_api_conn_id = animals_api_conn_id
+        self.prefilter_rules = (
+            prefilter_rules
+            if prefilter_rules is not None
+            else settings.PREFILTER_RULES
         )
+        self.prefetch_depth = (
+            prefetch_depth
+            if prefetch_depth is not None
+            else settings.PREFETCH_DEPTH
+        )
+        self._prefetcher = None
+        self._prefilter = None
+
+    def _transform(self, context: Context) -> Dict[str, Any]:
+        from utils.prefilter import PreFilter
 
+        self._prefilter = PreFilter(self.prefilter_rules)
+        try:
+            result = super()._transform(context)
+        finally:
+            if self._prefetcher is not None:
+                self._prefetcher.close()
+
+        for rule, count in self._prefilter.counts.items():
+            metrics.incr(f"extract.prefilter.{rule}", count)
+        prefetch = self._prefetcher.stats()
+        self._prefetcher = None
+        metrics.gauge(
+            "transform.prefetch.consumer_wait",
+            prefetch["consumer_wait_seconds"],
+        )
+        self.log.info(f"Prefetched list pages: {prefetch}")
         return {
-            "total_batches": len(all_transformed_batches),
-            "total_animals": total_processed,
-            "batch_files": [
-                batch["file"] for batch in all_transformed_batches
-            ],
-            "batch_info": all_transformed_batches,
-            "status": "completed",
+            **result,
+            "prefilter": self._prefilter.summary(),
+            "prefetch": prefetch,
         }
 
+    def _load_input(self, context: Context) -> Tuple[Optional[str], int]:
+        return None, 0
+
+    def _name_index(self, temp_file: Optional[str], interner):
+        from utils.friends import NameIndex
+
+        return NameIndex(interner)
+
+    def _batches(
+        self,
+        temp_file: Optional[str],
+        deadline,
+        tuner,
+        quarantine,
+        name_index,
+    ) -> Iterator[Tuple[Any, List[List[Any]]]]:
+        from plugins.hooks.animals_api_hook import AnimalsAPIHook
+        from utils.prefetch import Prefetcher, batched
+
+        list_hook = AnimalsAPIHook(
+            animals_api_conn_id=self.animals_api_conn_id
+        )
+        self._prefetcher = Prefetcher(
+            self._pages(list_hook),
+            depth=self.prefetch_depth,
+            name=f"{self.task_id}.pages",
+        )
+        rows = self._stream_rows(quarantine, name_index)
+        if tuner is not None:
+            return tuner.batches(rows)
+        return batched(rows, self.batch_size)
+
+    def _pages(self, hook) -> Iterator[Tuple[List[Any], List[Any]]]:
+        try:
+            for items in hook.iter_animal_pages():
+                failed_items = list(hook.failed_list_items)
+                hook.failed_list_items.clear()
+                yield items, failed_items
+        finally:
+            hook.close()
+
+    def _stream_rows(self, quarantine, name_index) -> Iterator[List[Any]]:
+        for items, failed_items in self._prefetcher:
+            rows = page_rows(
+                items, failed_items, self._prefilter, quarantine
+            )
+            if name_index is not None:
+                for row in rows:
+                    name_index.add(row[0], row[1])
+            yield from rows
+
+    def _pending_rows(
+        self,
+        rows: List[List[Any]],
+        batches: Iterator[Tuple[Any, List[List[Any]]]],
+    ) -> Iterator[List[Any]]:
+        self._prefetcher.stop()
+        return super()._pending_rows(rows, batches)
+
 
 class LoadAnimalsBatchOperator(BaseOperator):
     template_fields = ("animals_api_conn_id", "batch_index")
@@ -152,33 +720,44 @@ class LoadAnimalsBatchOperator(BaseOperator):
         self,
         animals_api_conn_id: str = "animals_api_default",
         batch_index: int = 0,
+        profile: Optional[bool] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.animals_api_conn_id = animals_api_conn_id
         self.batch_index = batch_index
+        self.profile = profile
 
     def execute(self, context: Context) -> Dict[str, Any]:
+        with profile_task(
+            context, self.task_id, enabled=self.profile, log=self.log
+        ):
+            return self._load(context)
+
+    def _load(self, context: Context) -> Dict[str, Any]:
         transform_result = context["task_instance"].xcom_pull(
             task_ids="transform_animals"
         )
 
-        if not transform_result or "batch_info" not in transform_result:
-            self.log.warning("No batch info received from transform task")
-            return {"status": "skipped", "reason": "no_batch_info"}
+        manifest = manifest_reference(transform_result)
+        if manifest is None:
+            self.log.warning("No manifest received from transform task")
+            return {"status": "skipped", "reason": "no_manifest"}
 
-        batch_info_list = transform_result["batch_info"]
+        try:
+            batch_info = get_manifest_entry(manifest, self.batch_index)
+        except ValidationException as e:
+            raise AirflowException(e.message) from e
 
-        if self.batch_index >= len(batch_info_list):
+        if batch_info is None:
             self.log.warning(
-                f"Batch index {self.batch_index} not found (only {len(batch_info_list)} batches)"
+                f"Batch index {self.batch_index} not found (only {manifest['total_batches']} batches)"
             )
             return {
                 "status": "skipped",
                 "reason": "batch_index_out_of_range",
             }
 
-        batch_info = batch_info_list[self.batch_index]
         batch_file = batch_info["file"]
 
         try:
@@ -199,8 +778,15 @@ class LoadAnimalsBatchOperator(BaseOperator):
                 f"Batch animals are not objects: {type(batch_animals[0])}"
             )
 
-        hook = AnimalsAPIHook(animals_api_conn_id=self.animals_api_conn_id)
-        success = hook.send_animals_to_home(batch_animals)
+        from plugins.hooks.animals_api_hook import AnimalsAPIHook
+
+        with metrics.stage("load", batch_index=self.batch_index) as stats:
+            hook = AnimalsAPIHook(
+                animals_api_conn_id=self.animals_api_conn_id
+            )
+            success = hook.send_animals_to_home(batch_animals)
+            stats.batches = 1
+            stats.records = len(batch_animals) if success else 0
 
         try:
             os.remove(batch_file)
@@ -219,6 +805,136 @@ class LoadAnimalsBatchOperator(BaseOperator):
         }
 
 
+class ReplayQuarantineOperator(BaseOperator):
+    template_fields = ("source_run_id", "animals_api_conn_id")
+
+    def __init__(
+        self,
+        source_run_id: str,
+        animals_api_conn_id: str = "animals_api_default",
+        stages: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+        profile: Optional[bool] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.source_run_id = source_run_id
+        self.animals_api_conn_id = animals_api_conn_id
+        self.stages = (
+            stages
+            if stages is not None
+            else [
+                "list",
+                "detail",
+                "transform",
+                "queue",
+                "deadline",
+                "load",
+            ]
+        )
+        self.batch_size = (
+            batch_size if batch_size is not None else settings.BATCH_SIZE
+        )
+        self.profile = profile
+
+    def execute(self, context: Context) -> Dict[str, Any]:
+        with profile_task(
+            context, self.task_id, enabled=self.profile, log=self.log
+        ):
+            return self._replay(context)
+
+    def _replay(self, context: Context) -> Dict[str, Any]:
+        from plugins.hooks.animals_api_hook import AnimalsAPIHook
+        from utils.quarantine import (
+            QuarantineWriter,
+            iter_quarantine,
+            quarantine_path,
+            quarantine_transform_failures,
+        )
+        from utils.transformers import AnimalDataTransformer
+
+        source_path = quarantine_path(self.source_run_id)
+        entries: Dict[int, Dict[str, Any]] = {}
+        for entry in iter_quarantine(source_path):
+            if entry["stage"] in self.stages and isinstance(
+                entry["id"], int
+            ):
+                entries[entry["id"]] = entry
+
+        if not entries:
+            self.log.warning(f"Nothing to replay in {source_path}")
+            return {"status": "no_data", "replayed": 0}
+
+        refetch_ids = [
+            animal_id
+            for animal_id, entry in entries.items()
+            if entry["stage"] != "load"
+        ]
+        to_load = [
+            entry["payload"]
+            for entry in entries.values()
+            if entry["stage"] == "load"
+        ]
+        self.log.info(
+            f"Replaying {len(entries)} animals from {source_path}: {len(refetch_ids)} to re-fetch, {len(to_load)} to re-load"
+        )
+
+        hook = AnimalsAPIHook(animals_api_conn_id=self.animals_api_conn_id)
+        quarantine = QuarantineWriter(quarantine_path(context["run_id"]))
+        loaded = 0
+
+        with metrics.stage(
+            "replay", run_id=context["run_id"]
+        ) as stats, quarantine:
+            for i in range(0, len(refetch_ids), self.batch_size):
+                chunk = refetch_ids[i : i + self.batch_size]
+                records = hook.get_animals_details_batch(chunk)
+                fetched_ids = {record.id for record in records}
+                for animal_id in chunk:
+                    if animal_id not in fetched_ids:
+                        quarantine.write(
+                            "detail",
+                            "fetch_failed",
+                            animal_id,
+                            entries[animal_id]["payload"],
+                            "Detail fetch failed",
+                        )
+                animals = AnimalDataTransformer.transform_records_batch(
+                    records
+                )
+                quarantine_transform_failures(quarantine, records, animals)
+                to_load.extend(animals)
+
+            for i in range(0, len(to_load), 100):
+                batch = to_load[i : i + 100]
+                try:
+                    hook.send_animals_to_home(batch)
+                    loaded += len(batch)
+                except Exception as e:
+                    for animal in batch:
+                        quarantine.write(
+                            "load",
+                            "load_error",
+                            animal["id"],
+                            animal,
+                            str(e),
+                        )
+
+            hook.close()
+            stats.records = loaded
+
+        result = {
+            "status": "partial" if quarantine.total else "completed",
+            "source_run_id": self.source_run_id,
+            "replayed": len(entries),
+            "loaded": loaded,
+            **quarantine.summary(),
+            "metrics": stats.as_dict(),
+        }
+        self.log.info(f"Replay summary: {result}")
+        return result
+
+
 class HealthCheckOperator(BaseOperator):
     template_fields = ("animals_api_conn_id",)
 
@@ -229,6 +945,8 @@ class HealthCheckOperator(BaseOperator):
         self.animals_api_conn_id = animals_api_conn_id
 
     def execute(self, context: Context) -> Dict[str, Any]:
+        from plugins.hooks.animals_api_hook import AnimalsAPIHook
+
         hook = AnimalsAPIHook(animals_api_conn_id=self.animals_api_conn_id)
         is_healthy = hook.health_check()
 
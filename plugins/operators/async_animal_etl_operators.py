@@ -0,0 +1,266 @@
+import asyncio
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+from airflow.models import BaseOperator
+from airflow.utils.context import Context
+
+from config.settings import settings
+from plugins.operators.animal_etl_operators import (
+    ExtractAnimalsOperator,
+    PrefetchTransformAnimalsOperator,
+    TransformAnimalsOperator,
+)
+from utils import metrics
+from utils.exceptions import ValidationException
+from utils.manifest import iter_manifest, manifest_reference
+from utils.profiling import profile_task
+
+REQUIRED_FIELDS = ("id", "name", "friends", "born_at")
+
+
+class _EventLoopMixin:
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _run(self, awaitable: Any) -> Any:
+        return self._loop.run_until_complete(awaitable)
+
+    def _with_loop(self, func, context: Context) -> Dict[str, Any]:
+        self._loop = asyncio.new_event_loop()
+        try:
+            return func(context)
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    def _create_hook(self):
+        from plugins.hooks.async_animals_api_hook import (
+            AsyncAnimalsAPIHook,
+        )
+
+        return AsyncAnimalsAPIHook(
+            animals_api_conn_id=self.animals_api_conn_id,
+            concurrency=self.concurrency,
+        )
+
+    def _close_hook(self, hook) -> None:
+        self._run(hook.aclose())
+
+
+class AsyncExtractAnimalsOperator(_EventLoopMixin, ExtractAnimalsOperator):
+    def __init__(self, concurrency: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.concurrency = concurrency
+
+    def _extract(self, context: Context) -> Dict[str, Any]:
+        return self._with_loop(super()._extract, context)
+
+    def _iter_pages(self, hook) -> Iterator[List[Any]]:
+        pages = hook.aiter_animal_pages()
+        while True:
+            try:
+                yield self._run(pages.__anext__())
+            except StopAsyncIteration:
+                return
+
+
+class AsyncTransformAnimalsOperator(
+    _EventLoopMixin, TransformAnimalsOperator
+):
+    def __init__(
+        self,
+        animals_api_conn_id: str = "animals_api_default",
+        concurrency: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.animals_api_conn_id = animals_api_conn_id
+        self.concurrency = concurrency
+
+    def _transform(self, context: Context) -> Dict[str, Any]:
+        return self._with_loop(super()._transform, context)
+
+    def _fetch_details(self, hook, animal_ids: List[int]) -> List[Any]:
+        return self._run(hook.aget_animals_details_batch(animal_ids))
+
+
+class AsyncPrefetchTransformAnimalsOperator(
+    AsyncTransformAnimalsOperator, PrefetchTransformAnimalsOperator
+):
+    pass
+
+
+class AsyncLoadAnimalsOperator(_EventLoopMixin, BaseOperator):
+    template_fields = ("animals_api_conn_id",)
+
+    def __init__(
+        self,
+        animals_api_conn_id: str = "animals_api_default",
+        concurrency: Optional[int] = None,
+        profile: Optional[bool] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.animals_api_conn_id = animals_api_conn_id
+        self.concurrency = concurrency
+        self.profile = profile
+
+    def execute(self, context: Context) -> Dict[str, Any]:
+        with profile_task(
+            context, self.task_id, enabled=self.profile, log=self.log
+        ):
+            return self._with_loop(self._load, context)
+
+    def _load(self, context: Context) -> Dict[str, Any]:
+        from utils.deadline import Checkpoint, RunDeadline
+        from utils.diff import promote_baseline
+        from utils.quarantine import QuarantineWriter, quarantine_path
+
+        transform_result = context["task_instance"].xcom_pull(
+            task_ids="transform_animals"
+        )
+        manifest = manifest_reference(transform_result)
+        if manifest is None:
+            self.log.warning("No manifest received from transform task")
+            return {"status": "no_data", "batches_processed": 0}
+
+        hook = self._create_hook()
+        deadline = RunDeadline.from_context(context)
+        hook.deadline = deadline
+        checkpoint = Checkpoint(
+            os.path.join(
+                os.path.dirname(manifest["manifest_path"]),
+                f"load_checkpoint_{context['run_id']}.jsonl",
+            )
+        )
+        window = hook.concurrency
+
+        successful_batches = 0
+        failed_batches = 0
+        skipped_batches = 0
+        total_animals = 0
+
+        quarantine = QuarantineWriter(quarantine_path(context["run_id"]))
+
+        with metrics.stage(
+            "load", run_id=context["run_id"]
+        ) as stats, quarantine:
+            entries = list(iter_manifest(manifest))
+            pending = []
+            for entry in entries:
+                if entry["batch_index"] in checkpoint:
+                    successful_batches += 1
+                    total_animals += entry["count"]
+                else:
+                    pending.append(entry)
+
+            for start in range(0, len(pending), window):
+                if deadline is not None and deadline.expired(
+                    settings.RUN_DEADLINE_RESERVE
+                ):
+                    skipped_batches = len(pending) - start
+                    self.log.warning(
+                        f"Run deadline near, leaving {skipped_batches} batches unloaded"
+                    )
+                    break
+
+                chunk = pending[start : start + window]
+                results = self._run(
+                    self._load_window(hook, chunk, quarantine)
+                )
+                for entry, result in zip(chunk, results):
+                    if isinstance(result, BaseException):
+                        failed_batches += 1
+                        self.log.error(
+                            f"Batch {entry['batch_index']} failed: {result}"
+                        )
+                        continue
+                    checkpoint.mark(entry["batch_index"])
+                    try:
+                        os.remove(entry["file"])
+                    except OSError as e:
+                        self.log.warning(
+                            f"Could not remove {entry['file']}: {e}"
+                        )
+                    successful_batches += 1
+                    total_animals += result
+
+            stats.records = total_animals
+            stats.batches = successful_batches
+
+        self._close_hook(hook)
+
+        partial = (
+            skipped_batches or transform_result.get("status") == "partial"
+        )
+        result = {
+            "status": "partial" if partial else "completed",
+            "total_batches": manifest["total_batches"],
+            "successful_batches": successful_batches,
+            "failed_batches": failed_batches,
+            "skipped_batches": skipped_batches,
+            "total_animals": total_animals,
+            **quarantine.summary(),
+            "metrics": stats.as_dict(),
+        }
+        promoted = (
+            result["status"] == "completed"
+            and not failed_batches
+            and promote_baseline(transform_result)
+        )
+        if promoted:
+            result["baseline_run_id"] = context["run_id"]
+
+        self.log.info(f"Load summary: {result}")
+        return result
+
+    async def _load_window(
+        self,
+        hook,
+        entries: List[Dict[str, Any]],
+        quarantine,
+    ) -> List[Any]:
+        return await asyncio.gather(
+            *(
+                self._load_batch(hook, entry, quarantine)
+                for entry in entries
+            ),
+            return_exceptions=True,
+        )
+
+    async def _load_batch(
+        self, hook, entry: Dict[str, Any], quarantine
+    ) -> int:
+        batch_file = entry["file"]
+        animals = None
+        try:
+            animals = _read_batch(batch_file)
+            await hook.asend_animals_to_home(animals)
+            return len(animals)
+        except Exception as e:
+            for animal in animals or []:
+                quarantine.write(
+                    "load", "load_error", animal.get("id"), animal, str(e)
+                )
+            raise
+
+
+def _read_batch(batch_file: str) -> List[Dict[str, Any]]:
+    with open(batch_file, "r", encoding="utf-8") as f:
+        animals = json.load(f)
+
+    if not isinstance(animals, list) or not animals:
+        raise ValidationException(
+            f"Batch is empty or not a list: {batch_file}",
+            error_code="INVALID_BATCH",
+        )
+    first = animals[0]
+    if not isinstance(first, dict) or any(
+        field not in first for field in REQUIRED_FIELDS
+    ):
+        raise ValidationException(
+            f"Batch animals are missing required fields: {batch_file}",
+            error_code="INVALID_BATCH",
+        )
+    return animals
@@ -0,0 +1,294 @@
+import time
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+from airflow.exceptions import AirflowException
+from airflow.models import BaseOperator
+from airflow.utils.context import Context
+
+from config.settings import settings
+from utils import metrics
+from utils.profiling import profile_task
+
+
+def _work_queue(run_id: str):
+    from utils.redis_client import get_redis
+    from utils.work_queue import RedisWorkQueue, queue_name
+
+    return RedisWorkQueue(
+        get_redis(),
+        queue_name(run_id),
+        visibility_timeout=settings.QUEUE_VISIBILITY_TIMEOUT,
+        max_attempts=settings.QUEUE_MAX_ATTEMPTS,
+    )
+
+
+class EnqueueBatchesOperator(BaseOperator):
+    template_fields = ("batch_size",)
+
+    def __init__(self, batch_size: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.batch_size = (
+            batch_size if batch_size is not None else settings.BATCH_SIZE
+        )
+
+    def execute(self, context: Context) -> Dict[str, Any]:
+        from utils.spill import iter_row_batches
+
+        extract_result = context["task_instance"].xcom_pull(
+            task_ids="extract_animals"
+        )
+        if not extract_result or "temp_file" not in extract_result:
+            raise AirflowException(
+                "No animals data received from extract task"
+            )
+
+        queue = _work_queue(context["run_id"])
+        queue.delete()
+        total_batches = queue.enqueue(
+            list(rows)
+            for _, rows in iter_row_batches(
+                extract_result["temp_file"], self.batch_size
+            )
+        )
+
+        self.log.info(
+            f"Enqueued {total_batches} batches of up to {self.batch_size} animals on {queue.name}"
+        )
+        return {
+            "queue": queue.name,
+            "total_batches": total_batches,
+            "total_animals": extract_result.get("total_animals", 0),
+        }
+
+
+class QueueWorkerOperator(BaseOperator):
+    template_fields = ("animals_api_conn_id",)
+
+    def __init__(
+        self,
+        worker_index: int = 0,
+        animals_api_conn_id: str = "animals_api_default",
+        optional_detail_fields: Optional[List[str]] = None,
+        poll_interval: Optional[float] = None,
+        profile: Optional[bool] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.worker_index = worker_index
+        self.animals_api_conn_id = animals_api_conn_id
+        self.optional_detail_fields = (
+            optional_detail_fields
+            if optional_detail_fields is not None
+            else settings.DETAIL_OPTIONAL_FIELDS
+        )
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else settings.QUEUE_POLL_INTERVAL
+        )
+        self.profile = profile
+
+    @cached_property
+    def transformer(self):
+        from utils.transformers import AnimalDataTransformer
+
+        return AnimalDataTransformer()
+
+    def execute(self, context: Context) -> Dict[str, Any]:
+        with profile_task(
+            context, self.task_id, enabled=self.profile, log=self.log
+        ):
+            return self._work(context)
+
+    def _work(self, context: Context) -> Dict[str, Any]:
+        from plugins.hooks.animals_api_hook import AnimalsAPIHook
+        from utils.deadline import RunDeadline
+        from utils.log import truncate
+        from utils.quarantine import QuarantineWriter, quarantine_path
+        from utils.spill import from_row
+
+        queue = _work_queue(context["run_id"])
+        hook = AnimalsAPIHook(animals_api_conn_id=self.animals_api_conn_id)
+        deadline = RunDeadline.from_context(context)
+        hook.deadline = deadline
+        quarantine = QuarantineWriter(quarantine_path(context["run_id"]))
+
+        batches = 0
+        failures = 0
+        idle_polls = 0
+
+        with metrics.stage(
+            "queue_worker",
+            run_id=context["run_id"],
+            worker_index=self.worker_index,
+        ) as stats, quarantine:
+            while True:
+                if deadline is not None and deadline.expired(
+                    settings.RUN_DEADLINE_RESERVE
+                ):
+                    self.log.warning("Run deadline near, stopping worker")
+                    break
+
+                claimed = queue.claim()
+                if claimed is None:
+                    if queue.drained():
+                        break
+                    idle_polls += 1
+                    time.sleep(self.poll_interval)
+                    continue
+
+                batch_id, rows, attempts = claimed
+                try:
+                    loaded = self._process_batch(
+                        hook, queue, batch_id, rows, quarantine
+                    )
+                except Exception as e:
+                    failures += 1
+                    requeued = queue.nack(batch_id, truncate(e))
+                    self.log.error(
+                        f"Batch {batch_id} failed on attempt {attempts} ({'requeued' if requeued else 'giving up'}): {e}"
+                    )
+                    if requeued is False:
+                        for row in rows:
+                            quarantine.write(
+                                "queue",
+                                "max_attempts",
+                                row[0],
+                                from_row(row),
+                                truncate(e),
+                            )
+                    continue
+
+                if loaded is None:
+                    self.log.warning(
+                        f"Lease on batch {batch_id} expired, leaving it to the queue"
+                    )
+                    metrics.incr("queue.leases_lost")
+                    continue
+
+                queue.ack(batch_id)
+                batches += 1
+                stats.records += loaded
+                stats.batches = batches
+                metrics.incr("queue.batches_done")
+
+        hook.close()
+
+        result = {
+            "worker_index": self.worker_index,
+            "batches": batches,
+            "animals": stats.records,
+            "failures": failures,
+            "idle_polls": idle_polls,
+            **quarantine.summary(),
+            "metrics": stats.as_dict(),
+        }
+        self.log.info(f"Worker summary: {result}")
+        return result
+
+    def _process_batch(
+        self,
+        hook,
+        queue,
+        batch_id: str,
+        rows: List[List[Any]],
+        quarantine,
+    ) -> Optional[int]:
+        from utils.projection import plan_detail_fetches
+        from utils.quarantine import quarantine_transform_failures
+        from utils.spill import from_row
+
+        plan = plan_detail_fetches(
+            [from_row(row) for row in rows], self.optional_detail_fields
+        )
+        records = plan.merge(
+            hook.get_animals_details_batch(plan.fetch_ids)
+            if plan.fetch_ids
+            else []
+        )
+        if len(records) < len(rows):
+            fetched_ids = {record.id for record in records}
+            for row in rows:
+                if row[0] not in fetched_ids:
+                    quarantine.write(
+                        "detail",
+                        "fetch_failed",
+                        row[0],
+                        from_row(row),
+                        "Detail fetch failed",
+                    )
+        if not queue.extend(batch_id):
+            return None
+
+        animals = self.transformer.transform_records_batch(records)
+        quarantine_transform_failures(quarantine, records, animals)
+
+        for i in range(0, len(animals), 100):
+            load_batch = animals[i : i + 100]
+            if not hook.send_animals_to_home(load_batch):
+                raise AirflowException(
+                    f"Home API rejected {len(load_batch)} animals from batch {batch_id}"
+                )
+        return len(animals)
+
+
+class QueueSummaryOperator(BaseOperator):
+    def execute(self, context: Context) -> Dict[str, Any]:
+        from utils.quarantine import QuarantineWriter, quarantine_path
+        from utils.spill import from_row
+        from utils.work_queue import LEASE_EXPIRED
+
+        queue = _work_queue(context["run_id"])
+        stats = queue.stats()
+        quarantine = QuarantineWriter(quarantine_path(context["run_id"]))
+        with quarantine:
+            for batch_id, rows, error in queue.failed_batches():
+                if error != LEASE_EXPIRED:
+                    continue
+                for row in rows:
+                    quarantine.write(
+                        "queue",
+                        "lease_expired",
+                        row[0],
+                        from_row(row),
+                        f"Lease on batch {batch_id} expired on its last attempt",
+                    )
+
+        workers = [
+            result
+            for result in context["task_instance"].xcom_pull(
+                task_ids="queue_worker", default=[]
+            )
+            or []
+            if result
+        ]
+
+        unfinished = stats["pending"] + stats["leased"]
+        result = {
+            "status": (
+                "completed"
+                if not stats["failed"] and not unfinished
+                else "partial"
+            ),
+            "total_batches": stats["total"],
+            "successful_batches": stats["done"],
+            "failed_batches": stats["failed"],
+            "skipped_batches": unfinished,
+            "total_animals": sum(worker["animals"] for worker in workers),
+            "requeued_batches": stats["requeued"],
+            **quarantine.summary(),
+            "workers": {
+                worker["worker_index"]: worker["batches"]
+                for worker in workers
+            },
+        }
+        if stats["failed"]:
+            self.log.error(
+                f"Batches that exhausted their attempts: {queue.failed_errors()}"
+            )
+        if result["status"] == "completed":
+            queue.delete()
+
+        self.log.info(f"Queue summary: {result}")
+        return result
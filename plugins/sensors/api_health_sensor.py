@@ -1,10 +1,6 @@
-from datetime import timedelta
-
 from airflow.sensors.base import BaseSensorOperator
 from airflow.utils.context import Context
 
-from plugins.hooks.animals_api_hook import AnimalsAPIHook
-
 
 class APIHealthSensor(BaseSensorOperator):
     template_fields = ("animals_api_conn_id",)
@@ -16,6 +12,8 @@ class APIHealthSensor(BaseSensorOperator):
         self.animals_api_conn_id = animals_api_conn_id
 
     def poke(self, context: Context) -> bool:
+        from plugins.hooks.animals_api_hook import AnimalsAPIHook
+
         hook = AnimalsAPIHook(animals_api_conn_id=self.animals_api_conn_id)
         is_healthy = hook.health_check()
 
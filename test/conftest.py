@@ -0,0 +1,26 @@
+import os
+
+import pytest
+
+from mock_api.server import MockAnimalsAPI
+
+
+@pytest.fixture
+def mock_api(request):
+    options = getattr(request, "param", {})
+    with MockAnimalsAPI(**options) as api:
+        yield api
+
+
+@pytest.fixture
+def redis_client():
+    redis = pytest.importorskip("redis")
+    client = redis.Redis.from_url(
+        os.environ.get("REDIS_TEST_URL", "redis://localhost:6379/15")
+    )
+    try:
+        client.ping()
+    except redis.exceptions.ConnectionError:
+        pytest.skip("Redis is not available")
+    yield client
+    client.flushdb()
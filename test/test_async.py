@@ -0,0 +1,93 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from plugins.hooks.async_animals_api_hook import AsyncAnimalsAPIHook
+from plugins.operators.async_animal_etl_operators import (
+    AsyncExtractAnimalsOperator,
+    AsyncLoadAnimalsOperator,
+    AsyncTransformAnimalsOperator,
+)
+
+
+def _hook(api, concurrency=8):
+    hook = AsyncAnimalsAPIHook(concurrency=concurrency)
+    hook.base_url = api.url
+    return hook
+
+
+async def _fetch(hook, animal_ids):
+    try:
+        return await hook.aget_animals_details_batch(animal_ids)
+    finally:
+        await hook.aclose()
+
+
+class TestAsyncAnimalsAPIHook:
+    @pytest.mark.parametrize(
+        "mock_api",
+        [{"total_animals": 250, "bulk_enabled": True}],
+        indirect=True,
+    )
+    def test_uses_bulk_endpoint_when_available(self, mock_api):
+        animal_ids = list(range(250, 0, -1))
+
+        result = asyncio.run(_fetch(_hook(mock_api), animal_ids))
+
+        assert [record.id for record in result] == animal_ids
+        assert mock_api.requests["bulk"] == 4
+        assert mock_api.requests["detail"] == 0
+
+    @pytest.mark.parametrize(
+        "mock_api", [{"total_animals": 30}], indirect=True
+    )
+    def test_falls_back_to_detail_fetches_in_order(self, mock_api):
+        animal_ids = [5, 3, 30, 1, 31]
+
+        result = asyncio.run(_fetch(_hook(mock_api), animal_ids))
+
+        assert [record.id for record in result] == [5, 3, 30, 1]
+        assert result[0].name == mock_api.detail(5)["name"]
+        assert mock_api.requests["detail"] == 5
+
+
+class TestAsyncOperators:
+    @pytest.mark.parametrize(
+        "mock_api",
+        [{"total_animals": 230, "page_size": 50}],
+        indirect=True,
+    )
+    def test_extract_transform_load(self, mock_api, tmp_path):
+        ti = Mock()
+        context = {"task_instance": ti, "run_id": "async_run"}
+
+        with patch(
+            "plugins.operators.animal_etl_operators.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        ), patch(
+            "plugins.hooks.animals_api_hook.settings.ANIMALS_API_BASE_URL",
+            mock_api.url,
+        ):
+            extract = AsyncExtractAnimalsOperator(
+                task_id="extract_animals", concurrency=4
+            ).execute(context)
+            ti.xcom_pull.return_value = extract
+            transform = AsyncTransformAnimalsOperator(
+                task_id="transform_animals", batch_size=50
+            ).execute(context)
+            ti.xcom_pull.return_value = transform
+            load = AsyncLoadAnimalsOperator(
+                task_id="load_animals", concurrency=4
+            ).execute(context)
+
+        assert extract["total_animals"] + extract["quarantined"] == 230
+        assert extract["prefilter"]["rules"]["non_empty_name"] == 1
+        assert mock_api.requests["list"] == 5
+        assert transform["total_batches"] == 5
+        assert load["status"] == "completed"
+        assert load["successful_batches"] == 5
+        assert transform["total_animals"] == extract["total_animals"]
+        assert load["total_animals"] == transform["total_animals"]
+        assert mock_api.home_animals == transform["total_animals"]
+        assert not list(tmp_path.glob("load_batch_*"))
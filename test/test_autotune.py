@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from plugins.operators.animal_etl_operators import (
+    ExtractAnimalsOperator,
+    TransformAnimalsOperator,
+)
+from utils.autotune import AutoTuner, load_tuning, save_tuning
+
+
+def _run(tuner, throughput, batches=40):
+    for _ in range(batches):
+        batch_size, concurrency = tuner.batch_size, tuner.concurrency
+        rate, error_rate = throughput(batch_size, concurrency)
+        tuner.record(
+            batch_size, batch_size / rate, int(batch_size * error_rate)
+        )
+
+
+class TestAutoTuner:
+    def test_converges_on_fastest_safe_settings(self):
+        def throughput(batch_size, concurrency):
+            error_rate = 0.2 if concurrency > 20 else 0.0
+            return concurrency * (10 + batch_size / 100), error_rate
+
+        tuner = AutoTuner(100, 5, max_concurrency=40, trial_batches=1)
+        _run(tuner, throughput)
+
+        report = tuner.report()
+        assert report["converged"]
+        assert report["concurrency"] == 20
+        assert report["batch_size"] == 1000
+        assert "error_rate" in [t["verdict"] for t in report["trials"]]
+        assert (tuner.batch_size, tuner.concurrency) == (1000, 20)
+
+    def test_backs_off_when_starting_settings_fail(self):
+        def throughput(batch_size, concurrency):
+            return 100.0, 0.5 if concurrency > 4 else 0.0
+
+        tuner = AutoTuner(100, 16, trial_batches=1, tune_batch_size=False)
+        _run(tuner, throughput)
+
+        report = tuner.report()
+        assert report["concurrency"] == 4
+        assert report["batch_size"] == 100
+        assert report["error_rate"] == 0.0
+
+    def test_report_without_full_trial(self):
+        tuner = AutoTuner(100, 10, trial_batches=3)
+        tuner.record(100, 1.0)
+
+        report = tuner.report()
+        assert not report["converged"]
+        assert report["trials"] == []
+        assert (report["batch_size"], report["concurrency"]) == (100, 10)
+
+    def test_persists_per_connection(self, tmp_path):
+        path = str(tmp_path / "autotune.json")
+        report = {
+            "batch_size": 200,
+            "concurrency": 20,
+            "throughput": 500.0,
+            "error_rate": 0.0,
+            "converged": True,
+        }
+        save_tuning("animals_api_default", report, path)
+        save_tuning("other", {**report, "batch_size": 50}, path)
+
+        assert (
+            load_tuning("animals_api_default", path)["batch_size"] == 200
+        )
+        assert load_tuning("other", path)["batch_size"] == 50
+        assert load_tuning("missing", path) is None
+
+        with patch("utils.autotune.settings.AUTOTUNE_STATE_PATH", path):
+            tuner = AutoTuner.for_connection(
+                "animals_api_default", 100, 10
+            )
+        assert (tuner.batch_size, tuner.concurrency) == (200, 20)
+
+
+class TestTransformAutotune:
+    def test_execute_reports_and_saves_tuning(self, mock_api, tmp_path):
+        path = str(tmp_path / "autotune.json")
+        context = {"task_instance": Mock(), "run_id": "autotune_run"}
+
+        with patch(
+            "plugins.hooks.animals_api_hook.settings.ANIMALS_API_BASE_URL",
+            mock_api.url,
+        ), patch(
+            "utils.autotune.settings.AUTOTUNE_STATE_PATH", path
+        ), patch(
+            "utils.autotune.settings.AUTOTUNE_TRIAL_BATCHES", 1
+        ), patch(
+            "utils.quarantine.settings.QUARANTINE_DIR", str(tmp_path)
+        ):
+            context[
+                "task_instance"
+            ].xcom_pull.return_value = ExtractAnimalsOperator(
+                task_id="extract_animals"
+            ).execute(
+                context
+            )
+            result = TransformAnimalsOperator(
+                task_id="transform_animals", autotune=True
+            ).execute(context)
+
+        report = result["autotune"]
+        assert report["trials"]
+        assert report["reason"]
+        assert result["status"] == "completed"
+        assert load_tuning("animals_api_default", path) is not None
+
+    @pytest.mark.parametrize(
+        "mock_api", [{"total_animals": 200}], indirect=True
+    )
+    def test_tunes_batch_size_under_execution_timeout(
+        self, mock_api, tmp_path
+    ):
+        context = {
+            "task": Mock(execution_timeout=timedelta(hours=2)),
+            "task_instance": Mock(start_date=datetime.now(timezone.utc)),
+            "dag_run": Mock(start_date=datetime.now(timezone.utc)),
+            "params": {},
+            "run_id": "autotune_deadline",
+        }
+
+        with patch(
+            "plugins.hooks.animals_api_hook.settings.ANIMALS_API_BASE_URL",
+            mock_api.url,
+        ), patch(
+            "utils.autotune.settings.AUTOTUNE_STATE_PATH",
+            str(tmp_path / "autotune.json"),
+        ), patch(
+            "utils.autotune.settings.AUTOTUNE_TRIAL_BATCHES", 1
+        ), patch(
+            "utils.autotune.settings.AUTOTUNE_MAX_CONCURRENCY", 10
+        ), patch(
+            "utils.quarantine.settings.QUARANTINE_DIR", str(tmp_path)
+        ), patch(
+            "plugins.operators.animal_etl_operators.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        ):
+            context[
+                "task_instance"
+            ].xcom_pull.return_value = ExtractAnimalsOperator(
+                task_id="extract_animals"
+            ).execute(
+                context
+            )
+            result = TransformAnimalsOperator(
+                task_id="transform_animals", batch_size=25, autotune=True
+            ).execute(context)
+
+        batch_sizes = {
+            trial["batch_size"] for trial in result["autotune"]["trials"]
+        }
+        assert result["status"] == "completed"
+        assert len(batch_sizes) > 1
@@ -0,0 +1,165 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from plugins.operators.animal_etl_operators import TransformAnimalsOperator
+from utils.deadline import Checkpoint, RunDeadline
+from utils.exceptions import DeadlineExceededException
+from utils.manifest import ManifestWriter
+from utils.policies import EndpointPolicy
+from utils.quarantine import iter_quarantine
+
+
+def _context(run_budget=None, execution_timeout=None, started_ago=0):
+    started = datetime.now(timezone.utc) - timedelta(seconds=started_ago)
+    task = Mock(execution_timeout=execution_timeout)
+    return {
+        "params": {"run_deadline_seconds": run_budget},
+        "dag_run": Mock(start_date=started),
+        "task": task,
+        "task_instance": Mock(start_date=started),
+    }
+
+
+class TestRunDeadline:
+    def test_disabled_without_budget_or_timeout(self):
+        assert RunDeadline.from_context(_context()) is None
+
+    def test_uses_earliest_of_run_budget_and_task_timeout(self):
+        deadline = RunDeadline.from_context(
+            _context(
+                run_budget=3600,
+                execution_timeout=timedelta(seconds=600),
+                started_ago=100,
+            )
+        )
+
+        assert deadline.budget == 600
+        assert 490 < deadline.remaining() <= 500
+
+    def test_constrain_shrinks_retries_when_low(self):
+        deadline = RunDeadline(expires_at=0, budget=1000)
+        deadline.remaining = lambda: 100.0
+
+        with patch("utils.deadline.settings.RUN_DEADLINE_RESERVE", 10):
+            policy = deadline.constrain(
+                EndpointPolicy(max_attempts=5, deadline=300)
+            )
+
+        assert policy.deadline == 90
+        assert policy.max_attempts == 2
+        assert policy.backoff_max == 1.0
+
+    def test_check_raises_when_expired(self):
+        with pytest.raises(DeadlineExceededException):
+            RunDeadline(expires_at=0, budget=1).check("detail")
+
+
+class TestCheckpoint:
+    def test_marks_persist_across_instances(self, tmp_path):
+        path = str(tmp_path / "checkpoint.jsonl")
+        Checkpoint(path).mark(3)
+
+        assert 3 in Checkpoint(path)
+        assert 4 not in Checkpoint(path)
+
+
+class TestTransformDeadline:
+    @patch("plugins.operators.animal_etl_operators.tempfile.gettempdir")
+    @patch("plugins.hooks.animals_api_hook.AnimalsAPIHook")
+    def test_stops_and_quarantines_pending_animals(
+        self, mock_hook_class, mock_gettempdir, tmp_path
+    ):
+        mock_gettempdir.return_value = str(tmp_path)
+        extract_file = tmp_path / "animals_data_run.jsonl"
+        extract_file.write_text(
+            "".join(
+                json.dumps([animal_id, "Lion", None, None]) + "\n"
+                for animal_id in range(1, 5)
+            )
+        )
+        context = _context(run_budget=3600)
+        context["run_id"] = "run"
+        context["task_instance"].xcom_pull.return_value = {
+            "temp_file": str(extract_file)
+        }
+        mock_hook_class.return_value.get_animals_details_batch.return_value = (
+            []
+        )
+        operator = TransformAnimalsOperator(
+            task_id="test_transform", batch_size=2
+        )
+
+        with patch.object(
+            RunDeadline, "expired", side_effect=[False, True]
+        ), patch(
+            "utils.quarantine.settings.QUARANTINE_DIR", str(tmp_path)
+        ):
+            result = operator.execute(context)
+
+        assert result["status"] == "partial"
+        assert result["pending_animals"] == 2
+        pending = [
+            entry
+            for entry in iter_quarantine(result["quarantine_file"])
+            if entry["stage"] == "deadline"
+        ]
+        assert [entry["id"] for entry in pending] == [3, 4]
+        assert pending[0]["payload"]["name"] == "Lion"
+
+
+class TestLoadResume:
+    def _transform_result(self, tmp_path):
+        with ManifestWriter(
+            str(tmp_path / "load_manifest_run.jsonl")
+        ) as m:
+            for index in range(2):
+                batch_file = tmp_path / f"load_batch_{index}_run.json"
+                batch_file.write_text(
+                    json.dumps(
+                        [
+                            {
+                                "id": index + 1,
+                                "name": "Lion",
+                                "friends": [],
+                                "born_at": None,
+                            }
+                        ]
+                    )
+                )
+                m.add(str(batch_file), 1)
+        return {**m.reference(), "status": "completed"}
+
+    @patch("plugins.hooks.animals_api_hook.AnimalsAPIHook")
+    def test_retry_resends_only_failed_batches(
+        self, mock_hook_class, tmp_path
+    ):
+        from dags.animal_etl_dag import _load_all_batches
+
+        send = mock_hook_class.return_value.send_animals_to_home
+        context = {"task_instance": Mock(), "run_id": "run"}
+        context[
+            "task_instance"
+        ].xcom_pull.return_value = self._transform_result(tmp_path)
+
+        with patch.object(
+            RunDeadline, "from_context", return_value=None
+        ), patch(
+            "utils.quarantine.settings.QUARANTINE_DIR", str(tmp_path)
+        ):
+            send.side_effect = [True, False]
+            first = _load_all_batches(context)
+            assert not (tmp_path / "load_batch_0_run.json").exists()
+            assert (tmp_path / "load_batch_1_run.json").exists()
+
+            send.side_effect = [True]
+            second = _load_all_batches(context)
+
+        assert first["failed_batches"] == 1
+        assert second["status"] == "completed"
+        assert second["successful_batches"] == 2
+        assert second["total_animals"] == 2
+        assert send.call_args.args[0][0]["id"] == 2
+        assert not (tmp_path / "load_batch_1_run.json").exists()
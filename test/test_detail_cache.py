@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+from plugins.hooks.animals_api_hook import AnimalsAPIHook
+from utils.detail_cache import RedisDetailCache
+from utils.records import AnimalRecord
+
+
+def _cache(client, **kwargs):
+    return RedisDetailCache(client, "animal_etl:details:test", **kwargs)
+
+
+class TestRedisDetailCache:
+    def test_round_trip_and_expiry(self, redis_client):
+        cache = _cache(redis_client, ttl=60)
+        record = AnimalRecord(
+            1, "Lion", "Tiger,Bear", "2020-01-01T00:00:00"
+        )
+        cache.put_many([record], now=0)
+
+        assert cache.get_many([1, 2], now=30) == {1: record}
+        assert cache.get_many([1], now=61) == {}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_evicts_oldest_over_memory_cap(self, redis_client):
+        cache = _cache(redis_client, max_bytes=45)
+        cache.put_many([AnimalRecord(1, "Lion", "", None)], now=0)
+        cache.put_many([AnimalRecord(2, "Tiger", "", None)], now=1)
+        cache.put_many([AnimalRecord(3, "Bear", "", None)], now=2)
+
+        assert set(cache.get_many([1, 2, 3], now=3)) == {2, 3}
+        stats = cache.stats()
+        assert stats["evicted"] == 1
+        assert stats["bytes"] <= 45
+
+    def test_hooks_share_details(self, redis_client, mock_api):
+        cache = _cache(redis_client)
+        with patch(
+            "plugins.hooks.animals_api_hook.settings.ANIMALS_API_BASE_URL",
+            mock_api.url,
+        ):
+            hooks = [AnimalsAPIHook(), AnimalsAPIHook()]
+            for hook in hooks:
+                hook.detail_cache = cache
+
+            first = hooks[0].get_animals_details_batch(list(range(1, 51)))
+            requests = mock_api.requests["detail"]
+            second = hooks[1].get_animals_details_batch(list(range(1, 51)))
+
+        assert first == second
+        assert requests == 50
+        assert mock_api.requests["detail"] == 50
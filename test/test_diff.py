@@ -0,0 +1,82 @@
+from utils.diff import RunDiff, promote_baseline
+from utils.results_db import ResultStore
+
+
+def _animal(animal_id, name="Lion", friends=None):
+    return {
+        "id": animal_id,
+        "name": name,
+        "friends": friends or [],
+        "born_at": None,
+    }
+
+
+class TestRunDiff:
+    def test_emits_only_changes_and_counts_churn(self, tmp_path):
+        with ResultStore(str(tmp_path / "results.db")) as store:
+            store.write("run_1", [_animal(1), _animal(2), _animal(3)])
+            store.set_baseline("run_1")
+
+            differ = RunDiff.for_run(store, "run_2")
+            current = [
+                _animal(1),
+                _animal(2, friends=["Tiger"]),
+                _animal(4, "Otter"),
+            ]
+            changed = differ.changed(current)
+            store.write("run_2", current)
+            differ.finish()
+
+        assert [animal["id"] for animal in changed] == [2, 4]
+        assert differ.as_dict() == {
+            "baseline_run_id": "run_1",
+            "inserted": 1,
+            "updated": 1,
+            "unchanged": 1,
+            "deleted": 1,
+        }
+        assert differ.deleted_ids == [3]
+
+    def test_no_diff_without_baseline(self, tmp_path):
+        with ResultStore(str(tmp_path / "results.db")) as store:
+            assert RunDiff.for_run(store, "run_1") is None
+            store.set_baseline("run_1")
+            assert RunDiff.for_run(store, "run_1") is None
+
+    def test_promote_baseline_only_for_completed_runs(self, tmp_path):
+        path = str(tmp_path / "results.db")
+        diff = {"results_db_path": path, "run_id": "run_2"}
+
+        assert not promote_baseline({"status": "partial", "diff": diff})
+        assert not promote_baseline({"status": "completed"})
+        assert promote_baseline({"status": "completed", "diff": diff})
+
+        with ResultStore(path) as store:
+            assert store.baseline() == "run_2"
+
+    def test_promote_baseline_prunes_older_runs(self, tmp_path):
+        path = str(tmp_path / "results.db")
+
+        def load(run_id):
+            with ResultStore(path) as store:
+                store.write(run_id, [_animal(1), _animal(2)])
+            return promote_baseline(
+                {
+                    "status": "completed",
+                    "diff": {"results_db_path": path, "run_id": run_id},
+                }
+            )
+
+        with ResultStore(path) as store:
+            store.write("failed_run", [_animal(1)])
+        assert load("run_1")
+        assert load("run_2")
+
+        with ResultStore(path) as store:
+            assert store.runs() == {"run_1": 2, "run_2": 2}
+
+        assert load("run_3")
+
+        with ResultStore(path) as store:
+            assert store.runs() == {"run_2": 2, "run_3": 2}
+            assert store.baseline() == "run_3"
@@ -0,0 +1,68 @@
+from utils.friends import (
+    AMBIGUOUS,
+    UNRESOLVED,
+    FriendInterner,
+    FriendsGraph,
+    NameIndex,
+)
+
+
+class TestFriendInterner:
+    def test_parses_to_shared_strings(self):
+        interner = FriendInterner()
+
+        first = interner.parse("Lion, Tiger")
+        second = interner.parse("Lion, Tiger")
+        third = interner.parse(["Tiger", None, " "])
+
+        assert first == ["Lion", "Tiger"]
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        assert third[0] is first[1]
+        assert interner.cache_hits == 1
+        assert len(interner) == 2
+
+
+class TestFriendsGraph:
+    def _graph(self):
+        interner = FriendInterner()
+        index = NameIndex.from_rows(
+            [
+                (1, "Lion"),
+                (2, "Tiger"),
+                (3, "Bear"),
+                (4, " Bear "),
+            ],
+            interner,
+        )
+        graph = FriendsGraph(interner)
+        graph.add(1, "Tiger,Lion,Wolf")
+        graph.add(2, ["Lion"])
+        graph.add(3, "Tiger,Tiger")
+        graph.add(4, "")
+        return graph, index
+
+    def test_stores_adjacency_as_csr(self):
+        graph, index = self._graph()
+
+        assert list(graph.offsets) == [0, 3, 4, 6, 6]
+        assert graph.friends_of(0) == ["Tiger", "Lion", "Wolf"]
+        assert graph.friends_of(3) == []
+        assert index.resolve(graph.interner.code("Lion")) == 1
+        assert index.resolve(graph.interner.code("Bear")) == AMBIGUOUS
+        assert index.resolve(graph.interner.code("Wolf")) == UNRESOLVED
+
+    def test_validate_reports_graph_issues(self):
+        graph, index = self._graph()
+
+        report = graph.validate(index)
+
+        assert report["animals"] == 4
+        assert report["edges"] == 6
+        assert report["isolated"] == 1
+        assert report["duplicate_edges"] == 1
+        assert report["resolved"] == 5
+        assert report["unresolved"] == 1
+        assert report["self_references"] == 1
+        assert report["asymmetric"] == 2
+        assert "resolved" not in graph.validate()
@@ -0,0 +1,97 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.hedging import HedgeBudget, LatencyTracker, hedged_call
+
+
+def _tracker(threshold=0.01):
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record(threshold)
+    return tracker
+
+
+class TestLatencyTracker:
+    def test_threshold_is_observed_quantile(self):
+        tracker = LatencyTracker(quantile=0.95, min_samples=20)
+        for sample in range(19):
+            tracker.record(sample / 100)
+        assert tracker.threshold() is None
+
+        tracker.record(1.0)
+        assert tracker.threshold() == 1.0
+
+        for _ in range(100):
+            tracker.record(0.01)
+        assert tracker.threshold() < 1.0
+
+
+class TestHedgeBudget:
+    def test_limits_hedges_to_ratio_of_requests(self):
+        budget = HedgeBudget(ratio=0.1)
+        for _ in range(20):
+            budget.record_request()
+
+        assert [budget.acquire() for _ in range(3)] == [True, True, False]
+
+
+class TestHedgedCall:
+    def test_hedge_wins_when_primary_is_slow(self):
+        calls = []
+        lock = threading.Lock()
+
+        def fetch(animal_id):
+            with lock:
+                calls.append(animal_id)
+                first = len(calls) == 1
+            time.sleep(1.0 if first else 0.0)
+            return animal_id
+
+        budget = HedgeBudget(ratio=1.0)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            started = time.perf_counter()
+            result = hedged_call(
+                executor, fetch, 7, tracker=_tracker(), budget=budget
+            )
+            elapsed = time.perf_counter() - started
+
+        assert result == 7
+        assert elapsed < 0.5
+        assert budget.as_dict() == {
+            "requests": 1,
+            "hedges_fired": 1,
+            "hedges_won": 1,
+        }
+
+    def test_no_hedge_without_budget(self):
+        budget = HedgeBudget(ratio=0.0)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = hedged_call(
+                executor,
+                lambda value: time.sleep(0.05) or value,
+                3,
+                tracker=_tracker(),
+                budget=budget,
+            )
+
+        assert result == 3
+        assert budget.fired == 0
+
+    def test_returns_hedge_result_when_primary_fails(self):
+        attempts = iter([RuntimeError("boom"), None])
+
+        def fetch(value):
+            error = next(attempts)
+            if error:
+                time.sleep(0.05)
+                raise error
+            return value
+
+        budget = HedgeBudget(ratio=1.0)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = hedged_call(
+                executor, fetch, 5, tracker=_tracker(0.001), budget=budget
+            )
+
+        assert result == 5
+        assert budget.won == 1
@@ -5,6 +5,7 @@ import pytest
 
 from plugins.hooks.animals_api_hook import AnimalsAPIHook
 from utils.exceptions import ExternalAPIException
+from utils.models import AnimalDetail
 
 
 class TestAnimalsAPIHook:
@@ -57,10 +58,14 @@ class TestAnimalsAPIHook:
             Mock(dict=lambda: {"id": 2}),
         ]
         page1_response.has_next = True
+        page1_response.failed_items = []
 
         page2_response = Mock()
         page2_response.items = [Mock(dict=lambda: {"id": 3})]
         page2_response.has_next = False
+        page2_response.failed_items = [
+            {"index": 1, "item": {"id": "x"}, "error": "bad id"}
+        ]
 
         mock_get_page.side_effect = [page1_response, page2_response]
 
@@ -68,3 +73,64 @@ class TestAnimalsAPIHook:
 
         assert len(result) == 3
         assert mock_get_page.call_count == 2
+        assert self.hook.failed_list_items == [
+            {"index": 1, "item": {"id": "x"}, "error": "bad id"}
+        ]
+
+
+class TestAnimalsDetailsBatch:
+    def _hook(self, api):
+        hook = AnimalsAPIHook()
+        hook.base_url = api.url
+        return hook
+
+    @pytest.mark.parametrize(
+        "mock_api",
+        [{"total_animals": 250, "bulk_enabled": True}],
+        indirect=True,
+    )
+    def test_uses_bulk_endpoint_when_available(self, mock_api):
+        hook = self._hook(mock_api)
+        animal_ids = list(range(250, 0, -1))
+
+        result = hook.get_animals_details_batch(animal_ids)
+        hook.close()
+
+        assert [detail.id for detail in result] == animal_ids
+        assert mock_api.requests["bulk"] == 4
+        assert mock_api.requests["detail"] == 0
+
+    @pytest.mark.parametrize(
+        "mock_api", [{"total_animals": 30}], indirect=True
+    )
+    def test_falls_back_to_concurrent_detail_fetches(self, mock_api):
+        hook = self._hook(mock_api)
+        animal_ids = [5, 3, 30, 1]
+
+        result = hook.get_animals_details_batch(animal_ids)
+        hook.close()
+
+        assert [detail.id for detail in result] == animal_ids
+        assert result[0].name == mock_api.detail(5)["name"]
+        assert mock_api.requests["detail"] == 4
+        assert mock_api.requests["not_found"] == 1
+        assert hook.supports_bulk_details() is False
+
+    @pytest.mark.parametrize(
+        "mock_api",
+        [{"total_animals": 10, "bulk_enabled": True}],
+        indirect=True,
+    )
+    def test_fetches_ids_missing_from_bulk_response(self, mock_api):
+        hook = self._hook(mock_api)
+        partial = [AnimalDetail(**mock_api.detail(1))]
+
+        with patch.object(
+            hook, "get_animals_details_bulk", return_value=partial
+        ) as mock_bulk:
+            result = hook.get_animals_details_batch([1, 2])
+        hook.close()
+
+        assert [detail.id for detail in result] == [1, 2]
+        mock_bulk.assert_called_once_with([1, 2])
+        assert mock_api.requests["detail"] == 1
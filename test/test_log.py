@@ -0,0 +1,54 @@
+from unittest.mock import Mock, patch
+
+from utils.log import SampledLogger, truncate
+
+
+class TestSampledLogger:
+    def test_suppresses_after_limit_per_category(self):
+        logger = Mock()
+        sampled_logger = SampledLogger(logger, limit=3, window=3600)
+
+        for i in range(10):
+            sampled_logger.warning("born_at_parse", "bad date", index=i)
+        sampled_logger.warning("friends_parse", "bad friends")
+
+        assert logger.log.call_count == 4
+        assert sampled_logger.counts == {
+            "born_at_parse": 10,
+            "friends_parse": 1,
+        }
+
+    @patch("utils.log.time.monotonic")
+    def test_reports_suppressed_count_when_window_rolls(self, mock_clock):
+        mock_clock.side_effect = [0, 1, 2, 100]
+        logger = Mock()
+        sampled_logger = SampledLogger(logger, limit=1, window=60)
+
+        for _ in range(4):
+            sampled_logger.warning("born_at_parse", "bad date")
+
+        events = [call.args[1] for call in logger.log.call_args_list]
+        assert events == [
+            "bad date",
+            "suppressed similar messages",
+            "bad date",
+        ]
+        assert logger.log.call_args_list[1].kwargs["suppressed"] == 2
+
+    def test_summary_aggregates_and_resets(self):
+        logger = Mock()
+        sampled_logger = SampledLogger(logger, limit=1, window=3600)
+
+        for _ in range(5):
+            sampled_logger.warning("list_item_parse", "bad item")
+
+        counts = sampled_logger.summary()
+
+        assert counts == {"list_item_parse": 5}
+        assert logger.warning.call_args.kwargs["suppressed"] == 4
+        assert sampled_logger.summary() == {}
+
+
+def test_truncate_limits_long_values():
+    assert truncate("abc", 10) == "abc"
+    assert truncate("a" * 20, 10) == "aaaaaaaaaa... (20 chars)"
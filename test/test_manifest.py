@@ -0,0 +1,56 @@
+import pytest
+
+from utils.exceptions import ValidationException
+from utils.manifest import (
+    ManifestWriter,
+    get_manifest_entry,
+    iter_manifest,
+    manifest_reference,
+)
+
+
+class TestManifest:
+    def setup_method(self):
+        self.entries = [("batch_0.json", 100), ("batch_1.json", 42)]
+
+    def _write(self, path):
+        with ManifestWriter(str(path)) as manifest:
+            for batch_file, count in self.entries:
+                manifest.add(batch_file, count)
+        return manifest.reference()
+
+    def test_reference_is_constant_size(self, tmp_path):
+        reference = self._write(tmp_path / "manifest.jsonl")
+
+        assert reference["total_batches"] == 2
+        assert reference["total_animals"] == 142
+        assert set(reference) == {
+            "manifest_path",
+            "checksum",
+            "total_batches",
+            "total_animals",
+        }
+
+    def test_iter_manifest_streams_entries(self, tmp_path):
+        reference = self._write(tmp_path / "manifest.jsonl")
+
+        entries = list(iter_manifest(reference))
+
+        assert [entry["file"] for entry in entries] == [
+            "batch_0.json",
+            "batch_1.json",
+        ]
+        assert get_manifest_entry(reference, 1)["count"] == 42
+        assert get_manifest_entry(reference, 2) is None
+
+    def test_checksum_mismatch_raises(self, tmp_path):
+        path = tmp_path / "manifest.jsonl"
+        reference = self._write(path)
+        path.write_text(path.read_text().replace("42", "43"))
+
+        with pytest.raises(ValidationException):
+            list(iter_manifest(reference))
+
+    def test_manifest_reference_ignores_other_results(self):
+        assert manifest_reference(None) is None
+        assert manifest_reference({"status": "completed"}) is None
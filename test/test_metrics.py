@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from utils import metrics
+
+
+class TestMetrics:
+    @patch("utils.metrics.Stats")
+    def test_stage_emits_throughput(self, mock_stats):
+        with metrics.stage("transform") as stats:
+            stats.records = 50
+            stats.bytes_written = 1024
+
+        assert stats.duration > 0
+        assert stats.as_dict()["records"] == 50
+        mock_stats.incr.assert_any_call(
+            "animal_etl.stage.transform.records", 50
+        )
+        mock_stats.incr.assert_any_call(
+            "animal_etl.stage.transform.bytes_written", 1024
+        )
+        stat_names = [
+            call.args[0] for call in mock_stats.timing.call_args_list
+        ]
+        assert "animal_etl.stage.transform.duration" in stat_names
+
+    @patch("utils.metrics.Stats")
+    def test_timed_records_latency_in_milliseconds(self, mock_stats):
+        with metrics.timed("api.detail.latency", animal_id=1):
+            pass
+
+        stat, value = mock_stats.timing.call_args.args
+        assert stat == "animal_etl.api.detail.latency"
+        assert value >= 0
+
+    @patch("utils.metrics.Stats")
+    def test_incr_skips_zero_counts(self, mock_stats):
+        metrics.incr("transform.failures.unknown", 0)
+
+        mock_stats.incr.assert_not_called()
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -9,10 +10,12 @@ from plugins.operators.animal_etl_operators import (
     LoadAnimalsBatchOperator,
     TransformAnimalsOperator,
 )
+from utils.manifest import iter_manifest, manifest_reference
+from utils.results_db import ResultStore
 
 
 class TestExtractAnimalsOperator:
-    @patch("plugins.operators.animal_etl_operators.AnimalsAPIHook")
+    @patch("plugins.hooks.animals_api_hook.AnimalsAPIHook")
     def test_execute_success(self, mock_hook_class):
         mock_hook = Mock()
         mock_hook.get_all_animals.return_value = [
@@ -30,56 +33,76 @@ class TestExtractAnimalsOperator:
 
 
 class TestTransformAnimalsOperator:
-    @patch("plugins.operators.animal_etl_operators.AnimalsAPIHook")
-    def test_execute_success(self, mock_hook_class):
-        mock_context = {"task_instance": Mock()}
-        mock_context["task_instance"].xcom_pull.return_value = [
-            {"id": 1, "name": "Lion"},
-            {"id": 2, "name": "Tiger"},
-        ]
+    @patch("plugins.operators.animal_etl_operators.tempfile.gettempdir")
+    @patch("plugins.hooks.animals_api_hook.AnimalsAPIHook")
+    def test_execute_success(
+        self, mock_hook_class, mock_gettempdir, tmp_path
+    ):
+        mock_gettempdir.return_value = str(tmp_path)
+        extract_file = tmp_path / "animals_data_run.jsonl"
+        extract_file.write_text(
+            '[1,"Lion",null,null]\n[2,"Tiger",null,null]\n'
+        )
+        mock_context = {"task_instance": Mock(), "run_id": "run"}
+        mock_context["task_instance"].xcom_pull.return_value = {
+            "temp_file": str(extract_file)
+        }
 
         mock_hook = Mock()
-        mock_hook.get_animals_details_batch.return_value = [
-            Mock(
-                id=1,
-                name="Lion",
-                species="Panthera leo",
-                friends="Tiger",
-                born_at=None,
-            ),
-            Mock(
-                id=2,
-                name="Tiger",
-                species="Panthera tigris",
-                friends="Lion",
-                born_at=None,
-            ),
-        ]
+        mock_hook.get_animals_details_batch.return_value = [Mock(), Mock()]
         mock_hook_class.return_value = mock_hook
         operator = TransformAnimalsOperator(
             task_id="test_transform", batch_size=10
         )
 
-        with (
-            patch.object(
-                operator.transformer, "transform_animals_batch"
-            ) as mock_transform,
-            patch.object(
-                operator.transformer, "to_dict_list"
-            ) as mock_to_dict,
-        ):
-
-            mock_transform.return_value = [Mock(), Mock()]
-            mock_to_dict.return_value = [{"id": 1}, {"id": 2}]
+        with patch.object(
+            operator.transformer, "transform_records_batch"
+        ) as mock_transform:
+            mock_transform.return_value = [{"id": 1}, {"id": 2}]
 
             result = operator.execute(mock_context)
 
-            assert len(result) == 1
-            assert len(result[0]) == 2
+        assert result["total_batches"] == 1
+        assert result["total_animals"] == 2
+        assert "batch_info" not in result
+        entries = list(iter_manifest(manifest_reference(result)))
+        assert entries[0]["count"] == 2
+        with open(entries[0]["file"], encoding="utf-8") as f:
+            assert json.load(f) == [{"id": 1}, {"id": 2}]
+
+    @patch("plugins.operators.animal_etl_operators.tempfile.gettempdir")
+    @patch("plugins.hooks.animals_api_hook.AnimalsAPIHook")
+    def test_execute_writes_results_db(
+        self, mock_hook_class, mock_gettempdir, tmp_path
+    ):
+        mock_gettempdir.return_value = str(tmp_path)
+        extract_file = tmp_path / "animals_data_run.jsonl"
+        extract_file.write_text('[1,"Lion","Tiger",null]\n')
+        mock_context = {"task_instance": Mock(), "run_id": "run"}
+        mock_context["task_instance"].xcom_pull.return_value = {
+            "temp_file": str(extract_file)
+        }
+        results_db = str(tmp_path / "results.db")
+
+        operator = TransformAnimalsOperator(
+            task_id="test_transform",
+            batch_size=10,
+            results_db_path=results_db,
+        )
+        operator.execute(mock_context)
+
+        mock_hook_class.return_value.get_animals_details_batch.assert_not_called()
+        with ResultStore(results_db) as store:
+            assert store.get("run", 1) == {
+                "id": 1,
+                "name": "Lion",
+                "friends": ["Tiger"],
+                "born_at": None,
+            }
 
 
 class TestHealthCheckOperator:
-    @patch("plugins.operators.animal_etl_operators.AnimalsAPIHook")
+    @patch("plugins.hooks.animals_api_hook.AnimalsAPIHook")
     def test_execute_healthy(self, mock_hook_class):
         mock_hook = Mock()
         mock_hook.health_check.return_value = True
@@ -91,7 +114,7 @@ class TestHealthCheckOperator:
         assert result is True
         mock_hook.health_check.assert_called_once()
 
-    @patch("plugins.operators.animal_etl_operators.AnimalsAPIHook")
+    @patch("plugins.hooks.animals_api_hook.AnimalsAPIHook")
     def test_execute_unhealthy(self, mock_hook_class):
         mock_hook = Mock()
         mock_hook.health_check.return_value = False
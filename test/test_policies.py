@@ -0,0 +1,94 @@
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from plugins.hooks.animals_api_hook import AnimalsAPIHook
+from utils.exceptions import ExternalAPIException
+from utils.policies import EndpointPolicy, build_policies, with_policy
+
+
+def _status_error(status_code):
+    return ExternalAPIException(
+        "HTTP error", details={"status_code": status_code}
+    )
+
+
+class _Client:
+    def __init__(self, policy, errors):
+        self._policy = policy
+        self.errors = list(errors)
+        self.calls = 0
+
+    def policy(self, endpoint):
+        return self._policy
+
+    @with_policy("detail")
+    def call(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TestEndpointPolicy:
+    def test_overrides_merge_over_defaults_in_order(self):
+        policies = build_policies(
+            {"detail": {"read_timeout": 3, "max_attempts": 5}},
+            {"detail": {"max_attempts": 2}, "custom": {"jitter": 0}},
+        )
+
+        assert policies["detail"].read_timeout == 3
+        assert policies["detail"].max_attempts == 2
+        assert policies["list"].read_timeout == 10
+        assert policies["custom"].jitter == 0
+
+    def test_timeout_is_split_per_phase(self):
+        timeout = EndpointPolicy(
+            connect_timeout=1, read_timeout=2
+        ).timeout()
+
+        assert timeout.connect == 1
+        assert timeout.read == 2
+
+    def test_retries_only_retryable_errors(self):
+        policy = EndpointPolicy(backoff_initial=0, jitter=0)
+
+        client = _Client(policy, [_status_error(503), _status_error(503)])
+        assert client.call() == "ok"
+        assert client.calls == 3
+
+        client = _Client(policy, [_status_error(404)])
+        with pytest.raises(ExternalAPIException):
+            client.call()
+        assert client.calls == 1
+
+    def test_transport_errors_are_retryable(self):
+        error = ExternalAPIException("boom")
+        error.__cause__ = httpx.ConnectError("refused")
+
+        assert EndpointPolicy().is_retryable(error)
+        assert not EndpointPolicy().is_retryable(ValueError("bad"))
+
+    def test_deadline_stops_retrying(self):
+        policy = EndpointPolicy(
+            max_attempts=10, backoff_initial=0.2, jitter=0, deadline=0.1
+        )
+        client = _Client(policy, [_status_error(503)] * 10)
+
+        with pytest.raises(ExternalAPIException):
+            client.call()
+        assert client.calls == 2
+
+
+class TestHookPolicies:
+    def test_connection_extras_override_settings(self):
+        connection = Mock()
+        connection.extra_dejson = {
+            "policies": {"detail": {"read_timeout": 1.5}}
+        }
+        hook = AnimalsAPIHook()
+
+        with patch.object(hook, "get_connection", return_value=connection):
+            assert hook.policy("detail").read_timeout == 1.5
+            assert hook.policy("home").read_timeout == 30
@@ -0,0 +1,183 @@
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from plugins.operators.animal_etl_operators import (
+    ExtractAnimalsOperator,
+    PrefetchTransformAnimalsOperator,
+    TransformAnimalsOperator,
+)
+from utils.manifest import iter_manifest, manifest_reference
+from utils.prefetch import Prefetcher, batched
+from utils.quarantine import iter_quarantine
+
+
+def _loaded_ids(result):
+    ids = []
+    for entry in iter_manifest(manifest_reference(result)):
+        with open(entry["file"], encoding="utf-8") as f:
+            ids.extend(animal["id"] for animal in json.load(f))
+    return ids
+
+
+class TestPrefetcher:
+    def test_yields_items_in_order(self):
+        with Prefetcher(iter(range(50)), depth=3) as prefetcher:
+            assert list(prefetcher) == list(range(50))
+
+        assert prefetcher.stats()["consumed"] == 50
+
+    def test_producer_stays_within_depth(self):
+        produced = []
+
+        def source():
+            for i in range(20):
+                produced.append(i)
+                yield i
+
+        with Prefetcher(source(), depth=2) as prefetcher:
+            items = iter(prefetcher)
+            assert next(items) == 0
+            time.sleep(0.2)
+            assert len(produced) <= 4
+
+    def test_reraises_producer_errors_after_earlier_items(self):
+        def source():
+            yield 1
+            raise ValueError("page 2 failed")
+
+        with Prefetcher(source()) as prefetcher:
+            items = iter(prefetcher)
+            assert next(items) == 1
+            with pytest.raises(ValueError, match="page 2 failed"):
+                next(items)
+
+    def test_close_stops_blocked_producer_and_closes_source(self):
+        closed = threading.Event()
+
+        def source():
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.set()
+
+        prefetcher = Prefetcher(source(), depth=1).start()
+        next(iter(prefetcher))
+        prefetcher.close()
+
+        assert closed.wait(1)
+
+    def test_stop_yields_only_queued_items(self):
+        produced = []
+
+        def source():
+            for i in range(20):
+                produced.append(i)
+                yield i
+
+        with Prefetcher(source(), depth=2) as prefetcher:
+            items = iter(prefetcher)
+            assert next(items) == 0
+            time.sleep(0.2)
+            prefetcher.stop()
+            rest = list(items)
+
+        assert rest == list(range(1, 1 + len(rest)))
+        assert len(produced) < 20
+
+    def test_batched_keeps_remainder(self):
+        assert [batch for _, batch in batched(range(5), 2)] == [
+            [0, 1],
+            [2, 3],
+            [4],
+        ]
+
+
+class TestPrefetchTransform:
+    @pytest.mark.parametrize(
+        "mock_api", [{"total_animals": 250}], indirect=True
+    )
+    def test_matches_extract_then_transform(self, mock_api, tmp_path):
+        with patch(
+            "plugins.hooks.animals_api_hook.settings.ANIMALS_API_BASE_URL",
+            mock_api.url,
+        ), patch(
+            "plugins.operators.animal_etl_operators.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        ), patch(
+            "utils.quarantine.settings.QUARANTINE_DIR", str(tmp_path)
+        ):
+            context = {"task_instance": Mock(), "run_id": "two_tasks"}
+            extracted = ExtractAnimalsOperator(
+                task_id="extract_animals"
+            ).execute(context)
+            context["task_instance"].xcom_pull.return_value = extracted
+            expected = TransformAnimalsOperator(
+                task_id="transform_animals", batch_size=40
+            ).execute(context)
+
+            context = {"task_instance": Mock(), "run_id": "prefetch"}
+            result = PrefetchTransformAnimalsOperator(
+                task_id="transform_animals",
+                batch_size=40,
+                prefetch_depth=2,
+            ).execute(context)
+
+        assert result["status"] == "completed"
+        assert result["prefetch"]["consumed"] == mock_api.total_pages
+        assert result["prefilter"] == extracted["prefilter"]
+        assert result["quarantined"] == (
+            extracted["quarantined"] + expected["quarantined"]
+        )
+        assert _loaded_ids(result) == _loaded_ids(expected)
+        context["task_instance"].xcom_pull.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "mock_api",
+        [{"total_animals": 200, "page_size": 20}],
+        indirect=True,
+    )
+    def test_deadline_stops_listing_and_quarantines_known_animals(
+        self, mock_api, tmp_path
+    ):
+        from utils.deadline import RunDeadline
+
+        deadline = RunDeadline(expires_at=time.time() + 3600, budget=3600)
+        checks = iter([False, True])
+        with patch(
+            "plugins.hooks.animals_api_hook.settings.ANIMALS_API_BASE_URL",
+            mock_api.url,
+        ), patch(
+            "plugins.operators.animal_etl_operators.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        ), patch(
+            "utils.quarantine.settings.QUARANTINE_DIR", str(tmp_path)
+        ), patch.object(
+            RunDeadline, "from_context", return_value=deadline
+        ), patch.object(
+            RunDeadline,
+            "expired",
+            side_effect=lambda reserve=0.0: reserve > 0 and next(checks),
+        ):
+            result = PrefetchTransformAnimalsOperator(
+                task_id="transform_animals",
+                batch_size=40,
+                prefilter_rules=[],
+                prefetch_depth=1,
+            ).execute({"task_instance": Mock(), "run_id": "deadline"})
+
+        pending = [
+            entry["id"]
+            for entry in iter_quarantine(result["quarantine_file"])
+            if entry["stage"] == "deadline"
+        ]
+        assert result["status"] == "partial"
+        assert result["pending_animals"] == len(pending)
+        assert 40 <= len(pending) <= 60
+        assert pending == list(range(41, 41 + len(pending)))
+        assert mock_api.requests["list"] <= 6
+        assert sorted(_loaded_ids(result)) == list(range(1, 41))
@@ -0,0 +1,68 @@
+import pytest
+
+from utils.exceptions import ValidationException
+from utils.prefilter import PreFilter
+from utils.quarantine import QuarantineWriter, iter_quarantine
+
+
+class TestPreFilter:
+    def test_rejects_doomed_items_with_per_rule_counts(self):
+        prefilter = PreFilter(
+            ["valid_id", "non_empty_name", "parseable_born_at"]
+        )
+        items = [
+            {"id": 1, "name": "Lion", "born_at": None},
+            {"id": -2, "name": "Tiger", "born_at": None},
+            {"id": 3, "name": "  ", "born_at": None},
+            {"id": 4, "name": "Bear", "born_at": "not-a-date"},
+            {"id": 5, "name": "Wolf", "born_at": "2020-01-01"},
+        ]
+
+        rejected = [prefilter.check(item) for item in items]
+
+        assert [r and r[0] for r in rejected] == [
+            None,
+            "valid_id",
+            "non_empty_name",
+            "parseable_born_at",
+            None,
+        ]
+        assert prefilter.summary() == {
+            "passed": 2,
+            "rejected": 3,
+            "rules": {
+                "valid_id": 1,
+                "non_empty_name": 1,
+                "parseable_born_at": 1,
+            },
+        }
+
+    def test_unknown_rule(self):
+        with pytest.raises(ValidationException):
+            PreFilter(["valid_id", "no_such_rule"])
+
+
+class TestQuarantineWriter:
+    def test_writes_nothing_until_first_record(self, tmp_path):
+        path = str(tmp_path / "quarantine" / "quarantine_run.jsonl")
+
+        with QuarantineWriter(path) as quarantine:
+            assert quarantine.summary()["quarantine_file"] is None
+            quarantine.write(
+                "prefilter", "valid_id", -2, {"id": -2}, "Invalid ID: -2"
+            )
+
+        assert quarantine.summary() == {
+            "quarantine_file": path,
+            "quarantined": 1,
+            "quarantine_counts": {"prefilter.valid_id": 1},
+        }
+        assert list(iter_quarantine(path)) == [
+            {
+                "stage": "prefilter",
+                "category": "valid_id",
+                "id": -2,
+                "error": "Invalid ID: -2",
+                "payload": {"id": -2},
+            }
+        ]
@@ -0,0 +1,39 @@
+import os
+from unittest.mock import Mock
+
+from utils.profiling import profile_task
+
+
+class TestProfileTask:
+    def test_disabled_by_default(self, tmp_path):
+        with profile_task(
+            {}, "extract", output_dir=str(tmp_path)
+        ) as result:
+            pass
+
+        assert result is None
+        assert os.listdir(tmp_path) == []
+
+    def test_writes_profile_artifacts_and_summary(self, tmp_path):
+        log = Mock()
+
+        with profile_task(
+            {}, "extract", enabled=True, output_dir=str(tmp_path), log=log
+        ) as artifacts:
+            sorted(str(i) for i in range(10000))
+
+        for path in artifacts.values():
+            assert os.path.exists(path)
+        summary = log.info.call_args.args[0]
+        assert "hotspots" in summary
+        assert "Peak traced memory" in summary
+
+    def test_dag_run_conf_enables_profiling(self, tmp_path):
+        context = {"dag_run": Mock(conf={"profile": True})}
+
+        with profile_task(
+            context, "load", output_dir=str(tmp_path), log=Mock()
+        ) as artifacts:
+            pass
+
+        assert os.path.exists(artifacts["cprofile"])
@@ -0,0 +1,78 @@
+from unittest.mock import Mock
+
+from plugins.operators.animal_etl_operators import page_rows
+from utils.models import AnimalListItem
+from utils.projection import missing_fields, plan_detail_fetches
+from utils.records import AnimalRecord
+from utils.spill import from_row
+
+
+def _items():
+    return [
+        {"id": 1, "name": "Lion", "born_at": None, "friends": None},
+        {
+            "id": 2,
+            "name": "Tiger",
+            "born_at": "2020-01-01",
+            "friends": "Lion",
+        },
+        {"id": 3, "name": "Bear", "born_at": None, "friends": None},
+    ]
+
+
+class TestPlanDetailFetches:
+    def test_list_items_without_friends_need_detail(self):
+        assert missing_fields(_items()[0]) == {"friends"}
+        assert missing_fields(_items()[1]) == set()
+
+    def test_skips_items_that_supply_all_output_fields(self):
+        plan = plan_detail_fetches(_items())
+
+        assert plan.fetch_ids == [1, 3]
+        assert plan.requests_avoided == 1
+
+        fetched = [
+            AnimalRecord(id=3, name="Bear", friends="Wolf"),
+            AnimalRecord(id=1, name="Lion", friends="Tiger"),
+        ]
+        merged = plan.merge(fetched)
+
+        assert [detail.id for detail in merged] == [1, 2, 3]
+        assert merged[1].friends == "Lion"
+
+    def test_optional_friends_skips_every_fetch(self):
+        plan = plan_detail_fetches(_items(), optional_fields=["friends"])
+
+        assert plan.fetch_ids == []
+        assert plan.requests_avoided == 3
+        assert [detail.friends for detail in plan.merge([])] == [
+            "",
+            "Lion",
+            "",
+        ]
+
+    def test_invalid_list_item_falls_back_to_detail(self):
+        plan = plan_detail_fetches(
+            [{"id": 1, "name": ["not", "a", "name"], "born_at": None}],
+            optional_fields=["friends"],
+        )
+
+        assert plan.fetch_ids == [1]
+
+    def test_born_at_left_out_of_list_item_needs_detail(self):
+        rows = page_rows(
+            [
+                AnimalListItem(id=1, name="Lion", friends="Tiger"),
+                AnimalListItem(
+                    id=2, name="Tiger", friends="Lion", born_at=None
+                ),
+            ],
+            [],
+            None,
+            Mock(),
+        )
+
+        plan = plan_detail_fetches([from_row(row) for row in rows])
+
+        assert plan.fetch_ids == [1]
+        assert [detail.id for detail in plan.merge([])] == [2]
@@ -0,0 +1,81 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from plugins.operators.animal_etl_operators import ReplayQuarantineOperator
+from utils.quarantine import (
+    QuarantineWriter,
+    iter_quarantine,
+    quarantine_path,
+    quarantine_transform_failures,
+)
+from utils.records import AnimalRecord
+
+
+class TestQuarantineTransformFailures:
+    def test_records_category_and_payload(self, tmp_path):
+        records = [
+            AnimalRecord(1, "Lion", "Tiger", None),
+            AnimalRecord(2, "  ", "", None),
+        ]
+        path = str(tmp_path / "quarantine.jsonl")
+
+        with QuarantineWriter(path) as quarantine:
+            quarantine_transform_failures(quarantine, records, [{"id": 1}])
+
+        assert list(iter_quarantine(path)) == [
+            {
+                "stage": "transform",
+                "category": "validation_error",
+                "id": 2,
+                "error": "Name cannot be empty",
+                "payload": {
+                    "id": 2,
+                    "name": "  ",
+                    "friends": "",
+                    "born_at": None,
+                },
+            }
+        ]
+
+
+class TestReplayQuarantineOperator:
+    @pytest.mark.parametrize(
+        "mock_api", [{"total_animals": 20}], indirect=True
+    )
+    def test_replays_only_quarantined_ids(self, mock_api, tmp_path):
+        with patch(
+            "utils.quarantine.settings.QUARANTINE_DIR", str(tmp_path)
+        ), patch(
+            "plugins.hooks.animals_api_hook.settings.ANIMALS_API_BASE_URL",
+            mock_api.url,
+        ):
+            with QuarantineWriter(quarantine_path("source")) as source:
+                source.write("detail", "fetch_failed", 5, {"id": 5})
+                source.write("transform", "date_parsing", 6, {"id": 6})
+                source.write("prefilter", "valid_id", 7, {"id": 7})
+                source.write("deadline", "pending", 9, {"id": 9})
+                source.write("list", "parse_error", "x", {"id": "x"})
+                source.write(
+                    "load",
+                    "load_failed",
+                    8,
+                    {
+                        "id": 8,
+                        "name": "Otter",
+                        "friends": [],
+                        "born_at": None,
+                    },
+                )
+
+            result = ReplayQuarantineOperator(
+                task_id="replay", source_run_id="source"
+            ).execute({"task_instance": Mock(), "run_id": "replay_run"})
+
+        assert result["replayed"] == 4
+        assert result["loaded"] == 4
+        assert result["status"] == "completed"
+        assert mock_api.requests["detail"] == 3
+        assert mock_api.requests["home"] == 1
+        assert mock_api.home_animals == 4
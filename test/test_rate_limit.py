@@ -0,0 +1,58 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from utils.rate_limit import RedisTokenBucket
+
+
+class TestRedisTokenBucket:
+    def test_burst_then_refill(self, redis_client):
+        bucket = RedisTokenBucket(
+            redis_client, "animal_etl:ratelimit:test", rate=2.0, burst=2
+        )
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        wait = bucket.reserve()
+        assert 0 < wait <= 0.5
+        time.sleep(wait)
+        assert bucket.reserve() == 0
+
+    def test_shared_between_instances(self, redis_client):
+        first, second = (
+            RedisTokenBucket(
+                redis_client,
+                "animal_etl:ratelimit:test",
+                rate=1.0,
+                burst=1,
+            )
+            for _ in range(2)
+        )
+
+        assert first.reserve() == 0
+        assert 0.9 < second.reserve() <= 1.0
+
+    def test_fails_open_without_redis(self):
+        client = Mock()
+        client.register_script.return_value = Mock(
+            side_effect=ConnectionError("refused")
+        )
+        bucket = RedisTokenBucket(client, "key", rate=1.0, burst=1)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.acquire() == 0.0
+
+    def test_aacquire_calls_redis_off_the_event_loop(self):
+        threads = []
+        client = Mock()
+        client.register_script.return_value = Mock(
+            side_effect=lambda **kwargs: threads.append(
+                threading.get_ident()
+            )
+            or "0"
+        )
+        bucket = RedisTokenBucket(client, "key", rate=1.0, burst=1)
+
+        assert asyncio.run(bucket.aacquire()) == 0.0
+        assert threads and threading.get_ident() not in threads
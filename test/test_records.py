@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.synthetic import animal_details
+from utils.exceptions import FieldValidationException
+from utils.models import AnimalDetail
+from utils.records import AnimalRecord
+from utils.transformers import AnimalDataTransformer, transform_record
+
+
+class TestAnimalRecord:
+    def test_from_payload_matches_detail_normalisation(self):
+        payload = {"id": "7", "name": "Lion", "friends": ["Tiger", None]}
+
+        record = AnimalRecord.from_payload(payload)
+        detail = AnimalDetail(**payload)
+
+        assert record.as_tuple() == (
+            detail.id,
+            detail.name,
+            detail.friends,
+            detail.born_at,
+        )
+        assert not hasattr(record, "__dict__")
+
+    @pytest.mark.parametrize(
+        "payload",
+        [{"id": 1}, {"id": 1.5, "name": "Lion"}, {"id": 1, "name": 3}],
+    )
+    def test_from_payload_rejects_invalid(self, payload):
+        with pytest.raises(ValueError):
+            AnimalRecord.from_payload(payload)
+
+
+class TestTransformRecord:
+    def test_matches_pydantic_pipeline(self):
+        payloads = animal_details(2000)
+        expected = AnimalDataTransformer.to_api_format(
+            AnimalDataTransformer.transform_animals_batch(
+                [AnimalDetail(**payload) for payload in payloads]
+            )
+        )
+
+        result = AnimalDataTransformer.transform_records_batch(
+            [AnimalRecord.from_payload(payload) for payload in payloads]
+        )
+
+        assert result == expected
+
+    def test_rejects_blank_name(self):
+        with pytest.raises(ValueError):
+            transform_record(AnimalRecord(1, "  "))
+
+    @patch("utils.transformers.metrics.incr")
+    def test_batch_reports_failures_by_reason(self, mock_incr):
+        records = [
+            AnimalRecord(1, "Lion"),
+            AnimalRecord(2, "  "),
+            AnimalRecord(3, "Bear", "", "1990-01-01"),
+        ]
+
+        def parse_born_at(value):
+            if value:
+                raise FieldValidationException("born_at", "bad date")
+
+        with patch("utils.transformers.parse_born_at", parse_born_at):
+            result = AnimalDataTransformer.transform_records_batch(records)
+
+        assert [animal["id"] for animal in result] == [1]
+        mock_incr.assert_any_call("transform.failures.validation_error", 1)
+        mock_incr.assert_any_call("transform.failures.date_parsing", 1)
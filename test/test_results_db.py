@@ -0,0 +1,43 @@
+from utils.results_db import ResultStore
+
+
+def _animal(animal_id, name="Lion", friends=None, born_at=None):
+    return {
+        "id": animal_id,
+        "name": name,
+        "friends": friends or [],
+        "born_at": born_at,
+    }
+
+
+class TestResultStore:
+    def test_write_and_lookup(self, tmp_path):
+        with ResultStore(str(tmp_path / "results.db")) as store:
+            written = store.write(
+                "run_1",
+                [
+                    _animal(2, "Tiger", ["Lion"]),
+                    _animal(1, born_at="2020-01-01T00:00:00Z"),
+                ],
+            )
+
+            assert written == 2
+            assert store.get("run_1", 2) == _animal(2, "Tiger", ["Lion"])
+            assert store.get("run_1", 3) is None
+            assert [a["id"] for a in store.iter_run("run_1")] == [1, 2]
+
+    def test_rewrites_replace_rows_per_run(self, tmp_path):
+        path = str(tmp_path / "results.db")
+        with ResultStore(path) as store:
+            store.write("run_1", [_animal(1), _animal(2)])
+            store.write("run_2", [_animal(1, "Lioness")])
+            store.write("run_2", [_animal(1, "Lion II")])
+
+        with ResultStore(path) as store:
+            assert store.runs() == {"run_1": 2, "run_2": 1}
+            assert {
+                run_id: animal["name"]
+                for run_id, animal in store.history(1).items()
+            } == {"run_1": "Lion", "run_2": "Lion II"}
+            assert store.delete_run("run_1") == 2
+            assert store.runs() == {"run_2": 1}
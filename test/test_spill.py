@@ -0,0 +1,50 @@
+from utils.spill import (
+    SpillWriter,
+    from_row,
+    iter_row_batches,
+    iter_rows,
+    read_row_batch,
+    to_row,
+)
+
+
+class TestSpillWriter:
+    def test_spills_when_budget_is_reached(self, tmp_path):
+        path = str(tmp_path / "rows.jsonl")
+
+        with SpillWriter(path, budget_bytes=64) as writer:
+            for animal_id in range(10):
+                writer.append((animal_id, "Lion", "Tiger", None))
+            assert writer.spills >= 2
+            assert len(writer._buffer) < 10
+
+        assert writer.count == 10
+        assert [row[0] for row in iter_rows(path)] == list(range(10))
+
+    def test_batches_can_be_reread_by_offset(self, tmp_path):
+        path = str(tmp_path / "rows.jsonl")
+        with SpillWriter(path) as writer:
+            for animal_id in range(1, 8):
+                writer.append(to_row({"id": animal_id, "name": "Bear"}))
+
+        batches = list(iter_row_batches(path, 3))
+
+        assert [len(rows) for _, rows in batches] == [3, 3, 1]
+        offset, rows = batches[1]
+        assert read_row_batch(path, offset, 3) == rows
+        assert from_row(rows[0]) == {
+            "id": 4,
+            "name": "Bear",
+            "friends": None,
+        }
+
+    def test_rows_keep_whether_born_at_was_sent(self):
+        assert from_row(
+            to_row({"id": 1, "name": "Bear", "born_at": None})
+        ) == {
+            "id": 1,
+            "name": "Bear",
+            "friends": None,
+            "born_at": None,
+        }
+        assert "born_at" not in from_row(to_row({"id": 1, "name": "Bear"}))
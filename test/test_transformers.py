@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+from utils.models import AnimalDetail
+from utils.transformers import (
+    AnimalDataTransformer,
+    ProcessPoolTransformer,
+)
+
+
+def _details():
+    return [
+        AnimalDetail(id=1, name="Lion", friends="Tiger,Bear", born_at=0),
+        AnimalDetail(id=2, name="Tiger", friends=["Lion"], born_at=None),
+        AnimalDetail(id=3, name="  ", friends="", born_at=None),
+        AnimalDetail(
+            id=4, name="Bear", friends="", born_at="2020-01-02T03:04:05"
+        ),
+    ]
+
+
+class TestProcessPoolTransformer:
+    def test_matches_inline_transformation(self):
+        details = _details()
+        expected = AnimalDataTransformer.to_api_format(
+            AnimalDataTransformer.transform_animals_batch(details)
+        )
+
+        with ProcessPoolTransformer(processes=2, chunk_size=2) as pool:
+            result = pool.result(pool.submit(details))
+
+        assert result == expected
+        assert [animal["id"] for animal in result] == [1, 2, 4]
+
+    def test_falls_back_inline_when_pool_cannot_start(self):
+        with ProcessPoolTransformer(processes=2) as pool:
+            with patch.object(
+                pool._executor,
+                "submit",
+                side_effect=AssertionError("daemonic processes"),
+            ):
+                result = pool.result(pool.submit(_details()))
+
+        assert [animal["id"] for animal in result] == [1, 2, 4]
+        assert pool._executor is None
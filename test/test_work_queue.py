@@ -0,0 +1,223 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from airflow.exceptions import AirflowException
+from pydantic import ValidationError
+
+from config.settings import Settings
+from plugins.operators.animal_etl_operators import ExtractAnimalsOperator
+from plugins.operators.queue_operators import (
+    EnqueueBatchesOperator,
+    QueueSummaryOperator,
+    QueueWorkerOperator,
+)
+from utils.quarantine import iter_quarantine
+from utils.work_queue import LEASE_EXPIRED, RedisWorkQueue, queue_name
+
+
+def _queue(client, **kwargs):
+    return RedisWorkQueue(client, "animal_etl:queue:test", **kwargs)
+
+
+class TestRedisWorkQueue:
+    def test_claim_and_ack(self, redis_client):
+        queue = _queue(redis_client)
+        assert queue.enqueue([[1, 2], [3]]) == 2
+
+        assert queue.claim(now=0) == ("0", [1, 2], 1)
+        assert queue.claim(now=0) == ("1", [3], 1)
+        assert queue.claim(now=0) is None
+        assert not queue.drained()
+
+        assert queue.ack("0")
+        assert queue.ack("1")
+        assert not queue.ack("1")
+        assert queue.drained()
+        assert queue.stats()["done"] == 2
+
+    def test_nack_requeues_until_max_attempts(self, redis_client):
+        queue = _queue(redis_client, max_attempts=2)
+        queue.enqueue([[1]])
+
+        batch_id, _, attempts = queue.claim(now=0)
+        assert attempts == 1
+        assert queue.nack(batch_id, "boom") is True
+
+        batch_id, _, attempts = queue.claim(now=0)
+        assert attempts == 2
+        assert queue.nack(batch_id, "boom again") is False
+        assert queue.nack(batch_id) is None
+
+        assert queue.drained()
+        assert queue.stats()["failed"] == 1
+        assert queue.failed_errors() == {"0": "boom again"}
+
+    def test_expired_lease_is_reclaimed(self, redis_client):
+        queue = _queue(redis_client, visibility_timeout=10, max_attempts=2)
+        queue.enqueue([[1]])
+
+        assert queue.claim(now=0)[0] == "0"
+        assert queue.claim(now=5) is None
+        assert queue.extend("0", now=5)
+
+        assert queue.claim(now=20) == ("0", [1], 2)
+        assert queue.stats()["requeued"] == 1
+
+        assert queue.claim(now=40) is None
+        assert queue.drained()
+        assert queue.failed_errors() == {"0": "lease expired"}
+
+    def test_failed_batches_keep_payloads(self, redis_client):
+        queue = _queue(redis_client, visibility_timeout=10, max_attempts=1)
+        queue.enqueue([[1], [2]])
+
+        queue.claim(now=0)
+        queue.nack(queue.claim(now=0)[0], "boom")
+        queue.claim(now=20)
+
+        assert sorted(queue.failed_batches()) == [
+            ("0", [1], LEASE_EXPIRED),
+            ("1", [2], "boom"),
+        ]
+
+    def test_delete(self, redis_client):
+        queue = _queue(redis_client)
+        queue.enqueue([[1]])
+        queue.delete()
+
+        assert not any(redis_client.exists(key) for key in queue.keys)
+
+
+class TestQueueOperators:
+    def test_workers_drain_queue(self, redis_client, mock_api, tmp_path):
+        context = {"task_instance": Mock(), "run_id": "queue_run"}
+
+        with patch(
+            "plugins.hooks.animals_api_hook.settings.ANIMALS_API_BASE_URL",
+            mock_api.url,
+        ), patch(
+            "utils.redis_client.get_redis", return_value=redis_client
+        ), patch(
+            "utils.quarantine.settings.QUARANTINE_DIR", str(tmp_path)
+        ):
+            context[
+                "task_instance"
+            ].xcom_pull.return_value = ExtractAnimalsOperator(
+                task_id="extract_animals"
+            ).execute(
+                context
+            )
+            enqueued = EnqueueBatchesOperator(
+                task_id="enqueue_batches", batch_size=300
+            ).execute(context)
+
+            workers = [
+                QueueWorkerOperator(
+                    task_id=f"queue_worker_{index}",
+                    worker_index=index,
+                    poll_interval=0,
+                ).execute(context)
+                for index in range(2)
+            ]
+
+            context["task_instance"].xcom_pull.return_value = workers
+            summary = QueueSummaryOperator(task_id="load_animals").execute(
+                context
+            )
+
+        assert enqueued["total_batches"] == 4
+        assert workers[0]["batches"] == 4
+        assert workers[1]["batches"] == 0
+        assert summary["status"] == "completed"
+        assert summary["successful_batches"] == 4
+        assert summary["total_animals"] == mock_api.home_animals
+        assert mock_api.home_animals == enqueued["total_animals"]
+
+    def test_summary_quarantines_batches_with_expired_leases(
+        self, redis_client, tmp_path
+    ):
+        from utils.spill import to_row
+
+        queue = RedisWorkQueue(
+            redis_client,
+            queue_name("queue_run"),
+            visibility_timeout=10,
+            max_attempts=1,
+        )
+        queue.enqueue(
+            [
+                [to_row({"id": 1, "name": "Lion"})],
+                [to_row({"id": 2, "name": "Tiger"})],
+            ]
+        )
+        queue.claim(now=0)
+        queue.nack(queue.claim(now=0)[0], "boom")
+        queue.claim(now=20)
+
+        context = {"task_instance": Mock(), "run_id": "queue_run"}
+        context["task_instance"].xcom_pull.return_value = []
+        with patch(
+            "utils.redis_client.get_redis", return_value=redis_client
+        ), patch(
+            "utils.quarantine.settings.QUARANTINE_DIR", str(tmp_path)
+        ):
+            summary = QueueSummaryOperator(task_id="load_animals").execute(
+                context
+            )
+
+        entries = list(iter_quarantine(summary["quarantine_file"]))
+        assert summary["status"] == "partial"
+        assert summary["quarantine_counts"] == {"queue.lease_expired": 1}
+        assert [
+            (entry["id"], entry["payload"]["name"]) for entry in entries
+        ] == [(1, "Lion")]
+
+    def _rows(self):
+        from utils.spill import to_row
+
+        return [
+            to_row(
+                {
+                    "id": 1,
+                    "name": "Lion",
+                    "born_at": "2020-01-01",
+                    "friends": "Tiger",
+                }
+            )
+        ]
+
+    def test_worker_drops_batch_after_losing_lease(self):
+        queue = Mock()
+        queue.extend.return_value = False
+        hook = Mock()
+
+        loaded = QueueWorkerOperator(
+            task_id="queue_worker", worker_index=0
+        )._process_batch(hook, queue, "0", self._rows(), Mock())
+
+        assert loaded is None
+        hook.send_animals_to_home.assert_not_called()
+
+    def test_worker_fails_batch_rejected_by_home_api(self):
+        queue = Mock()
+        queue.extend.return_value = True
+        hook = Mock()
+        hook.send_animals_to_home.return_value = False
+
+        with pytest.raises(AirflowException, match="rejected 1 animals"):
+            QueueWorkerOperator(
+                task_id="queue_worker", worker_index=0
+            )._process_batch(hook, queue, "0", self._rows(), Mock())
+
+
+class TestWorkQueueSettings:
+    @pytest.mark.parametrize(
+        "overrides",
+        [{"LOAD_CHANGES_ONLY": True}, {"RESULTS_DB_PATH": "results.db"}],
+    )
+    def test_rejects_results_database_settings(self, overrides):
+        with pytest.raises(ValidationError, match="WORK_QUEUE_ENABLED"):
+            Settings(WORK_QUEUE_ENABLED=True, **overrides)
+
+    def test_allows_work_queue_alone(self):
+        assert Settings(WORK_QUEUE_ENABLED=True).WORK_QUEUE_ENABLED
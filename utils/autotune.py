@@ -0,0 +1,317 @@
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config.settings import settings
+from utils.log import get_logger
+
+logger = get_logger("autotune")
+
+MOVES = (
+    ("concurrency", 2.0),
+    ("concurrency", 0.5),
+    ("batch_size", 2.0),
+    ("batch_size", 0.5),
+)
+
+
+def autotune_state_path() -> str:
+    return settings.AUTOTUNE_STATE_PATH or os.path.join(
+        tempfile.gettempdir(), "animal_etl_autotune.json"
+    )
+
+
+def _read_state(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_tuning(
+    conn_id: str, path: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    return _read_state(path or autotune_state_path()).get(conn_id)
+
+
+def save_tuning(
+    conn_id: str, report: Dict[str, Any], path: Optional[str] = None
+) -> None:
+    path = path or autotune_state_path()
+    state = _read_state(path)
+    state[conn_id] = {
+        "batch_size": report["batch_size"],
+        "concurrency": report["concurrency"],
+        "throughput": report["throughput"],
+        "error_rate": report["error_rate"],
+        "converged": report["converged"],
+        "updated_at": time.time(),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+    logger.info("Saved tuned settings", conn_id=conn_id, path=path)
+
+
+class Trial:
+    __slots__ = (
+        "batch_size",
+        "concurrency",
+        "batches",
+        "records",
+        "failures",
+        "seconds",
+        "verdict",
+    )
+
+    def __init__(self, batch_size: int, concurrency: int):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.batches = 0
+        self.records = 0
+        self.failures = 0
+        self.seconds = 0.0
+        self.verdict = ""
+
+    @property
+    def config(self) -> Tuple[int, int]:
+        return self.batch_size, self.concurrency
+
+    @property
+    def throughput(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.failures / self.records if self.records else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "batch_size": self.batch_size,
+            "concurrency": self.concurrency,
+            "batches": self.batches,
+            "records": self.records,
+            "throughput": round(self.throughput, 2),
+            "error_rate": round(self.error_rate, 4),
+            "verdict": self.verdict,
+        }
+
+
+class AutoTuner:
+    def __init__(
+        self,
+        batch_size: int,
+        concurrency: int,
+        min_batch_size: int = 25,
+        max_batch_size: int = 1000,
+        max_concurrency: int = 50,
+        trial_batches: int = 2,
+        max_error_rate: float = 0.05,
+        min_gain: float = 0.05,
+        tune_batch_size: bool = True,
+    ):
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max(min_batch_size, max_batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.trial_batches = max(1, trial_batches)
+        self.max_error_rate = max_error_rate
+        self.min_gain = min_gain
+        self.tune_batch_size = tune_batch_size
+        self.start = self._clamp(batch_size, concurrency)
+        self.current = Trial(*self.start)
+        self.best: Optional[Trial] = None
+        self.history: List[Trial] = []
+        self.converged = False
+        self._tried = {self.start}
+        self._moves: List[Tuple[str, float]] = []
+        self._last_move: Optional[Tuple[str, float]] = None
+
+    @classmethod
+    def for_connection(
+        cls,
+        conn_id: str,
+        batch_size: int,
+        concurrency: int,
+        tune_batch_size: bool = True,
+    ) -> "AutoTuner":
+        saved = load_tuning(conn_id)
+        if saved:
+            concurrency = saved.get("concurrency", concurrency)
+            if tune_batch_size:
+                batch_size = saved.get("batch_size", batch_size)
+        return cls(
+            batch_size,
+            concurrency,
+            min_batch_size=settings.AUTOTUNE_MIN_BATCH_SIZE,
+            max_batch_size=settings.AUTOTUNE_MAX_BATCH_SIZE,
+            max_concurrency=settings.AUTOTUNE_MAX_CONCURRENCY,
+            trial_batches=settings.AUTOTUNE_TRIAL_BATCHES,
+            max_error_rate=settings.AUTOTUNE_MAX_ERROR_RATE,
+            min_gain=settings.AUTOTUNE_MIN_GAIN,
+            tune_batch_size=tune_batch_size,
+        )
+
+    @property
+    def batch_size(self) -> int:
+        return self.current.batch_size
+
+    @property
+    def concurrency(self) -> int:
+        return self.current.concurrency
+
+    def _clamp(self, batch_size: int, concurrency: int) -> Tuple[int, int]:
+        if self.tune_batch_size:
+            batch_size = min(
+                max(int(batch_size), self.min_batch_size),
+                self.max_batch_size,
+            )
+        return batch_size, min(
+            max(int(concurrency), 1), self.max_concurrency
+        )
+
+    def batches(
+        self, rows: Iterable[Tuple]
+    ) -> Iterator[Tuple[None, List[Tuple]]]:
+        batch: List[Tuple] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield None, batch
+                batch = []
+        if batch:
+            yield None, batch
+
+    def record(
+        self, records: int, seconds: float, failures: int = 0
+    ) -> None:
+        trial = self.current
+        trial.batches += 1
+        trial.records += records
+        trial.failures += failures
+        trial.seconds += seconds
+        if self.converged or trial.batches < self.trial_batches:
+            return
+        self._finish(trial)
+
+    def _acceptable(self, trial: Trial) -> bool:
+        return trial.error_rate <= self.max_error_rate
+
+    def _better(self, trial: Trial, best: Trial) -> bool:
+        if not self._acceptable(best):
+            return trial.error_rate < best.error_rate or (
+                trial.error_rate == best.error_rate
+                and trial.concurrency < best.concurrency
+            )
+        if not self._acceptable(trial):
+            return False
+        return trial.throughput > best.throughput * (1 + self.min_gain)
+
+    def _finish(self, trial: Trial) -> None:
+        self.history.append(trial)
+        best = self.best
+        if best is None:
+            trial.verdict = "baseline"
+            self._promote(trial, None)
+        elif self._better(trial, best):
+            trial.verdict = "accepted"
+            self._promote(trial, self._last_move)
+        elif not self._acceptable(trial):
+            trial.verdict = "error_rate"
+        else:
+            trial.verdict = "slower"
+
+        logger.info(
+            "Autotune trial finished",
+            batch_size=trial.batch_size,
+            concurrency=trial.concurrency,
+            throughput=round(trial.throughput, 2),
+            error_rate=round(trial.error_rate, 4),
+            verdict=trial.verdict,
+        )
+        self._advance()
+
+    def _promote(
+        self, trial: Trial, move: Optional[Tuple[str, float]]
+    ) -> None:
+        self.best = trial
+        moves = [
+            m
+            for m in MOVES
+            if self.tune_batch_size or m[0] != "batch_size"
+        ]
+        if not self._acceptable(trial):
+            moves.sort(key=lambda m: m[1] > 1)
+        elif move in moves:
+            moves.remove(move)
+            moves.insert(0, move)
+        self._moves = moves
+
+    def _advance(self) -> None:
+        best = self.best
+        while self._moves:
+            move = self._moves.pop(0)
+            knob, factor = move
+            config = self._clamp(
+                best.batch_size * (factor if knob == "batch_size" else 1),
+                best.concurrency
+                * (factor if knob == "concurrency" else 1),
+            )
+            if config in self._tried:
+                continue
+            self._tried.add(config)
+            self._last_move = move
+            self.current = Trial(*config)
+            return
+
+        self.converged = True
+        self.current = Trial(*best.config)
+        self.current.verdict = "steady"
+
+    def report(self) -> Dict[str, Any]:
+        best = self.best or self.current
+        trials = [trial.as_dict() for trial in self.history]
+        if self.best is None:
+            reason = (
+                "Not enough batches for a full trial, kept the starting "
+                "settings"
+            )
+        elif not self._acceptable(best):
+            reason = (
+                f"No setting stayed under the {self.max_error_rate:.0%} "
+                f"error rate; kept batch_size={best.batch_size} "
+                f"concurrency={best.concurrency} with the fewest errors"
+            )
+        elif self.converged:
+            reason = (
+                f"batch_size={best.batch_size} "
+                f"concurrency={best.concurrency} was the best of "
+                f"{len(self.history)} trials at {best.throughput:.1f} "
+                f"records/s; none of the neighbouring settings was "
+                f"faster by more than {self.min_gain:.0%} without "
+                f"exceeding the {self.max_error_rate:.0%} error rate"
+            )
+        else:
+            reason = (
+                f"Run ended before converging; best so far was "
+                f"batch_size={best.batch_size} "
+                f"concurrency={best.concurrency} "
+                f"at {best.throughput:.1f} records/s"
+            )
+        return {
+            "batch_size": best.batch_size,
+            "concurrency": best.concurrency,
+            "throughput": round(best.throughput, 2),
+            "error_rate": round(best.error_rate, 4),
+            "converged": self.converged,
+            "start": {
+                "batch_size": self.start[0],
+                "concurrency": self.start[1],
+            },
+            "trials": trials,
+            "reason": reason,
+        }
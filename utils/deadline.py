@@ -0,0 +1,99 @@
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Set
+
+from config.settings import settings
+from utils.exceptions import DeadlineExceededException
+from utils.policies import EndpointPolicy
+
+
+class RunDeadline:
+    def __init__(self, expires_at: float, budget: float):
+        self.expires_at = expires_at
+        self.budget = budget
+
+    @classmethod
+    def from_context(
+        cls, context: Dict[str, Any], budget: Optional[float] = None
+    ) -> Optional["RunDeadline"]:
+        if budget is None:
+            params = context.get("params") or {}
+            budget = params.get(
+                "run_deadline_seconds", settings.RUN_DEADLINE_SECONDS
+            )
+
+        now = time.time()
+        candidates = []
+
+        if budget:
+            dag_run = context.get("dag_run")
+            start_date = getattr(dag_run, "start_date", None)
+            started = start_date.timestamp() if start_date else now
+            candidates.append((started + float(budget), float(budget)))
+
+        task = context.get("task")
+        task_instance = context.get("task_instance")
+        execution_timeout = getattr(task, "execution_timeout", None)
+        start_date = getattr(task_instance, "start_date", None)
+        if execution_timeout and start_date:
+            timeout = execution_timeout.total_seconds()
+            candidates.append((start_date.timestamp() + timeout, timeout))
+
+        if not candidates:
+            return None
+        expires_at, budget = min(candidates)
+        return cls(expires_at, budget)
+
+    def remaining(self) -> float:
+        return self.expires_at - time.time()
+
+    def expired(self, reserve: float = 0.0) -> bool:
+        return self.remaining() <= reserve
+
+    def is_low(self) -> bool:
+        return (
+            self.remaining()
+            < self.budget * settings.RUN_DEADLINE_LOW_FRACTION
+        )
+
+    def check(self, what: str) -> None:
+        if self.expired():
+            raise DeadlineExceededException(
+                f"Run deadline exceeded before {what}",
+                error_code="RUN_DEADLINE_EXCEEDED",
+                details={"expires_at": self.expires_at},
+            )
+
+    def constrain(self, policy: EndpointPolicy) -> EndpointPolicy:
+        remaining = max(
+            self.remaining() - settings.RUN_DEADLINE_RESERVE, 0.0
+        )
+        update = {
+            "deadline": min(policy.deadline or remaining, remaining),
+            "read_timeout": max(min(policy.read_timeout, remaining), 1.0),
+        }
+        if self.is_low():
+            update["max_attempts"] = min(policy.max_attempts, 2)
+            update["backoff_max"] = min(policy.backoff_max, 1.0)
+            update["jitter"] = min(policy.jitter, 0.1)
+        return policy.copy(update=update)
+
+
+class Checkpoint:
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[Any] = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.done = {
+                    json.loads(line) for line in f if line.strip()
+                }
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.done
+
+    def mark(self, key: Any) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(key) + "\n")
+        self.done.add(key)
@@ -0,0 +1,178 @@
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from config.settings import settings
+from utils import metrics
+from utils.log import SampledLogger, get_logger, truncate
+from utils.records import AnimalRecord
+
+sampled_logger = SampledLogger(get_logger("detail_cache"))
+
+GET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local result = {}
+for i = 2, #ARGV do
+    local expires = tonumber(redis.call('ZSCORE', KEYS[2], ARGV[i]))
+    if expires and expires > now then
+        result[#result + 1] = redis.call('HGET', KEYS[1], ARGV[i])
+    else
+        result[#result + 1] = false
+    end
+end
+return result
+"""
+
+PUT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local max_bytes = tonumber(ARGV[3])
+local bytes = tonumber(redis.call('HGET', KEYS[3], 'bytes') or '0')
+local function remove(id)
+    bytes = bytes - redis.call('HSTRLEN', KEYS[1], id)
+    redis.call('HDEL', KEYS[1], id)
+    redis.call('ZREM', KEYS[2], id)
+end
+local expired = redis.call(
+    'ZRANGEBYSCORE', KEYS[2], '-inf', now, 'LIMIT', 0, 1000
+)
+for _, id in ipairs(expired) do
+    remove(id)
+end
+for i = 4, #ARGV, 2 do
+    remove(ARGV[i])
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+    redis.call('ZADD', KEYS[2], now + ttl, ARGV[i])
+    bytes = bytes + string.len(ARGV[i + 1])
+end
+local evicted = 0
+while bytes > max_bytes do
+    local oldest = redis.call('ZRANGE', KEYS[2], 0, 0)
+    if #oldest == 0 then
+        break
+    end
+    remove(oldest[1])
+    evicted = evicted + 1
+end
+redis.call('HSET', KEYS[3], 'bytes', math.max(bytes, 0))
+redis.call('HINCRBY', KEYS[3], 'evicted', evicted)
+for _, key in ipairs(KEYS) do
+    redis.call('EXPIRE', key, ttl)
+end
+return evicted
+"""
+
+
+class RedisDetailCache:
+    def __init__(
+        self,
+        client: Any,
+        name: str,
+        ttl: int = 900,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.client = client
+        self.name = name
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._get = client.register_script(GET_SCRIPT)
+        self._put = client.register_script(PUT_SCRIPT)
+
+    @property
+    def keys(self) -> List[str]:
+        return [
+            f"{self.name}:{suffix}"
+            for suffix in ("entries", "expiry", "meta")
+        ]
+
+    def get_many(
+        self, animal_ids: List[int], now: Optional[float] = None
+    ) -> Dict[int, AnimalRecord]:
+        if not animal_ids:
+            return {}
+        now = time.time() if now is None else now
+        try:
+            values = self._get(keys=self.keys[:2], args=[now, *animal_ids])
+        except Exception as e:
+            sampled_logger.warning(
+                "detail_cache_unavailable",
+                "Shared detail cache unavailable, fetching from the API",
+                error=truncate(e),
+            )
+            return {}
+
+        records = {
+            animal_id: AnimalRecord(*json.loads(value))
+            for animal_id, value in zip(animal_ids, values)
+            if value is not None
+        }
+        self.hits += len(records)
+        self.misses += len(animal_ids) - len(records)
+        metrics.incr("api.detail.cache_hits", len(records))
+        return records
+
+    def put_many(
+        self, records: Iterable[AnimalRecord], now: Optional[float] = None
+    ) -> int:
+        args: List[Any] = []
+        for record in records:
+            args.append(record.id)
+            args.append(
+                json.dumps(record.as_tuple(), separators=(",", ":"))
+            )
+        if not args:
+            return 0
+        now = time.time() if now is None else now
+        try:
+            evicted = int(
+                self._put(
+                    keys=self.keys,
+                    args=[now, self.ttl, self.max_bytes, *args],
+                )
+            )
+        except Exception as e:
+            sampled_logger.warning(
+                "detail_cache_unavailable",
+                "Shared detail cache unavailable, not caching",
+                error=truncate(e),
+            )
+            return 0
+        if evicted:
+            metrics.incr("api.detail.cache_evictions", evicted)
+        return evicted
+
+    def stats(self) -> Dict[str, int]:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hlen(self.keys[0])
+        pipe.hgetall(self.keys[2])
+        entries, meta = pipe.execute()
+        meta = {
+            (k.decode("utf-8") if isinstance(k, bytes) else k): int(v)
+            for k, v in meta.items()
+        }
+        return {
+            "entries": entries,
+            "bytes": meta.get("bytes", 0),
+            "evicted": meta.get("evicted", 0),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self) -> None:
+        self.client.delete(*self.keys)
+
+
+def shared_detail_cache(conn_id: str) -> Optional[RedisDetailCache]:
+    if not settings.SHARED_DETAIL_CACHE_ENABLED:
+        return None
+
+    from utils.redis_client import get_redis
+
+    return RedisDetailCache(
+        get_redis(),
+        f"animal_etl:details:{conn_id}",
+        ttl=settings.DETAIL_CACHE_TTL,
+        max_bytes=settings.DETAIL_CACHE_MAX_MB * 1024 * 1024,
+    )
@@ -0,0 +1,97 @@
+from typing import Any, Dict, List, Optional
+
+from utils.log import get_logger
+from utils.results_db import ResultStore
+
+logger = get_logger("diff")
+
+DIFF_FIELDS = ("name", "friends", "born_at")
+
+
+def animal_changed(
+    previous: Dict[str, Any], current: Dict[str, Any]
+) -> bool:
+    return any(previous[field] != current[field] for field in DIFF_FIELDS)
+
+
+class RunDiff:
+    def __init__(
+        self, store: ResultStore, run_id: str, baseline_run_id: str
+    ):
+        self.store = store
+        self.run_id = run_id
+        self.baseline_run_id = baseline_run_id
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.deleted = 0
+        self.deleted_ids: List[int] = []
+
+    @classmethod
+    def for_run(
+        cls, store: ResultStore, run_id: str
+    ) -> Optional["RunDiff"]:
+        baseline = store.baseline()
+        if baseline is None or baseline == run_id:
+            return None
+        return cls(store, run_id, baseline)
+
+    def changed(
+        self, animals: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        previous = self.store.get_many(
+            self.baseline_run_id, [animal["id"] for animal in animals]
+        )
+        changed = []
+        for animal in animals:
+            before = previous.get(animal["id"])
+            if before is None:
+                self.inserted += 1
+            elif animal_changed(before, animal):
+                self.updated += 1
+            else:
+                self.unchanged += 1
+                continue
+            changed.append(animal)
+        return changed
+
+    def finish(self) -> None:
+        self.deleted_ids = self.store.missing_from(
+            self.baseline_run_id, self.run_id
+        )
+        self.deleted = len(self.deleted_ids)
+        if self.deleted:
+            logger.info(
+                "Animals missing since baseline",
+                baseline_run_id=self.baseline_run_id,
+                deleted=self.deleted,
+                sample_ids=self.deleted_ids[:10],
+            )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "baseline_run_id": self.baseline_run_id,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "deleted": self.deleted,
+        }
+
+
+def promote_baseline(transform_result: Optional[Dict[str, Any]]) -> bool:
+    diff = (transform_result or {}).get("diff")
+    if not diff or transform_result.get("status") != "completed":
+        return False
+
+    with ResultStore(diff["results_db_path"]) as store:
+        keep = {diff["run_id"], store.baseline()}
+        store.set_baseline(diff["run_id"])
+        pruned = [run_id for run_id in store.runs() if run_id not in keep]
+        for run_id in pruned:
+            store.delete_run(run_id)
+    logger.info(
+        "Promoted load baseline",
+        run_id=diff["run_id"],
+        pruned_runs=len(pruned),
+    )
+    return True
@@ -24,3 +24,15 @@ class DataTransformationException(AnimalETLException):
 
 class ValidationException(AnimalETLException):
     pass
+
+
+class DeadlineExceededException(AnimalETLException):
+    pass
+
+
+class FieldValidationException(ValidationException, ValueError):
+    def __init__(self, field: str, message: str) -> None:
+        super().__init__(
+            message, error_code="INVALID_FIELD", details={"field": field}
+        )
+        self.field = field
@@ -0,0 +1,171 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.models import parse_friends
+
+UNRESOLVED = -1
+AMBIGUOUS = -2
+
+
+class FriendInterner:
+    def __init__(self, cache_size: int = 65536):
+        self.names: List[str] = []
+        self.codes: Dict[str, int] = {}
+        self.cache_size = cache_size
+        self._parsed: Dict[str, Tuple[int, ...]] = {}
+        self.cache_hits = 0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def code(self, name: str) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.names.append(name)
+            self.codes[name] = code
+        return code
+
+    def intern(self, name: str) -> str:
+        return self.names[self.code(name)]
+
+    def codes_for(self, value: Any) -> Tuple[int, ...]:
+        if not isinstance(value, str):
+            return tuple(self.code(name) for name in parse_friends(value))
+
+        codes = self._parsed.get(value)
+        if codes is not None:
+            self.cache_hits += 1
+            return codes
+
+        codes = tuple(self.code(name) for name in parse_friends(value))
+        if len(self._parsed) >= self.cache_size:
+            self._parsed.clear()
+        self._parsed[value] = codes
+        return codes
+
+    def parse(self, value: Any) -> List[str]:
+        names = self.names
+        return [names[code] for code in self.codes_for(value)]
+
+
+class NameIndex:
+    def __init__(self, interner: FriendInterner):
+        self.interner = interner
+        self._ids: Dict[int, int] = {}
+
+    def add(self, animal_id: int, name: Optional[str]) -> None:
+        if not isinstance(name, str) or not name.strip():
+            return
+        code = self.interner.code(name.strip())
+        existing = self._ids.get(code)
+        if existing is None:
+            self._ids[code] = animal_id
+        elif existing != animal_id:
+            self._ids[code] = AMBIGUOUS
+
+    def resolve(self, code: int) -> int:
+        return self._ids.get(code, UNRESOLVED)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[List[Any]], interner: FriendInterner
+    ) -> "NameIndex":
+        index = cls(interner)
+        for row in rows:
+            index.add(row[0], row[1])
+        return index
+
+
+class FriendsGraph:
+    def __init__(self, interner: FriendInterner):
+        self.interner = interner
+        self.animal_ids = array("q")
+        self.offsets = array("q", [0])
+        self.targets = array("l")
+
+    def __len__(self) -> int:
+        return len(self.animal_ids)
+
+    @property
+    def edges(self) -> int:
+        return len(self.targets)
+
+    def add(self, animal_id: int, friends: Any) -> None:
+        if isinstance(friends, list):
+            codes = [self.interner.code(name) for name in friends]
+        else:
+            codes = self.interner.codes_for(friends)
+        self.animal_ids.append(animal_id)
+        self.targets.extend(codes)
+        self.offsets.append(len(self.targets))
+
+    def friend_codes(self, position: int) -> array:
+        return self.targets[
+            self.offsets[position] : self.offsets[position + 1]
+        ]
+
+    def friends_of(self, position: int) -> List[str]:
+        names = self.interner.names
+        return [names[code] for code in self.friend_codes(position)]
+
+    def nbytes(self) -> int:
+        return sum(
+            len(arr) * arr.itemsize
+            for arr in (self.animal_ids, self.offsets, self.targets)
+        )
+
+    def validate(
+        self, index: Optional[NameIndex] = None
+    ) -> Dict[str, Any]:
+        degrees = [
+            self.offsets[i + 1] - self.offsets[i] for i in range(len(self))
+        ]
+        report = {
+            "animals": len(self),
+            "edges": self.edges,
+            "unique_names": len(self.interner),
+            "max_degree": max(degrees, default=0),
+            "isolated": sum(1 for degree in degrees if degree == 0),
+            "duplicate_edges": sum(
+                degree - len(set(self.friend_codes(i)))
+                for i, degree in enumerate(degrees)
+            ),
+            "csr_bytes": self.nbytes(),
+        }
+        if index is None:
+            return report
+
+        positions = {
+            animal_id: i for i, animal_id in enumerate(self.animal_ids)
+        }
+        resolved = unresolved = ambiguous = 0
+        self_references = asymmetric = 0
+        for i, animal_id in enumerate(self.animal_ids):
+            for code in self.friend_codes(i):
+                target = index.resolve(code)
+                if target == UNRESOLVED:
+                    unresolved += 1
+                    continue
+                if target == AMBIGUOUS:
+                    ambiguous += 1
+                    continue
+                resolved += 1
+                if target == animal_id:
+                    self_references += 1
+                    continue
+                back = positions.get(target)
+                if back is None or all(
+                    index.resolve(other) != animal_id
+                    for other in self.friend_codes(back)
+                ):
+                    asymmetric += 1
+
+        report.update(
+            resolved=resolved,
+            unresolved=unresolved,
+            ambiguous=ambiguous,
+            self_references=self_references,
+            asymmetric=asymmetric,
+        )
+        return report
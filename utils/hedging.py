@@ -0,0 +1,121 @@
+import threading
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    TimeoutError,
+    wait,
+)
+from typing import Any, Callable, Optional
+
+from utils import metrics
+
+
+class LatencyTracker:
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 1000,
+        refresh_every: int = 50,
+    ):
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.refresh_every = refresh_every
+        self._samples: deque = deque(maxlen=window)
+        self._since_refresh = 0
+        self._threshold: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self._since_refresh += 1
+            if (
+                self._threshold is None
+                or self._since_refresh >= self.refresh_every
+            ):
+                self._refresh()
+
+    def _refresh(self) -> None:
+        self._since_refresh = 0
+        if len(self._samples) < self.min_samples:
+            self._threshold = None
+            return
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(self.quantile * len(ordered)))
+        self._threshold = ordered[index]
+
+    def threshold(self) -> Optional[float]:
+        return self._threshold
+
+
+class HedgeBudget:
+    def __init__(self, ratio: float):
+        self.ratio = ratio
+        self.requests = 0
+        self.fired = 0
+        self.won = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def acquire(self) -> bool:
+        with self._lock:
+            if self.fired + 1 > self.ratio * self.requests:
+                return False
+            self.fired += 1
+            return True
+
+    def record_win(self) -> None:
+        with self._lock:
+            self.won += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedges_fired": self.fired,
+            "hedges_won": self.won,
+        }
+
+
+def hedged_call(
+    executor: Executor,
+    fn: Callable[..., Any],
+    *args: Any,
+    tracker: LatencyTracker,
+    budget: HedgeBudget,
+    min_delay: float = 0.0,
+    metric: str = "api.detail",
+) -> Any:
+    budget.record_request()
+    primary = executor.submit(fn, *args)
+
+    delay = tracker.threshold()
+    if delay is None:
+        return primary.result()
+
+    try:
+        return primary.result(timeout=max(delay, min_delay))
+    except TimeoutError:
+        pass
+
+    if not budget.acquire():
+        return primary.result()
+
+    metrics.incr(f"{metric}.hedges_fired")
+    hedge = executor.submit(fn, *args)
+    pending = {primary, hedge}
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                if future is hedge:
+                    budget.record_win()
+                    metrics.incr(f"{metric}.hedges_won")
+                return future.result()
+
+    return primary.result()
@@ -0,0 +1,135 @@
+import logging
+import threading
+import time
+import weakref
+from collections import Counter
+from typing import Any, Dict, Optional
+
+import structlog
+
+from config.settings import settings
+
+LOGGER_PREFIX = "animal_etl"
+
+_configure_lock = threading.Lock()
+_sampled_loggers: "weakref.WeakSet[SampledLogger]" = weakref.WeakSet()
+
+
+def configure_logging() -> None:
+    with _configure_lock:
+        if structlog.is_configured():
+            return
+
+        renderer = (
+            structlog.processors.JSONRenderer(default=str)
+            if settings.LOG_FORMAT == "json"
+            else structlog.processors.KeyValueRenderer(
+                key_order=["event"], drop_missing=True
+            )
+        )
+        structlog.configure(
+            processors=[
+                structlog.stdlib.filter_by_level,
+                structlog.stdlib.add_logger_name,
+                structlog.stdlib.add_log_level,
+                structlog.processors.format_exc_info,
+                renderer,
+            ],
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
+            cache_logger_on_first_use=True,
+        )
+        logging.getLogger(LOGGER_PREFIX).setLevel(settings.LOG_LEVEL)
+
+
+def get_logger(name: str) -> Any:
+    configure_logging()
+    return structlog.get_logger(f"{LOGGER_PREFIX}.{name}")
+
+
+def truncate(value: Any, limit: int = 200) -> str:
+    text = str(value)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... ({len(text)} chars)"
+
+
+class SampledLogger:
+    def __init__(
+        self,
+        logger: Any,
+        limit: Optional[int] = None,
+        window: Optional[float] = None,
+    ):
+        self.logger = logger
+        self.limit = settings.LOG_SAMPLE_LIMIT if limit is None else limit
+        self.window = (
+            settings.LOG_SAMPLE_WINDOW if window is None else window
+        )
+        self.counts: Counter = Counter()
+        self._windows: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        _sampled_loggers.add(self)
+
+    def warning(self, category: str, event: str, **fields: Any) -> None:
+        self._log(logging.WARNING, category, event, fields)
+
+    def error(self, category: str, event: str, **fields: Any) -> None:
+        self._log(logging.ERROR, category, event, fields)
+
+    def _log(
+        self, level: int, category: str, event: str, fields: Dict[str, Any]
+    ) -> None:
+        now = time.monotonic()
+        suppressed = 0
+
+        with self._lock:
+            self.counts[category] += 1
+            window = self._windows.setdefault(category, [now, 0, 0])
+            if now - window[0] >= self.window:
+                suppressed = window[2]
+                window[:] = [now, 0, 0]
+            if window[1] >= self.limit:
+                window[2] += 1
+                emit = False
+            else:
+                window[1] += 1
+                emit = True
+
+        if suppressed:
+            self.logger.log(
+                level,
+                "suppressed similar messages",
+                category=category,
+                suppressed=suppressed,
+            )
+        if emit:
+            self.logger.log(level, event, category=category, **fields)
+
+    def summary(
+        self, event: str = "sampled warnings summary", reset: bool = True
+    ) -> Dict[str, int]:
+        with self._lock:
+            counts = dict(self.counts)
+            suppressed = sum(
+                window[2] for window in self._windows.values()
+            )
+            if reset:
+                self.counts.clear()
+                self._windows.clear()
+
+        if counts:
+            self.logger.warning(
+                event,
+                counts=counts,
+                total=sum(counts.values()),
+                suppressed=suppressed,
+            )
+        return counts
+
+
+def summarize_sampled_warnings(reset: bool = True) -> Dict[str, int]:
+    totals: Counter = Counter()
+    for sampled_logger in list(_sampled_loggers):
+        totals.update(sampled_logger.summary(reset=reset))
+    return dict(totals)
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterator, Optional
+
+from utils.exceptions import ValidationException
+
+MANIFEST_KEYS = (
+    "manifest_path",
+    "checksum",
+    "total_batches",
+    "total_animals",
+)
+
+
+class ManifestWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.total_batches = 0
+        self.total_animals = 0
+        self._digest = hashlib.sha256()
+        self._file = None
+
+    def __enter__(self) -> "ManifestWriter":
+        self._file = open(self.path, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._file.close()
+
+    def add(
+        self, batch_file: str, count: int, **extra: Any
+    ) -> Dict[str, Any]:
+        entry = {
+            "batch_index": self.total_batches,
+            "file": batch_file,
+            "count": count,
+            **extra,
+        }
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        self._file.write(line)
+        self._digest.update(line.encode("utf-8"))
+        self.total_batches += 1
+        self.total_animals += count
+        return entry
+
+    def reference(self) -> Dict[str, Any]:
+        return {
+            "manifest_path": self.path,
+            "checksum": self._digest.hexdigest(),
+            "total_batches": self.total_batches,
+            "total_animals": self.total_animals,
+        }
+
+
+def file_checksum(path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def verify_manifest(reference: Dict[str, Any]) -> None:
+    path = reference["manifest_path"]
+    if not os.path.exists(path):
+        raise ValidationException(
+            f"Manifest file not found: {path}",
+            error_code="MANIFEST_NOT_FOUND",
+            details={"manifest_path": path},
+        )
+
+    checksum = file_checksum(path)
+    if checksum != reference["checksum"]:
+        raise ValidationException(
+            f"Manifest checksum mismatch for {path}",
+            error_code="MANIFEST_CHECKSUM_MISMATCH",
+            details={
+                "expected": reference["checksum"],
+                "actual": checksum,
+            },
+        )
+
+
+def iter_manifest(
+    reference: Dict[str, Any], verify: bool = True
+) -> Iterator[Dict[str, Any]]:
+    if verify:
+        verify_manifest(reference)
+
+    with open(reference["manifest_path"], "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def get_manifest_entry(
+    reference: Dict[str, Any], batch_index: int
+) -> Optional[Dict[str, Any]]:
+    if batch_index >= reference.get("total_batches", 0):
+        return None
+
+    for entry in iter_manifest(reference):
+        if entry["batch_index"] == batch_index:
+            return entry
+    return None
+
+
+def manifest_reference(result: Optional[Dict[str, Any]]) -> Optional[Dict]:
+    if not result or "manifest_path" not in result:
+        return None
+    return {key: result[key] for key in MANIFEST_KEYS}
@@ -0,0 +1,144 @@
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from config.settings import settings
+
+try:
+    from airflow.stats import Stats
+except ImportError:
+    Stats = None
+
+_tracer = None
+
+
+def _stat_name(name: str) -> str:
+    return f"{settings.METRICS_PREFIX}.{name}"
+
+
+def incr(name: str, count: int = 1) -> None:
+    if settings.METRICS_ENABLED and Stats is not None and count:
+        Stats.incr(_stat_name(name), count)
+
+
+def gauge(name: str, value: float) -> None:
+    if settings.METRICS_ENABLED and Stats is not None:
+        Stats.gauge(_stat_name(name), value)
+
+
+def timing(name: str, seconds: float) -> None:
+    if settings.METRICS_ENABLED and Stats is not None:
+        Stats.timing(_stat_name(name), seconds * 1000)
+
+
+def get_tracer():
+    global _tracer
+
+    if not settings.OTEL_TRACING_ENABLED:
+        return None
+
+    if _tracer is None:
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        except ImportError:
+            return None
+
+        provider = TracerProvider(
+            resource=Resource.create(
+                {"service.name": settings.OTEL_SERVICE_NAME}
+            )
+        )
+        provider.add_span_processor(
+            BatchSpanProcessor(
+                OTLPSpanExporter(
+                    endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT
+                )
+            )
+        )
+        _tracer = provider.get_tracer("animal_etl")
+
+    return _tracer
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Any]]:
+    tracer = get_tracer()
+    if tracer is None:
+        yield None
+        return
+
+    with tracer.start_as_current_span(
+        name,
+        attributes={k: v for k, v in attributes.items() if v is not None},
+    ) as current_span:
+        yield current_span
+
+
+@contextmanager
+def timed(name: str, **attributes: Any) -> Iterator[None]:
+    start = time.perf_counter()
+    with span(name, **attributes):
+        try:
+            yield
+        finally:
+            timing(name, time.perf_counter() - start)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+class StageStats:
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.records = 0
+        self.bytes_written = 0
+        self.batches = 0
+        self.duration = 0.0
+        self.peak_rss_mb = 0.0
+
+    @property
+    def records_per_sec(self) -> float:
+        if self.duration <= 0:
+            return 0.0
+        return self.records / self.duration
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "records": self.records,
+            "batches": self.batches,
+            "bytes_written": self.bytes_written,
+            "duration_seconds": round(self.duration, 3),
+            "records_per_sec": round(self.records_per_sec, 2),
+            "peak_rss_mb": round(self.peak_rss_mb, 1),
+        }
+
+
+@contextmanager
+def stage(name: str, **attributes: Any) -> Iterator[StageStats]:
+    stats = StageStats(name)
+    start = time.perf_counter()
+    with span(f"stage.{name}", **attributes) as current_span:
+        try:
+            yield stats
+        finally:
+            stats.duration = time.perf_counter() - start
+            stats.peak_rss_mb = peak_rss_mb()
+            timing(f"stage.{name}.duration", stats.duration)
+            incr(f"stage.{name}.records", stats.records)
+            incr(f"stage.{name}.bytes_written", stats.bytes_written)
+            gauge(f"stage.{name}.records_per_sec", stats.records_per_sec)
+            gauge(f"stage.{name}.peak_rss_mb", stats.peak_rss_mb)
+            if current_span is not None:
+                for key, value in stats.as_dict().items():
+                    current_span.set_attribute(f"stage.{key}", value)
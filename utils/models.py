@@ -2,30 +2,152 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 
 from dateutil import parser as date_parser
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
+
+from utils.exceptions import FieldValidationException
+from utils.log import SampledLogger, get_logger, truncate
+
+logger = get_logger("models")
+sampled_logger = SampledLogger(logger)
+
+
+def normalize_born_at(v: Any) -> Optional[str]:
+    if v is None:
+        return None
+    if isinstance(v, (int, float)):
+        try:
+            timestamp = v
+            if timestamp > 1e10:
+                timestamp = timestamp / 1000
+            dt = datetime.fromtimestamp(timestamp)
+            return dt.isoformat()
+        except (ValueError, OSError) as e:
+            sampled_logger.warning(
+                "born_at_timestamp",
+                "Could not convert timestamp",
+                value=v,
+                error=str(e),
+            )
+            return None
+    return str(v) if v is not None else None
+
+
+def normalize_friends(v: Any) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, list):
+        return ",".join(str(item) for item in v if item is not None)
+    return str(v) if v is not None else ""
+
+
+def parse_friends(v: Union[str, List[str], None]) -> List[str]:
+    try:
+        if v is None or v == "":
+            return []
+        if isinstance(v, str):
+            if v.strip() == "":
+                return []
+            friends = [
+                friend.strip() for friend in v.split(",") if friend.strip()
+            ]
+            return friends
+        if isinstance(v, list):
+            return [
+                str(item).strip()
+                for item in v
+                if item is not None and str(item).strip()
+            ]
+        return [str(v).strip()] if str(v).strip() else []
+    except Exception as e:
+        sampled_logger.warning(
+            "friends_parse",
+            "Error parsing friends",
+            value=truncate(v),
+            error=str(e),
+        )
+        return []
+
+
+def parse_born_at(
+    v: Optional[Union[str, int, float]]
+) -> Optional[datetime]:
+    if v is None:
+        return None
+
+    try:
+        if isinstance(v, (int, float)):
+            timestamp = v
+            if timestamp == 0:
+                return None
+            if timestamp > 1e10:
+                timestamp = timestamp / 1000
+            if timestamp > 2147483647:
+                sampled_logger.warning(
+                    "born_at_range",
+                    "Timestamp seems too large, skipping",
+                    value=v,
+                )
+                return None
+            return datetime.fromtimestamp(
+                timestamp, tz=timezone.utc
+            ).replace(tzinfo=None)
+
+        if isinstance(v, str):
+            v_stripped = v.strip()
+            if not v_stripped or v_stripped.lower() in [
+                "null",
+                "none",
+                "",
+            ]:
+                return None
+
+            try:
+                parsed_date = date_parser.parse(v_stripped)
+
+                if parsed_date.tzinfo is None:
+                    return parsed_date
+                else:
+                    utc_date = parsed_date.astimezone(timezone.utc)
+                    return utc_date.replace(tzinfo=None)
+
+            except (ValueError, TypeError) as e:
+                sampled_logger.warning(
+                    "born_at_parse",
+                    "Could not parse date string",
+                    value=truncate(v),
+                    error=str(e),
+                )
+                return None
+
+        return None
+
+    except (ValueError, TypeError, OSError) as e:
+        sampled_logger.warning(
+            "born_at_parse",
+            "Could not parse born_at value",
+            value=truncate(v),
+            value_type=type(v).__name__,
+            error=str(e),
+        )
+        return None
+
+
+def validate_name(v: Any) -> str:
+    if not v or not str(v).strip():
+        raise FieldValidationException("name", "Name cannot be empty")
+    return str(v).strip()
 
 
 class AnimalListItem(BaseModel):
     id: int
     name: str
     species: Optional[str] = "Unknown"
+    friends: Optional[Union[str, List[str]]] = None
     born_at: Optional[Union[str, int, float]] = None
 
     @validator("born_at", pre=True)
     def normalize_born_at(cls, v):
-        if v is None:
-            return None
-        if isinstance(v, (int, float)):
-            try:
-                timestamp = v
-                if timestamp > 1e10:
-                    timestamp = timestamp / 1000
-                dt = datetime.fromtimestamp(timestamp)
-                return dt.isoformat()
-            except (ValueError, OSError) as e:
-                print(f"Warning: Could not convert timestamp {v}: {e}")
-                return None
-        return str(v) if v is not None else None
+        return normalize_born_at(v)
 
 
 class AnimalDetail(BaseModel):
@@ -40,27 +162,11 @@ class AnimalDetail(BaseModel):
 
     @validator("born_at", pre=True)
     def normalize_born_at(cls, v):
-        if v is None:
-            return None
-        if isinstance(v, (int, float)):
-            try:
-                timestamp = v
-                if timestamp > 1e10:
-                    timestamp = timestamp / 1000
-                dt = datetime.fromtimestamp(timestamp)
-                return dt.isoformat()
-            except (ValueError, OSError) as e:
-                print(f"Warning: Could not convert timestamp {v}: {e}")
-                return None
-        return str(v) if v is not None else None
+        return normalize_born_at(v)
 
     @validator("friends", pre=True)
     def normalize_friends(cls, v):
-        if v is None:
-            return ""
-        if isinstance(v, list):
-            return ",".join(str(item) for item in v if item is not None)
-        return str(v) if v is not None else ""
+        return normalize_friends(v)
 
 
 class TransformedAnimal(BaseModel):
@@ -75,89 +181,17 @@ class TransformedAnimal(BaseModel):
 
     @validator("friends", pre=True, always=True)
     def parse_friends(cls, v: Union[str, List[str], None]) -> List[str]:
-        try:
-            if v is None or v == "":
-                return []
-            if isinstance(v, str):
-                if v.strip() == "":
-                    return []
-                friends = [
-                    friend.strip()
-                    for friend in v.split(",")
-                    if friend.strip()
-                ]
-                return friends
-            if isinstance(v, list):
-                return [
-                    str(item).strip()
-                    for item in v
-                    if item is not None and str(item).strip()
-                ]
-            return [str(v).strip()] if str(v).strip() else []
-        except Exception as e:
-            print(f"Warning: Error parsing friends '{v}': {e}")
-            return []
+        return parse_friends(v)
 
     @validator("born_at", pre=True)
     def parse_born_at(
         cls, v: Optional[Union[str, int, float]]
     ) -> Optional[datetime]:
-        if v is None:
-            return None
-
-        try:
-            if isinstance(v, (int, float)):
-                timestamp = v
-                if timestamp == 0:
-                    return None
-                if timestamp > 1e10:
-                    timestamp = timestamp / 1000
-                if timestamp > 2147483647:
-                    print(
-                        f"Warning: Timestamp {v} seems too large, skipping"
-                    )
-                    return None
-                return datetime.fromtimestamp(
-                    timestamp, tz=timezone.utc
-                ).replace(tzinfo=None)
-
-            if isinstance(v, str):
-                v_stripped = v.strip()
-                if not v_stripped or v_stripped.lower() in [
-                    "null",
-                    "none",
-                    "",
-                ]:
-                    return None
-
-                try:
-                    parsed_date = date_parser.parse(v_stripped)
-
-                    if parsed_date.tzinfo is None:
-                        return parsed_date
-                    else:
-                        utc_date = parsed_date.astimezone(timezone.utc)
-                        return utc_date.replace(tzinfo=None)
-
-                except (ValueError, TypeError) as e:
-                    print(
-                        f"Warning: Could not parse date string '{v}': {e}"
-                    )
-                    return None
-
-            return None
-
-        except (ValueError, TypeError, OSError) as e:
-            print(
-                f"Warning: Could not parse born_at value '{v}' (type: {type(v)}): {e}"
-            )
-            return None
+        return parse_born_at(v)
 
     @validator("name")
     def validate_name(cls, v):
-        if not v or not str(v).strip():
-            raise ValueError("Name cannot be empty")
-        return str(v).strip()
+        return validate_name(v)
 
     @validator("id")
     def validate_id(cls, v):
@@ -171,6 +205,7 @@ class PaginatedResponse(BaseModel):
     page: int
     total_pages: int
     has_next: bool = False
+    _failed_items: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
 
     def __init__(self, **data):
         raw_items = data.get("items", [])
@@ -186,14 +221,23 @@ class PaginatedResponse(BaseModel):
                 failed_items.append(
                     {"index": i, "item": item, "error": str(e)}
                 )
-                print(
-                    f"Warning: Failed to parse item {i}: {item}. Error: {e}"
+                sampled_logger.warning(
+                    "list_item_parse",
+                    "Failed to parse list item",
+                    index=i,
+                    animal_id=(
+                        item.get("id") if isinstance(item, dict) else None
+                    ),
+                    error=truncate(e),
                 )
                 continue
 
         if failed_items:
-            print(
-                f"⚠️  Failed to parse {len(failed_items)} items out of {len(raw_items)}"
+            logger.warning(
+                "Failed to parse list items",
+                page=data.get("page", 1),
+                failed=len(failed_items),
+                total=len(raw_items),
             )
 
         super().__init__(
@@ -202,3 +246,8 @@ class PaginatedResponse(BaseModel):
             total_pages=data.get("total_pages", 1),
             has_next=data.get("page", 1) < data.get("total_pages", 1),
         )
+        self._failed_items = failed_items
+
+    @property
+    def failed_items(self) -> List[Dict[str, Any]]:
+        return self._failed_items
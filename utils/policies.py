@@ -0,0 +1,159 @@
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential,
+    wait_random,
+)
+
+from config.settings import settings
+from utils import metrics
+
+RETRYABLE_STATUS_CODES = [429, 500, 502, 503, 504]
+
+
+class EndpointPolicy(BaseModel):
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 10.0
+    max_attempts: int = 3
+    backoff_initial: float = 1.0
+    backoff_max: float = 30.0
+    jitter: float = 1.0
+    retryable_status_codes: List[int] = Field(
+        default_factory=lambda: list(RETRYABLE_STATUS_CODES)
+    )
+    deadline: Optional[float] = None
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def is_retryable(self, error: BaseException) -> bool:
+        status_code = status_code_of(error)
+        if status_code is not None:
+            return status_code in self.retryable_status_codes
+        return isinstance(error.__cause__ or error, httpx.TransportError)
+
+    def _retry_options(self, endpoint: str) -> Dict[str, Any]:
+        stop = stop_after_attempt(max(1, self.max_attempts))
+        if self.deadline is not None:
+            stop = stop | stop_after_delay(self.deadline)
+
+        return {
+            "stop": stop,
+            "wait": wait_exponential(
+                multiplier=self.backoff_initial, max=self.backoff_max
+            )
+            + wait_random(0, self.jitter),
+            "retry": retry_if_exception(self.is_retryable),
+            "before_sleep": _count_retry(endpoint),
+            "reraise": True,
+        }
+
+    def retrying(self, endpoint: str) -> Retrying:
+        return Retrying(**self._retry_options(endpoint))
+
+    def async_retrying(self, endpoint: str) -> AsyncRetrying:
+        return AsyncRetrying(**self._retry_options(endpoint))
+
+
+def status_code_of(error: BaseException) -> Optional[int]:
+    details = getattr(error, "details", None) or {}
+    if details.get("status_code") is not None:
+        return details["status_code"]
+    cause = error.__cause__
+    if isinstance(cause, httpx.HTTPStatusError):
+        return cause.response.status_code
+    return None
+
+
+def _count_retry(endpoint: str):
+    def before_sleep(retry_state) -> None:
+        metrics.incr(f"api.{endpoint}.retries")
+
+    return before_sleep
+
+
+def default_policies() -> Dict[str, EndpointPolicy]:
+    base = {
+        "max_attempts": settings.MAX_RETRIES,
+        "backoff_initial": settings.RETRY_DELAY,
+    }
+    return {
+        "list": EndpointPolicy(
+            **base, read_timeout=10.0, backoff_max=10.0, deadline=60.0
+        ),
+        "detail": EndpointPolicy(
+            **base, read_timeout=10.0, backoff_max=5.0, deadline=30.0
+        ),
+        "bulk_detail": EndpointPolicy(
+            **base,
+            read_timeout=float(settings.ANIMALS_API_TIMEOUT),
+            deadline=120.0,
+        ),
+        "home": EndpointPolicy(
+            **base,
+            read_timeout=float(settings.ANIMALS_API_TIMEOUT),
+            write_timeout=float(settings.ANIMALS_API_TIMEOUT),
+            deadline=180.0,
+        ),
+        "health": EndpointPolicy(
+            connect_timeout=2.0, read_timeout=5.0, max_attempts=1
+        ),
+    }
+
+
+def build_policies(
+    *overrides: Optional[Dict[str, Dict[str, Any]]],
+) -> Dict[str, EndpointPolicy]:
+    policies = default_policies()
+    for override in overrides:
+        for endpoint, values in (override or {}).items():
+            base = policies.get(endpoint, EndpointPolicy())
+            policies[endpoint] = EndpointPolicy(
+                **{**base.dict(), **values}
+            )
+    return policies
+
+
+def with_policy(endpoint: str) -> Callable:
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            deadline = getattr(self, "deadline", None)
+            if deadline is not None:
+                deadline.check(endpoint)
+            retrying = self.policy(endpoint).retrying(endpoint)
+            return retrying(func, self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def with_async_policy(endpoint: str) -> Callable:
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            deadline = getattr(self, "deadline", None)
+            if deadline is not None:
+                deadline.check(endpoint)
+            retrying = self.policy(endpoint).async_retrying(endpoint)
+            return await retrying(func, self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
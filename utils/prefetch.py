@@ -0,0 +1,125 @@
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_DONE = object()
+
+
+class Prefetcher:
+    def __init__(
+        self,
+        iterable: Iterable[Any],
+        depth: int = 2,
+        name: str = "prefetch",
+    ):
+        self.depth = max(1, depth)
+        self.produced = 0
+        self.consumed = 0
+        self.producer_wait = 0.0
+        self.consumer_wait = 0.0
+        self._iterable = iterable
+        self._queue: queue.Queue = queue.Queue(maxsize=self.depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._produce, name=name, daemon=True
+        )
+        self._started = False
+
+    def _put(self, item: Tuple[Any, Optional[BaseException]]) -> bool:
+        started = time.perf_counter()
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            self.producer_wait += time.perf_counter() - started
+            return True
+        return False
+
+    def _produce(self) -> None:
+        try:
+            for item in self._iterable:
+                if not self._put((item, None)):
+                    return
+                self.produced += 1
+        except BaseException as e:
+            self._put((_DONE, e))
+            return
+        finally:
+            self._close_iterable()
+        self._put((_DONE, None))
+
+    def _close_iterable(self) -> None:
+        close = getattr(self._iterable, "close", None)
+        if close is not None:
+            close()
+
+    def start(self) -> "Prefetcher":
+        if not self._started:
+            self._started = True
+            self._thread.start()
+        return self
+
+    def __iter__(self) -> Iterator[Any]:
+        self.start()
+        while True:
+            started = time.perf_counter()
+            if self._stop.is_set():
+                try:
+                    item, error = self._queue.get_nowait()
+                except queue.Empty:
+                    return
+            else:
+                item, error = self._queue.get()
+            self.consumer_wait += time.perf_counter() - started
+            if item is _DONE:
+                self._stop.set()
+                if error is not None:
+                    raise error
+                return
+            self.consumed += 1
+            yield item
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def close(self) -> None:
+        self.stop()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._started:
+            self._thread.join(timeout=5)
+        else:
+            self._close_iterable()
+
+    def __enter__(self) -> "Prefetcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "produced": self.produced,
+            "consumed": self.consumed,
+            "producer_wait_seconds": round(self.producer_wait, 3),
+            "consumer_wait_seconds": round(self.consumer_wait, 3),
+        }
+
+
+def batched(
+    rows: Iterable[Any], batch_size: int
+) -> Iterator[Tuple[None, List[Any]]]:
+    batch: List[Any] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield None, batch
+            batch = []
+    if batch:
+        yield None, batch
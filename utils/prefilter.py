@@ -0,0 +1,74 @@
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from utils.exceptions import ValidationException
+from utils.models import parse_born_at
+
+
+def _valid_id(item: Dict[str, Any]) -> Optional[str]:
+    animal_id = item.get("id")
+    if not isinstance(animal_id, int) or animal_id < 0:
+        return f"Invalid ID: {animal_id!r}"
+    return None
+
+
+def _non_empty_name(item: Dict[str, Any]) -> Optional[str]:
+    name = item.get("name")
+    if not isinstance(name, str) or not name.strip():
+        return "Name cannot be empty"
+    return None
+
+
+def _parseable_born_at(item: Dict[str, Any]) -> Optional[str]:
+    born_at = item.get("born_at")
+    if born_at is None:
+        return None
+    if isinstance(born_at, str) and born_at.strip().lower() in (
+        "",
+        "null",
+        "none",
+    ):
+        return None
+    if parse_born_at(born_at) is None:
+        return f"Unparseable born_at: {born_at!r}"
+    return None
+
+
+RULES: Dict[str, Callable[[Dict[str, Any]], Optional[str]]] = {
+    "valid_id": _valid_id,
+    "non_empty_name": _non_empty_name,
+    "parseable_born_at": _parseable_born_at,
+}
+
+
+class PreFilter:
+    def __init__(self, rule_names: Iterable[str]):
+        unknown = [name for name in rule_names if name not in RULES]
+        if unknown:
+            raise ValidationException(
+                f"Unknown pre-filter rules: {unknown}",
+                error_code="UNKNOWN_PREFILTER_RULE",
+                details={"available": sorted(RULES)},
+            )
+        self.rules = [(name, RULES[name]) for name in rule_names]
+        self.counts: Counter = Counter()
+        self.passed = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def check(self, item: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        for name, rule in self.rules:
+            error = rule(item)
+            if error is not None:
+                self.counts[name] += 1
+                return name, error
+        self.passed += 1
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "passed": self.passed,
+            "rejected": sum(self.counts.values()),
+            "rules": {name: self.counts[name] for name, _ in self.rules},
+        }
@@ -0,0 +1,123 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import tempfile
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from config.settings import settings
+
+logger = logging.getLogger("animal_etl.profiling")
+
+
+def profiling_requested(context: Dict[str, Any], default: bool) -> bool:
+    dag_run = context.get("dag_run")
+    conf = getattr(dag_run, "conf", None) or {}
+    return bool(conf.get("profile", default))
+
+
+def task_log_dir(context: Dict[str, Any]) -> str:
+    ti = context.get("task_instance") or context.get("ti")
+    try:
+        from airflow.configuration import conf
+
+        base_dir = conf.get("logging", "base_log_folder")
+        parts = [
+            f"dag_id={ti.dag_id}",
+            f"run_id={ti.run_id}",
+            f"task_id={ti.task_id}",
+        ]
+        if getattr(ti, "map_index", -1) >= 0:
+            parts.append(f"map_index={ti.map_index}")
+        return os.path.join(base_dir, *parts)
+    except Exception:
+        return os.path.join(tempfile.gettempdir(), "animal_etl_profiles")
+
+
+def _profile_prefix(context: Dict[str, Any], label: str) -> str:
+    ti = context.get("task_instance") or context.get("ti")
+    try_number = getattr(ti, "try_number", None)
+    if isinstance(try_number, int):
+        return f"attempt={try_number}.{label}"
+    return label
+
+
+def format_hotspots(profiler: cProfile.Profile, top_n: int) -> str:
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top_n)
+    return stream.getvalue()
+
+
+def format_allocations(
+    snapshot: tracemalloc.Snapshot, top_n: int, peak: int
+) -> str:
+    lines = [f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB"]
+    for index, stat in enumerate(snapshot.statistics("lineno")[:top_n]):
+        frame = stat.traceback[0]
+        lines.append(
+            f"#{index + 1} {frame.filename}:{frame.lineno} "
+            f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+        )
+    return "\n".join(lines)
+
+
+@contextmanager
+def profile_task(
+    context: Dict[str, Any],
+    label: str,
+    enabled: Optional[bool] = None,
+    top_n: Optional[int] = None,
+    output_dir: Optional[str] = None,
+    log: Optional[logging.Logger] = None,
+) -> Iterator[Optional[Dict[str, str]]]:
+    if enabled is None:
+        enabled = settings.PROFILE_TASKS
+    if not profiling_requested(context, enabled):
+        yield None
+        return
+
+    top_n = top_n or settings.PROFILE_TOP_N
+    output_dir = output_dir or task_log_dir(context)
+    os.makedirs(output_dir, exist_ok=True)
+    prefix = os.path.join(output_dir, _profile_prefix(context, label))
+    artifacts = {
+        "cprofile": f"{prefix}.prof",
+        "tracemalloc": f"{prefix}.tracemalloc",
+        "summary": f"{prefix}.profile.txt",
+    }
+
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start(settings.PROFILE_TRACEMALLOC_FRAMES)
+    tracemalloc.reset_peak()
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        yield artifacts
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if not already_tracing:
+            tracemalloc.stop()
+
+        profiler.dump_stats(artifacts["cprofile"])
+        snapshot.dump(artifacts["tracemalloc"])
+
+        summary = (
+            f"Top {top_n} hotspots (cumulative time)\n"
+            f"{format_hotspots(profiler, top_n)}\n"
+            f"Top {top_n} allocations\n"
+            f"{format_allocations(snapshot, top_n, peak)}\n"
+        )
+        with open(artifacts["summary"], "w", encoding="utf-8") as f:
+            f.write(summary)
+
+        (log or logger).info(
+            f"Profile for {label} written to {output_dir}\n{summary}"
+        )
@@ -0,0 +1,78 @@
+from typing import Any, Dict, Iterable, List, Sequence, Set
+
+from utils.log import SampledLogger, get_logger, truncate
+from utils.records import AnimalRecord
+
+logger = get_logger("projection")
+sampled_logger = SampledLogger(logger)
+
+OUTPUT_FIELDS = ("id", "name", "friends", "born_at")
+NULLABLE_LIST_FIELDS = ("born_at",)
+
+
+def supplied_fields(item: Dict[str, Any]) -> Set[str]:
+    return {
+        field
+        for field, value in item.items()
+        if value is not None or field in NULLABLE_LIST_FIELDS
+    }
+
+
+def missing_fields(
+    item: Dict[str, Any],
+    output_fields: Sequence[str] = OUTPUT_FIELDS,
+    optional_fields: Iterable[str] = (),
+) -> Set[str]:
+    return (
+        set(output_fields) - supplied_fields(item) - set(optional_fields)
+    )
+
+
+class DetailFetchPlan:
+    def __init__(self, animal_ids: List[int]):
+        self.animal_ids = animal_ids
+        self.ready: Dict[int, AnimalRecord] = {}
+        self.fetch_ids: List[int] = []
+
+    @property
+    def requests_avoided(self) -> int:
+        return len(self.ready)
+
+    def merge(self, fetched: List[AnimalRecord]) -> List[AnimalRecord]:
+        if not self.ready:
+            return fetched
+
+        details = dict(self.ready)
+        details.update((detail.id, detail) for detail in fetched)
+        return [
+            details[animal_id]
+            for animal_id in self.animal_ids
+            if animal_id in details
+        ]
+
+
+def plan_detail_fetches(
+    items: List[Dict[str, Any]],
+    optional_fields: Iterable[str] = (),
+    output_fields: Sequence[str] = OUTPUT_FIELDS,
+) -> DetailFetchPlan:
+    optional_fields = set(optional_fields)
+    plan = DetailFetchPlan([item["id"] for item in items])
+
+    for item in items:
+        if missing_fields(item, output_fields, optional_fields):
+            plan.fetch_ids.append(item["id"])
+            continue
+
+        try:
+            plan.ready[item["id"]] = AnimalRecord.from_payload(item)
+        except Exception as e:
+            sampled_logger.warning(
+                "projection_list_item",
+                "List item cannot stand in for detail",
+                animal_id=item["id"],
+                error=truncate(e),
+            )
+            plan.fetch_ids.append(item["id"])
+
+    return plan
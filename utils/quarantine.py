@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional
+
+from config.settings import settings
+from utils.records import RECORD_FIELDS, AnimalRecord
+
+
+def quarantine_dir() -> str:
+    return settings.QUARANTINE_DIR or os.path.join(
+        tempfile.gettempdir(), "animal_etl_quarantine"
+    )
+
+
+def quarantine_path(run_id: str) -> str:
+    return os.path.join(quarantine_dir(), f"quarantine_{run_id}.jsonl")
+
+
+class QuarantineWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.counts: Counter = Counter()
+        self._file = None
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def write(
+        self,
+        stage: str,
+        category: str,
+        animal_id: Any,
+        payload: Any,
+        error: Optional[str] = None,
+    ) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        record = {
+            "stage": stage,
+            "category": category,
+            "id": animal_id,
+            "error": error,
+            "payload": payload,
+        }
+        self._file.write(
+            json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        )
+        self.counts[f"{stage}.{category}"] += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "QuarantineWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "quarantine_file": self.path if self.total else None,
+            "quarantined": self.total,
+            "quarantine_counts": dict(self.counts),
+        }
+
+
+def iter_quarantine(path: str) -> Iterator[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def quarantine_transform_failures(
+    quarantine: QuarantineWriter,
+    records: List[AnimalRecord],
+    animals: List[Dict[str, Any]],
+) -> None:
+    from utils.transformers import failure_reason, transform_record
+
+    if len(animals) == len(records):
+        return
+
+    transformed_ids = {animal["id"] for animal in animals}
+    for record in records:
+        if record.id in transformed_ids:
+            continue
+        try:
+            transform_record(record)
+            category, error = "unknown", None
+        except ValueError as e:
+            category, error = failure_reason(e), str(e)
+        quarantine.write(
+            "transform",
+            category,
+            record.id,
+            dict(zip(RECORD_FIELDS, record.as_tuple())),
+            error,
+        )
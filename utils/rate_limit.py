@@ -0,0 +1,97 @@
+import math
+import time
+from typing import Any, Optional
+
+from config.settings import settings
+from utils import metrics
+from utils.log import SampledLogger, get_logger, truncate
+
+sampled_logger = SampledLogger(get_logger("rate_limit"))
+
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', math.max(now, ts))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 60)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket:
+    def __init__(self, client: Any, key: str, rate: float, burst: int):
+        self.key = key
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.waited = 0.0
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def reserve(self) -> float:
+        try:
+            return float(
+                self._script(keys=[self.key], args=[self.rate, self.burst])
+            )
+        except Exception as e:
+            sampled_logger.warning(
+                "rate_limit_unavailable",
+                "Shared rate limit unavailable, not throttling",
+                key=self.key,
+                error=truncate(e),
+            )
+            return 0.0
+
+    def acquire(self) -> float:
+        waited = 0.0
+        while True:
+            wait = self.reserve()
+            if wait <= 0:
+                break
+            time.sleep(wait)
+            waited += wait
+        self._record(waited)
+        return waited
+
+    async def aacquire(self) -> float:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        waited = 0.0
+        while True:
+            wait = await loop.run_in_executor(None, self.reserve)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+            waited += wait
+        self._record(waited)
+        return waited
+
+    def _record(self, waited: float) -> None:
+        if waited:
+            self.waited += waited
+            metrics.incr("api.rate_limit.throttled")
+
+
+def shared_rate_limiter(conn_id: str) -> Optional[RedisTokenBucket]:
+    if settings.SHARED_RATE_LIMIT <= 0:
+        return None
+
+    from utils.redis_client import get_redis
+
+    return RedisTokenBucket(
+        get_redis(),
+        f"animal_etl:ratelimit:{conn_id}",
+        settings.SHARED_RATE_LIMIT,
+        settings.SHARED_RATE_LIMIT_BURST
+        or math.ceil(settings.SHARED_RATE_LIMIT),
+    )
@@ -0,0 +1,57 @@
+from typing import Any, Dict, Tuple
+
+from utils.models import normalize_born_at, normalize_friends
+
+RECORD_FIELDS = ("id", "name", "friends", "born_at")
+
+
+def _coerce_id(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid id: {value!r}")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    raise ValueError(f"Invalid id: {value!r}")
+
+
+class AnimalRecord:
+    __slots__ = RECORD_FIELDS
+
+    def __init__(
+        self, id: int, name: str, friends: Any = "", born_at: Any = None
+    ):
+        self.id = id
+        self.name = name
+        self.friends = friends
+        self.born_at = born_at
+
+    @classmethod
+    def from_payload(cls, data: Dict[str, Any]) -> "AnimalRecord":
+        if "id" not in data or "name" not in data:
+            raise ValueError("Animal payload requires id and name")
+        name = data["name"]
+        if not isinstance(name, str):
+            raise ValueError(f"Invalid name: {name!r}")
+        return cls(
+            _coerce_id(data["id"]),
+            name,
+            normalize_friends(data.get("friends")),
+            normalize_born_at(data.get("born_at")),
+        )
+
+    def as_tuple(self) -> Tuple:
+        return (self.id, self.name, self.friends, self.born_at)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, AnimalRecord):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def __repr__(self) -> str:
+        return (
+            f"AnimalRecord(id={self.id!r}, name={self.name!r}, "
+            f"friends={self.friends!r}, born_at={self.born_at!r})"
+        )
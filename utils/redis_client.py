@@ -0,0 +1,22 @@
+from typing import Any, Dict, Optional
+
+from config.settings import settings
+from utils.exceptions import AnimalETLException
+
+_clients: Dict[str, Any] = {}
+
+
+def get_redis(url: Optional[str] = None) -> Any:
+    url = url or settings.REDIS_URL
+    client = _clients.get(url)
+    if client is None:
+        try:
+            import redis
+        except ImportError as e:
+            raise AnimalETLException(
+                "The redis package is required for Redis-backed features",
+                error_code="REDIS_NOT_INSTALLED",
+            ) from e
+        client = redis.Redis.from_url(url)
+        _clients[url] = client
+    return client
@@ -0,0 +1,165 @@
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS animals (
+        run_id TEXT NOT NULL,
+        id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        friends TEXT NOT NULL,
+        born_at TEXT,
+        PRIMARY KEY (run_id, id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_animals_id ON animals (id, run_id)",
+    """
+    CREATE TABLE IF NOT EXISTS baselines (
+        name TEXT PRIMARY KEY,
+        run_id TEXT NOT NULL
+    )
+    """,
+)
+
+INSERT_SQL = (
+    "INSERT OR REPLACE INTO animals (run_id, id, name, friends, born_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+COLUMNS = ("id", "name", "friends", "born_at")
+MAX_SQL_VARIABLES = 500
+
+
+def _to_animal(row: tuple) -> Dict[str, Any]:
+    animal_id, name, friends, born_at = row
+    return {
+        "id": animal_id,
+        "name": name,
+        "friends": json.loads(friends),
+        "born_at": born_at,
+    }
+
+
+class ResultStore:
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                for statement in SCHEMA:
+                    self._conn.execute(statement)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "ResultStore":
+        self.conn
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def write(self, run_id: str, animals: Iterable[Dict[str, Any]]) -> int:
+        rows = [
+            (
+                run_id,
+                animal["id"],
+                animal["name"],
+                json.dumps(animal["friends"], ensure_ascii=False),
+                animal["born_at"],
+            )
+            for animal in animals
+        ]
+        with self.conn:
+            self.conn.executemany(INSERT_SQL, rows)
+        return len(rows)
+
+    def get(self, run_id: str, animal_id: int) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM animals "
+            "WHERE run_id = ? AND id = ?",
+            (run_id, animal_id),
+        ).fetchone()
+        return _to_animal(row) if row else None
+
+    def get_many(
+        self, run_id: str, animal_ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        found = {}
+        for i in range(0, len(animal_ids), MAX_SQL_VARIABLES):
+            chunk = animal_ids[i : i + MAX_SQL_VARIABLES]
+            cursor = self.conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM animals "
+                f"WHERE run_id = ? AND id IN ({', '.join('?' * len(chunk))})",
+                (run_id, *chunk),
+            )
+            found.update((row[0], _to_animal(row)) for row in cursor)
+        return found
+
+    def missing_from(self, previous_run_id: str, run_id: str) -> List[int]:
+        cursor = self.conn.execute(
+            "SELECT p.id FROM animals p WHERE p.run_id = ? AND NOT EXISTS "
+            "(SELECT 1 FROM animals c WHERE c.run_id = ? AND c.id = p.id) "
+            "ORDER BY p.id",
+            (previous_run_id, run_id),
+        )
+        return [row[0] for row in cursor]
+
+    def history(self, animal_id: int) -> Dict[str, Dict[str, Any]]:
+        cursor = self.conn.execute(
+            f"SELECT run_id, {', '.join(COLUMNS)} FROM animals "
+            "WHERE id = ? ORDER BY run_id",
+            (animal_id,),
+        )
+        return {row[0]: _to_animal(row[1:]) for row in cursor}
+
+    def iter_run(
+        self, run_id: str, batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM animals "
+            "WHERE run_id = ? ORDER BY id",
+            (run_id,),
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield _to_animal(row)
+
+    def runs(self) -> Dict[str, int]:
+        cursor = self.conn.execute(
+            "SELECT run_id, COUNT(*) FROM animals GROUP BY run_id "
+            "ORDER BY run_id"
+        )
+        return dict(cursor)
+
+    def baseline(self, name: str = "load") -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT run_id FROM baselines WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_baseline(self, run_id: str, name: str = "load") -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO baselines (name, run_id) "
+                "VALUES (?, ?)",
+                (name, run_id),
+            )
+
+    def delete_run(self, run_id: str) -> int:
+        with self.conn:
+            return self.conn.execute(
+                "DELETE FROM animals WHERE run_id = ?", (run_id,)
+            ).rowcount
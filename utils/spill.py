@@ -0,0 +1,100 @@
+import json
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from config.settings import settings
+
+ROW_FIELDS = ("id", "name", "friends", "born_at")
+
+
+def to_row(item: Dict[str, Any]) -> Tuple:
+    fields = ROW_FIELDS if "born_at" in item else ROW_FIELDS[:-1]
+    return tuple(item.get(field) for field in fields)
+
+
+def from_row(row: Sequence[Any]) -> Dict[str, Any]:
+    return dict(zip(ROW_FIELDS, row))
+
+
+def memory_budget_bytes() -> int:
+    return settings.MEMORY_BUDGET_MB * 1024 * 1024
+
+
+class SpillWriter:
+    def __init__(self, path: str, budget_bytes: Optional[int] = None):
+        self.path = path
+        self.budget_bytes = (
+            budget_bytes
+            if budget_bytes is not None
+            else memory_budget_bytes()
+        )
+        self.count = 0
+        self.spills = 0
+        self.bytes_written = 0
+        self._buffer: List[str] = []
+        self._buffered_bytes = 0
+        self._file = None
+
+    def __enter__(self) -> "SpillWriter":
+        self._file = open(self.path, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.spill()
+        self._file.close()
+
+    def append(self, row: Sequence[Any]) -> None:
+        line = json.dumps(row, ensure_ascii=False, separators=(",", ":"))
+        self._buffer.append(line)
+        self._buffered_bytes += len(line) + 1
+        self.count += 1
+        if self._buffered_bytes >= self.budget_bytes:
+            self.spill()
+
+    def spill(self) -> None:
+        if not self._buffer:
+            return
+        self._file.write("\n".join(self._buffer) + "\n")
+        self.bytes_written += self._buffered_bytes
+        self.spills += 1
+        self._buffer = []
+        self._buffered_bytes = 0
+
+
+def iter_rows(path: str, offset: int = 0) -> Iterator[Tuple]:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in iter(f.readline, b""):
+            if line.strip():
+                yield tuple(json.loads(line))
+
+
+def iter_row_batches(
+    path: str, batch_size: int
+) -> Iterator[Tuple[int, List[Tuple]]]:
+    with open(path, "rb") as f:
+        batch: List[Tuple] = []
+        offset = 0
+        while True:
+            position = f.tell()
+            line = f.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            if not batch:
+                offset = position
+            batch.append(tuple(json.loads(line)))
+            if len(batch) == batch_size:
+                yield offset, batch
+                batch = []
+        if batch:
+            yield offset, batch
+
+
+def read_row_batch(path: str, offset: int, batch_size: int) -> List[Tuple]:
+    rows = []
+    for row in iter_rows(path, offset):
+        rows.append(row)
+        if len(rows) == batch_size:
+            break
+    return rows
@@ -1,7 +1,65 @@
-from typing import Any, Dict, List
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from utils.exceptions import DataTransformationException
-from utils.models import AnimalDetail, TransformedAnimal
+from config.settings import settings
+from utils import metrics
+from utils.exceptions import (
+    DataTransformationException,
+    FieldValidationException,
+)
+from utils.friends import FriendInterner
+from utils.log import SampledLogger, get_logger, truncate
+from utils.models import (
+    AnimalDetail,
+    TransformedAnimal,
+    parse_born_at,
+    parse_friends,
+    validate_name,
+)
+from utils.records import AnimalRecord
+
+logger = get_logger("transformers")
+sampled_logger = SampledLogger(logger)
+
+PACKED_FIELDS = ("id", "name", "friends", "born_at")
+FIELD_FAILURE_REASONS = {
+    "born_at": "date_parsing",
+    "friends": "friends_parsing",
+}
+
+
+def failure_reason(error: Exception) -> str:
+    field = getattr(error, "field", None)
+    if field is not None:
+        return FIELD_FAILURE_REASONS.get(field, "validation_error")
+    error_msg = str(error.__cause__ or error).lower()
+    if "born_at" in error_msg:
+        return "date_parsing"
+    if "friends" in error_msg:
+        return "friends_parsing"
+    if "validation" in error_msg:
+        return "validation_error"
+    return "unknown"
+
+
+def transform_record(
+    record: AnimalRecord, interner: Optional[FriendInterner] = None
+) -> Dict[str, Any]:
+    if record.id is None or record.id < 0:
+        raise FieldValidationException("id", f"Invalid ID: {record.id}")
+    born_at = parse_born_at(record.born_at)
+    return {
+        "id": record.id,
+        "name": validate_name(record.name),
+        "friends": (
+            interner.parse(record.friends)
+            if interner is not None
+            else parse_friends(record.friends)
+        ),
+        "born_at": born_at.isoformat() + "Z" if born_at else None,
+    }
 
 
 class AnimalDataTransformer:
@@ -10,18 +68,16 @@ class AnimalDataTransformer:
         try:
             return TransformedAnimal(**animal_detail.dict())
         except Exception as e:
-            print(f"Transform failed for animal ID {animal_detail.id}:")
-            print(f"   Name: {getattr(animal_detail, 'name', 'N/A')}")
-            print(
-                f"   Species: {getattr(animal_detail, 'species', 'N/A')}"
-            )
-            print(
-                f"   Friends: {getattr(animal_detail, 'friends', 'N/A')}"
+            sampled_logger.warning(
+                "transform_failed",
+                "Transform failed",
+                animal_id=animal_detail.id,
+                name=truncate(getattr(animal_detail, "name", None), 50),
+                born_at=truncate(
+                    getattr(animal_detail, "born_at", None), 50
+                ),
+                error=truncate(e),
             )
-            print(
-                f"   Born_at: {getattr(animal_detail, 'born_at', 'N/A')}"
-            )
-            print(f"   Error: {str(e)}")
 
             raise DataTransformationException(
                 f"Failed to transform animal {animal_detail.id}",
@@ -37,10 +93,9 @@ class AnimalDataTransformer:
     def transform_animals_batch(
         animal_details: List[AnimalDetail],
     ) -> List[TransformedAnimal]:
-        print(f"Transforming batch of {len(animal_details)} animals")
+        logger.debug("Transforming batch", batch_size=len(animal_details))
 
         transformed_animals = []
-        failed_transformations = []
         failure_reasons = {}
 
         for i, animal_detail in enumerate(animal_details):
@@ -51,45 +106,72 @@ class AnimalDataTransformer:
                 transformed_animals.append(transformed_animal)
             except DataTransformationException as e:
                 animal_id = getattr(animal_detail, "id", f"index_{i}")
-                failed_transformations.append(animal_id)
-
-                error_msg = str(e)
-                if "born_at" in error_msg.lower():
-                    failure_reasons.setdefault("date_parsing", []).append(
-                        animal_id
-                    )
-                elif "friends" in error_msg.lower():
-                    failure_reasons.setdefault(
-                        "friends_parsing", []
-                    ).append(animal_id)
-                elif "validation" in error_msg.lower():
-                    failure_reasons.setdefault(
-                        "validation_error", []
-                    ).append(animal_id)
-                else:
-                    failure_reasons.setdefault("unknown", []).append(
-                        animal_id
-                    )
 
-                print(f"Skipping animal {animal_id}: {str(e)}")
-
-        if failed_transformations:
-            print(f"Transformation Summary:")
-            print(f"   Total processed: {len(animal_details)}")
-            print(f"   Successful: {len(transformed_animals)}")
-            print(f"   Failed: {len(failed_transformations)}")
-            print(f"   Failure breakdown:")
-            for reason, ids in failure_reasons.items():
-                print(f"     {reason}: {len(ids)} animals")
-                if len(ids) <= 5:
-                    print(f"       IDs: {ids}")
-                else:
-                    print(
-                        f"       IDs: {ids[:5]} ... (and {len(ids)-5} more)"
-                    )
+                failure_reasons.setdefault(failure_reason(e), []).append(
+                    animal_id
+                )
 
+        AnimalDataTransformer.report_failures(
+            len(animal_details), len(transformed_animals), failure_reasons
+        )
         return transformed_animals
 
+    @staticmethod
+    def transform_records_batch(
+        records: List[AnimalRecord],
+        interner: Optional[FriendInterner] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.debug("Transforming batch", batch_size=len(records))
+
+        api_animals = []
+        failure_reasons: Dict[str, List[Any]] = {}
+
+        for record in records:
+            try:
+                api_animals.append(transform_record(record, interner))
+            except ValueError as e:
+                sampled_logger.warning(
+                    "transform_failed",
+                    "Transform failed",
+                    animal_id=record.id,
+                    name=truncate(record.name, 50),
+                    error=truncate(e),
+                )
+                failure_reasons.setdefault(failure_reason(e), []).append(
+                    record.id
+                )
+
+        AnimalDataTransformer.report_failures(
+            len(records), len(api_animals), failure_reasons
+        )
+        return api_animals
+
+    @staticmethod
+    def report_failures(
+        total: int,
+        successful: int,
+        failure_reasons: Dict[str, List[Any]],
+    ) -> None:
+        metrics.incr("transform.succeeded", successful)
+        for reason, ids in failure_reasons.items():
+            metrics.incr(f"transform.failures.{reason}", len(ids))
+
+        if failure_reasons:
+            logger.warning(
+                "Transformation summary",
+                total=total,
+                successful=successful,
+                failed=sum(len(ids) for ids in failure_reasons.values()),
+                failure_breakdown={
+                    reason: len(ids)
+                    for reason, ids in failure_reasons.items()
+                },
+                sample_ids={
+                    reason: ids[:5]
+                    for reason, ids in failure_reasons.items()
+                },
+            )
+
     @staticmethod
     def to_api_format(
         transformed_animals: List[TransformedAnimal],
@@ -113,12 +195,15 @@ class AnimalDataTransformer:
                 result.append(api_animal)
 
             except Exception as e:
-                print(
-                    f"Failed to convert animal {i} to API format: {str(e)}"
+                sampled_logger.warning(
+                    "api_format_failed",
+                    "Failed to convert animal to API format",
+                    index=i,
+                    animal_id=getattr(animal, "id", None),
+                    error=truncate(e),
                 )
-                print(f"   Animal data: {animal}")
 
-        print(f"Converted {len(result)} animals to API format")
+        logger.debug("Converted animals to API format", count=len(result))
         return result
 
     @staticmethod
@@ -126,3 +211,100 @@ class AnimalDataTransformer:
         transformed_animals: List[TransformedAnimal],
     ) -> List[Dict[str, Any]]:
         return AnimalDataTransformer.to_api_format(transformed_animals)
+
+
+def pack_details(
+    animal_details: List[Union[AnimalDetail, AnimalRecord]],
+) -> List[Tuple]:
+    return [
+        tuple(getattr(detail, field) for field in PACKED_FIELDS)
+        for detail in animal_details
+    ]
+
+
+def transform_packed(
+    rows: List[Tuple],
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[Any]]]:
+    api_animals = []
+    failure_reasons: Dict[str, List[Any]] = {}
+
+    for row in rows:
+        try:
+            api_animals.append(transform_record(AnimalRecord(*row)))
+        except ValueError as e:
+            failure_reasons.setdefault(failure_reason(e), []).append(
+                row[0]
+            )
+
+    return api_animals, failure_reasons
+
+
+class ProcessPoolTransformer:
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        self.processes = (
+            processes
+            or settings.TRANSFORM_PROCESSES
+            or os.cpu_count()
+            or 1
+        )
+        self.chunk_size = chunk_size or settings.TRANSFORM_CHUNK_SIZE
+        self.max_pending = self.processes * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ProcessPoolTransformer":
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=get_context("spawn")
+        )
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _submit_chunk(self, rows: List[Tuple]) -> Future:
+        if self._executor is not None:
+            try:
+                return self._executor.submit(transform_packed, rows)
+            except (AssertionError, OSError, RuntimeError) as e:
+                logger.warning(
+                    "Process pool unavailable, transforming inline",
+                    error=truncate(e),
+                )
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+        future: Future = Future()
+        future.set_result(transform_packed(rows))
+        return future
+
+    def submit(
+        self, animal_details: List[Union[AnimalDetail, AnimalRecord]]
+    ) -> List[Future]:
+        rows = pack_details(animal_details)
+        return [
+            self._submit_chunk(rows[i : i + self.chunk_size])
+            for i in range(0, len(rows), self.chunk_size)
+        ]
+
+    @staticmethod
+    def result(futures: List[Future]) -> List[Dict[str, Any]]:
+        api_animals: List[Dict[str, Any]] = []
+        failure_reasons: Dict[str, List[Any]] = {}
+        total = 0
+
+        for future in futures:
+            chunk_animals, chunk_failures = future.result()
+            api_animals.extend(chunk_animals)
+            for reason, ids in chunk_failures.items():
+                failure_reasons.setdefault(reason, []).extend(ids)
+                total += len(ids)
+
+        AnimalDataTransformer.report_failures(
+            total + len(api_animals), len(api_animals), failure_reasons
+        )
+        return api_animals
@@ -0,0 +1,230 @@
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+CLAIM_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+for _, batch_id in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], batch_id)
+    local attempts = tonumber(redis.call('HGET', KEYS[3], batch_id) or '0')
+    if attempts >= tonumber(ARGV[3]) then
+        redis.call('SADD', KEYS[6], batch_id)
+        redis.call('HSET', KEYS[7], batch_id, ARGV[4])
+    else
+        redis.call('RPUSH', KEYS[1], batch_id)
+        redis.call('HINCRBY', KEYS[5], 'requeued', 1)
+    end
+end
+local batch_id = redis.call('LPOP', KEYS[1])
+if not batch_id then
+    return nil
+end
+redis.call('ZADD', KEYS[2], tonumber(ARGV[1]) + tonumber(ARGV[2]), batch_id)
+local attempts = redis.call('HINCRBY', KEYS[3], batch_id, 1)
+return {batch_id, redis.call('HGET', KEYS[4], batch_id), attempts}
+"""
+
+EXTEND_SCRIPT = """
+if redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+    return 1
+end
+return 0
+"""
+
+ACK_SCRIPT = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+if redis.call('SADD', KEYS[2], ARGV[1]) == 1 then
+    redis.call('HDEL', KEYS[3], ARGV[1])
+    return 1
+end
+return 0
+"""
+
+NACK_SCRIPT = """
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 0 then
+    return -1
+end
+local attempts = tonumber(redis.call('HGET', KEYS[3], ARGV[1]) or '0')
+if attempts >= tonumber(ARGV[2]) then
+    redis.call('SADD', KEYS[4], ARGV[1])
+    redis.call('HSET', KEYS[5], ARGV[1], ARGV[3])
+    return 0
+end
+redis.call('RPUSH', KEYS[2], ARGV[1])
+return 1
+"""
+
+LEASE_EXPIRED = "lease expired"
+
+
+def queue_name(run_id: str) -> str:
+    return f"animal_etl:queue:{run_id}"
+
+
+class RedisWorkQueue:
+    def __init__(
+        self,
+        client: Any,
+        name: str,
+        visibility_timeout: float = 300.0,
+        max_attempts: int = 3,
+        ttl: int = 2 * 24 * 3600,
+    ):
+        self.client = client
+        self.name = name
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.ttl = ttl
+        self._claim = client.register_script(CLAIM_SCRIPT)
+        self._extend = client.register_script(EXTEND_SCRIPT)
+        self._ack = client.register_script(ACK_SCRIPT)
+        self._nack = client.register_script(NACK_SCRIPT)
+
+    def _key(self, suffix: str) -> str:
+        return f"{self.name}:{suffix}"
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        return tuple(
+            self._key(suffix)
+            for suffix in (
+                "pending",
+                "leases",
+                "attempts",
+                "batches",
+                "stats",
+                "done",
+                "failed",
+                "errors",
+            )
+        )
+
+    def enqueue(
+        self, batches: Iterable[Any], chunk_size: int = 500
+    ) -> int:
+        count = 0
+        pipe = self.client.pipeline(transaction=False)
+        for payload in batches:
+            batch_id = str(count)
+            pipe.hset(
+                self._key("batches"),
+                batch_id,
+                json.dumps(payload, separators=(",", ":")),
+            )
+            pipe.rpush(self._key("pending"), batch_id)
+            count += 1
+            if count % chunk_size == 0:
+                pipe.execute()
+        pipe.hset(self._key("stats"), "total", count)
+        for key in self.keys:
+            pipe.expire(key, self.ttl)
+        pipe.execute()
+        return count
+
+    def claim(
+        self, now: Optional[float] = None
+    ) -> Optional[Tuple[str, Any, int]]:
+        now = time.time() if now is None else now
+        result = self._claim(
+            keys=[
+                self._key("pending"),
+                self._key("leases"),
+                self._key("attempts"),
+                self._key("batches"),
+                self._key("stats"),
+                self._key("failed"),
+                self._key("errors"),
+            ],
+            args=[
+                now,
+                self.visibility_timeout,
+                self.max_attempts,
+                LEASE_EXPIRED,
+            ],
+        )
+        if result is None:
+            return None
+        batch_id, payload, attempts = result
+        if payload is None:
+            self.ack(batch_id)
+            return self.claim(now)
+        return _text(batch_id), json.loads(payload), int(attempts)
+
+    def extend(self, batch_id: str, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return bool(
+            self._extend(
+                keys=[self._key("leases")],
+                args=[batch_id, now + self.visibility_timeout],
+            )
+        )
+
+    def ack(self, batch_id: str) -> bool:
+        return bool(
+            self._ack(
+                keys=[
+                    self._key("leases"),
+                    self._key("done"),
+                    self._key("batches"),
+                ],
+                args=[batch_id],
+            )
+        )
+
+    def nack(self, batch_id: str, error: str = "") -> Optional[bool]:
+        result = self._nack(
+            keys=[
+                self._key("leases"),
+                self._key("pending"),
+                self._key("attempts"),
+                self._key("failed"),
+                self._key("errors"),
+            ],
+            args=[batch_id, self.max_attempts, error[:1000]],
+        )
+        return None if result == -1 else bool(result)
+
+    def drained(self) -> bool:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.llen(self._key("pending"))
+        pipe.zcard(self._key("leases"))
+        pending, leased = pipe.execute()
+        return pending == 0 and leased == 0
+
+    def stats(self) -> Dict[str, int]:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hgetall(self._key("stats"))
+        pipe.llen(self._key("pending"))
+        pipe.zcard(self._key("leases"))
+        pipe.scard(self._key("done"))
+        pipe.scard(self._key("failed"))
+        counters, pending, leased, done, failed = pipe.execute()
+        counters = {_text(k): int(v) for k, v in counters.items()}
+        return {
+            "total": counters.get("total", 0),
+            "pending": pending,
+            "leased": leased,
+            "done": done,
+            "failed": failed,
+            "requeued": counters.get("requeued", 0),
+        }
+
+    def failed_errors(self) -> Dict[str, str]:
+        return {
+            _text(k): _text(v)
+            for k, v in self.client.hgetall(self._key("errors")).items()
+        }
+
+    def failed_batches(self) -> Iterator[Tuple[str, Any, str]]:
+        for batch_id, error in self.failed_errors().items():
+            payload = self.client.hget(self._key("batches"), batch_id)
+            if payload is not None:
+                yield batch_id, json.loads(payload), error
+
+    def delete(self) -> None:
+        self.client.delete(*self.keys)
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value